@@ -0,0 +1,59 @@
+"""Benchmark: row-by-row against vectorized (pandas / pyarrow) CSV streaming.
+
+Run with ``python benchmarks/csv_engine_benchmark.py [rows]``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+import knowledgeimporter.converters.vectorized as vectorized
+from knowledgeimporter.converters.base import ConversionOptions
+from knowledgeimporter.converters.csv_converter import CsvConverter
+
+
+def _write_csv(path: str, rows: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Artikelnummer,Bezeichnung,Preis,Bestand,Lagerort,Warengruppe,Status,Bemerkung\n")
+        for i in range(rows):
+            note = "" if i % 3 else "Restposten"
+            f.write(f"A-{i:07d},Artikel {i},{i * 1.5:.2f},{i % 500},R{i % 40},Technik,aktiv,{note}\n")
+
+
+def _run(path: str, engine: str) -> tuple[float, bytes]:
+    out_path = path + f".{engine}.md"
+    t0 = time.perf_counter()
+    CsvConverter(ConversionOptions(tabular_engine=engine)).run_to_file(path, out_path)
+    duration = time.perf_counter() - t0
+    with open(out_path, "rb") as f:
+        body = f.read().split(b"---", 2)[2]
+    return duration, body
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rows.csv")
+        _write_csv(path, rows)
+        print(f"{rows} rows, {os.path.getsize(path) / 2**20:.1f} MiB")
+
+        base_time, expected = _run(path, "python")
+        print(f"{'row by row':<22} {base_time:6.2f} s  {rows / base_time:10.0f} rows/s")
+        variants = [("vectorized (pyarrow)", True), ("vectorized (pandas)", False)]
+        saved = vectorized.pa_csv
+        for name, use_pyarrow in variants:
+            if use_pyarrow and saved is None:
+                print(f"{name:<22} pyarrow not installed")
+                continue
+            vectorized.pa_csv = saved if use_pyarrow else None
+            duration, body = _run(path, "vectorized")
+            same = "identical" if body == expected else "DIFFERENT OUTPUT"
+            print(f"{name:<22} {duration:6.2f} s  {rows / duration:10.0f} rows/s  x{base_time / duration:.2f}  {same}")
+        vectorized.pa_csv = saved
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark: sequential walk with per-pattern fnmatch against the parallel streaming FileScan.
+
+A fixed delay per directory listing simulates a network share (SMB/NFS).
+Run with ``python benchmarks/discovery_benchmark.py [dirs] [latency_ms]``.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import knowledgeimporter.services.discovery as discovery
+
+PATTERNS = ["*.md", "*.pdf", "*.docx", "*.html", "*.htm", "*.odt", "*.csv", "*.json", "*.xml", "*.xlsx"]
+
+
+def _make_tree(root: Path, dirs: int, files_per_dir: int) -> None:
+    for d in range(dirs):
+        sub = root / f"bereich{d % 10}" / f"ordner{d:04d}"
+        sub.mkdir(parents=True)
+        for f in range(files_per_dir):
+            (sub / f"datei{f:03d}{'.md' if f % 2 else '.png'}").write_bytes(b"")
+
+
+def _slow_scandir(latency: float):
+    real = os.scandir
+
+    def scandir(path):
+        time.sleep(latency)
+        return real(path)
+
+    return scandir
+
+
+def sequential(root: Path) -> tuple[float, int]:
+    """Sorted listing per directory and fnmatch once per pattern per file, like the old collect_files."""
+    first = None
+    t0 = time.perf_counter()
+    count = 0
+    for _dirpath, _dirnames, filenames in os.walk(root):
+        for name in sorted(filenames):
+            if any(fnmatch.fnmatch(name, p) for p in PATTERNS):
+                count += 1
+                first = first or time.perf_counter() - t0
+    return first or 0.0, count
+
+
+def scan(root: Path) -> tuple[float, int]:
+    first = None
+    t0 = time.perf_counter()
+    count = 0
+    for _ in discovery.FileScan(root, PATTERNS, recursive=True):
+        count += 1
+        first = first or time.perf_counter() - t0
+    return first or 0.0, count
+
+
+def main() -> None:
+    dirs = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 5.0) / 1000
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_tree(root, dirs, 20)
+        # Both variants list directories through os.scandir (os.walk included)
+        os.scandir = _slow_scandir(latency)
+        print(f"{dirs} directories, {latency * 1000:.0f} ms per listing")
+        for name, fn in (("sequential", sequential), ("FileScan", scan)):
+            t0 = time.perf_counter()
+            first, count = fn(root)
+            print(
+                f"{name:<11} {count:6d} files  first match {first * 1000:7.1f} ms  total {time.perf_counter() - t0:6.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
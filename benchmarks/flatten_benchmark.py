@@ -0,0 +1,93 @@
+"""Benchmark: iterative flatten() against the former recursive _flatten().
+
+Run with ``python benchmarks/flatten_benchmark.py``.
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from knowledgeimporter.converters.flatten import flatten
+
+
+def recursive_flatten(data: Any, prefix: str = "") -> list[tuple[str, str]]:
+    """The recursive implementation flatten() replaced (json_converter._flatten)."""
+    items: list[tuple[str, str]] = []
+    if isinstance(data, dict):
+        for k, v in data.items():
+            key = f"{prefix}.{k}" if prefix else k
+            items.extend(recursive_flatten(v, key))
+    elif isinstance(data, list):
+        for i, v in enumerate(data):
+            items.extend(recursive_flatten(v, f"{prefix}[{i}]" if prefix else f"[{i}]"))
+    else:
+        value = "" if data is None else str(data)
+        items.append((prefix, value))
+    return items
+
+
+def _records(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "name": f"Artikel {i}",
+            "preis": {"netto": i * 1.5, "brutto": i * 1.785, "waehrung": "EUR"},
+            "lager": {"ort": {"halle": "2", "regal": f"R{i % 40}"}, "bestand": i % 17},
+            "tags": ["a", "b", "c"],
+        }
+        for i in range(n)
+    ]
+
+
+def _deep(depth: int) -> dict[str, Any]:
+    data: dict[str, Any] = {"wert": 1}
+    for level in range(depth):
+        data = {f"ebene{level % 3}": data, "x": level}
+    return data
+
+
+def _per_record(fn: Callable[[Any], list[tuple[str, str]]]) -> Callable[[Any], list[list[tuple[str, str]]]]:
+    # Converters flatten each array element separately
+    return lambda records: [fn(r) for r in records]
+
+
+def _retained_kib(fn: Callable[[Any], Any], data: Any) -> float:
+    tracemalloc.start()
+    result = fn(data)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size / 1024
+
+
+def _bench(name: str, data: Any, number: int, old_fn: Callable[[Any], Any], new_fn: Callable[[Any], Any]) -> None:
+    assert new_fn(data) == old_fn(data)
+    old = min(timeit.repeat(lambda: old_fn(data), number=number, repeat=5))
+    new = min(timeit.repeat(lambda: new_fn(data), number=number, repeat=5))
+    print(
+        f"{name:<22} recursive {old * 1000 / number:9.3f} ms   iterative {new * 1000 / number:9.3f} ms   x{old / new:.2f}"
+    )
+    old_mem = _retained_kib(old_fn, data)
+    new_mem = _retained_kib(new_fn, data)
+    print(f"{'':<22} retained  {old_mem:9.0f} KiB  retained  {new_mem:9.0f} KiB")
+
+
+def main() -> None:
+    records = _records(10_000)
+    _bench("10k records", records, 3, _per_record(recursive_flatten), _per_record(flatten))
+    _bench("depth 200", _deep(200), 200, recursive_flatten, flatten)
+    _bench("depth 800", _deep(800), 20, recursive_flatten, flatten)
+    deep = _deep(5000)
+    try:
+        recursive_flatten(deep)
+        print(f"{'depth 5000':<22} recursive ok")
+    except RecursionError:
+        print(f"{'depth 5000':<22} recursive RecursionError")
+    print(f"{'depth 5000':<22} iterative {len(flatten(deep))} pairs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark: import time of the app and time to the first frame, against a budget.
+
+The first frame is measured on a stand-in page with a keyring that takes
+``keyring_ms`` per lookup, as some OS backends do. Exits non-zero when a
+budget is exceeded, so it can guard against startup regressions.
+Run with ``python benchmarks/startup_benchmark.py [keyring_ms]``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+IMPORT_BUDGET_MS = 700.0
+FIRST_FRAME_BUDGET_MS = 150.0
+
+_IMPORT_SNIPPET = "import time; t0 = time.perf_counter(); import knowledgeimporter.app; print(time.perf_counter() - t0)"
+
+
+def import_time(runs: int = 5) -> float:
+    """Median import time of the app module in a fresh interpreter."""
+    times = [
+        float(
+            subprocess.run([sys.executable, "-c", _IMPORT_SNIPPET], check=True, capture_output=True, text=True).stdout
+        )
+        for _ in range(runs)
+    ]
+    return statistics.median(times)
+
+
+def first_frame(tmp: Path, keyring_latency: float) -> tuple[float, float]:
+    """Seconds until the first page.add and until the secrets are decrypted."""
+    from eq_chatbot_core.security.encryption import FernetEncryption
+
+    import knowledgeimporter.utils.storage as storage
+    from knowledgeimporter.app import KnowledgeImporterApp
+    from knowledgeimporter.models.config import AppConfig
+
+    key = FernetEncryption.generate_key()
+    storage.CONFIG_DIR = tmp
+    storage.CONFIG_FILE = tmp / "config.json"
+    storage.get_or_create_master_key = lambda: key
+    source = tmp / "quelle"
+    source.mkdir()
+    (source / "a.md").write_text("# A", encoding="utf-8")
+    storage.save_config(AppConfig(langdock_api_key="sk-test", default_folder_id="f-1", last_source_dir=str(source)))
+
+    def slow_key() -> str:
+        time.sleep(keyring_latency)
+        return key
+
+    storage.get_or_create_master_key = slow_key
+
+    page = MagicMock()
+    page.window.center = AsyncMock()
+    frame = {}
+    page.add.side_effect = lambda *_: frame.setdefault("t", time.perf_counter())
+
+    app = KnowledgeImporterApp(page)
+    t0 = time.perf_counter()
+    asyncio.run(app.initialize())
+    app._secrets_worker._thread.join()
+    return frame["t"] - t0, time.perf_counter() - t0
+
+
+def main() -> None:
+    keyring_latency = (float(sys.argv[1]) if len(sys.argv) > 1 else 500.0) / 1000
+    imported = import_time()
+    with tempfile.TemporaryDirectory() as tmp:
+        frame, secrets = first_frame(Path(tmp), keyring_latency)
+
+    over = False
+    for name, seconds, budget in (
+        ("import", imported, IMPORT_BUDGET_MS),
+        ("first frame", frame, FIRST_FRAME_BUDGET_MS),
+    ):
+        ok = seconds * 1000 <= budget
+        over = over or not ok
+        print(f"{name:<12} {seconds * 1000:8.1f} ms  budget {budget:6.0f} ms  {'ok' if ok else 'OVER BUDGET'}")
+    print(f"{'secrets':<12} {secrets * 1000:8.1f} ms  (background, keyring {keyring_latency * 1000:.0f} ms)")
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark: memory of CSV extraction with compact rows against per-row Section objects.
+
+Each variant runs in a fresh subprocess so that peak RSS is not shared.
+Run with ``python benchmarks/tabular_benchmark.py [rows]``.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from knowledgeimporter.converters.base import Section
+from knowledgeimporter.converters.csv_converter import CsvConverter
+from knowledgeimporter.converters.encoding import read_text
+
+
+def legacy_extract(path: str) -> list[Section]:
+    """The per-row Section construction CsvConverter.extract used before."""
+    lines = list(csv.DictReader(read_text(path).splitlines()))
+    headers = list(lines[0].keys())
+    sections = []
+    for idx, row in enumerate(lines, start=2):
+        first_val = row.get(headers[0], "") if headers else ""
+        title = f"Zeile {idx}: {first_val}" if first_val else f"Zeile {idx}"
+        kv = [(k, str(v)) for k, v in row.items() if v is not None and str(v).strip()]
+        sections.append(Section(level=2, title=title, kv_pairs=kv))
+    return sections
+
+
+def _write_csv(path: str, rows: int) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Artikelnummer", "Bezeichnung", "Preis", "Bestand", "Lagerort", "Warengruppe", "Status"])
+        for i in range(rows):
+            writer.writerow([f"A-{i:07d}", f"Artikel {i}", f"{i * 1.5:.2f}", i % 500, f"R{i % 40}", "Technik", "aktiv"])
+
+
+def _measure(variant: str, path: str) -> None:
+    extract = legacy_extract if variant == "section" else lambda p: CsvConverter().extract(p).sections
+    # Peak RSS and time without tracing overhead
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    sections = extract(path)
+    duration = time.perf_counter() - t0
+    rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+    count = len(sections)
+    del sections
+
+    tracemalloc.start()
+    sections = extract(path)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sections
+    print(
+        f"{variant:<8} {count:>8} rows  {duration:6.2f} s  "
+        f"peak RSS +{rss_kib / 1024:6.1f} MiB  retained {retained / 2**20:6.1f} MiB"
+    )
+
+
+def main() -> None:
+    if len(sys.argv) == 3:
+        _measure(sys.argv[1], sys.argv[2])
+        return
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rows.csv")
+        _write_csv(path, rows)
+        print(f"source {os.path.getsize(path) / 2**20:.1f} MiB")
+        for variant in ("section", "row"):
+            subprocess.run([sys.executable, __file__, variant, path], check=True)
+
+
+if __name__ == "__main__":
+    main()
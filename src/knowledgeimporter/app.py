@@ -1,15 +1,21 @@
 """Main application class with navigation between views."""
 
+import asyncio
 import logging
+from typing import TYPE_CHECKING
 
 import flet as ft
 
 from knowledgeimporter._version import __version__
 from knowledgeimporter.models.config import AppConfig
-from knowledgeimporter.utils.storage import load_config, save_config
-from knowledgeimporter.views.settings_view import SettingsView
+from knowledgeimporter.utils.metrics import MetricsServer, serve
+from knowledgeimporter.utils.storage import ConfigWriter, load_config, save_config
+from knowledgeimporter.utils.worker import BackgroundWorker
 from knowledgeimporter.views.upload_view import UploadView
 
+if TYPE_CHECKING:
+    from knowledgeimporter.views.settings_view import SettingsView
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,12 +27,27 @@ class KnowledgeImporterApp:
         self.config = AppConfig()
         self._upload_view: UploadView | None = None
         self._settings_view: SettingsView | None = None
+        self._metrics_server: MetricsServer | None = None
+        self._secrets_worker = BackgroundWorker()
+        self._secrets_ready = asyncio.Event()
+        self._save_pending = False
+        # Until the secrets are loaded, saves keep the encrypted values on disk
+        self._secrets_loaded = False
+        self._config_writer = ConfigWriter(save=self._save_config)
 
     async def initialize(self) -> None:
-        """Set up the page, load config, and build UI."""
+        """Set up the page, load config, and build UI.
+
+        The first frame needs neither the OS keyring nor the disk scans of the
+        upload view: secrets are decrypted and the view's startup work runs in
+        the background once the UI is on screen.
+        """
         await self._configure_page()
         self._load_config()
+        self._start_metrics_server()
         self._build_ui()
+        self._load_secrets()
+        self._upload_view.start_deferred()
 
     async def _configure_page(self) -> None:
         self.page.title = f"KnowledgeImporter v{__version__}"
@@ -41,23 +62,61 @@ class KnowledgeImporterApp:
 
     def _load_config(self) -> None:
         try:
-            self.config = load_config()
+            self.config = load_config(decrypt=False)
             logger.info("Config loaded successfully")
         except Exception as e:
             logger.warning("Failed to load config, using defaults: %s", e)
             self.config = AppConfig()
 
+    def _load_secrets(self) -> None:
+        """Decrypt API key and folder ID in the background (keyring backends can take seconds)."""
+
+        def on_complete(loaded: AppConfig) -> None:
+            async def _apply():
+                # Same object as the views hold, so update it in place
+                self.config.langdock_api_key = loaded.langdock_api_key
+                self.config.default_folder_id = loaded.default_folder_id
+                self._secrets_loaded = True
+                self._release_pending_save()
+                if self._upload_view:
+                    self._upload_view.refresh_folder_display()
+                    self.page.update()
+
+            self.page.run_task(_apply)
+
+        def on_error(e: Exception) -> None:
+            async def _apply():
+                logger.warning("Could not load API key and folder ID; keeping the stored values: %s", e)
+                self._release_pending_save()
+
+            self.page.run_task(_apply)
+
+        self._secrets_worker.run(fn=load_config, on_complete=on_complete, on_error=on_error)
+
+    def _release_pending_save(self) -> None:
+        """Open saving once the secrets are loaded (or failed to load) and save what was postponed."""
+        self._secrets_ready.set()
+        if self._save_pending:
+            self._save_pending = False
+            self._on_config_changed(self.config)
+
+    def _save_config(self, config: AppConfig) -> None:
+        save_config(config, keep_secrets=not self._secrets_loaded)
+
+    def _start_metrics_server(self) -> None:
+        if not self.config.metrics_port:
+            return
+        try:
+            self._metrics_server = serve(self.config.metrics_port)
+        except OSError as e:
+            logger.warning("Could not start metrics endpoint on port %d: %s", self.config.metrics_port, e)
+
     def _build_ui(self) -> None:
         self._upload_view = UploadView(
             config=self.config,
             page=self.page,
             on_config_changed=self._on_config_changed,
         )
-        self._settings_view = SettingsView(
-            config=self.config,
-            page=self.page,
-            on_config_saved=self._on_config_saved,
-        )
 
         self._content_area = ft.Container(
             content=self._upload_view.build(),
@@ -83,19 +142,33 @@ class KnowledgeImporterApp:
 
         self.page.add(self._content_area)
 
-    def _on_nav_change(self, e: ft.ControlEvent) -> None:
+    async def _on_nav_change(self, e: ft.ControlEvent) -> None:
         idx = e.control.selected_index
         if idx == 0:
             self._content_area.content = self._upload_view.build()
         elif idx == 1:
+            if self._settings_view is None:
+                # Built on first visit, once the secrets it shows are decrypted
+                await self._secrets_ready.wait()
+                from knowledgeimporter.views.settings_view import SettingsView
+
+                self._settings_view = SettingsView(
+                    config=self.config,
+                    page=self.page,
+                    on_config_saved=self._on_config_saved,
+                )
             self._content_area.content = self._settings_view.build()
         self._content_area.update()
 
     def _on_config_saved(self, config: AppConfig) -> None:
         """Called when settings are saved."""
         self.config = config
+        # Values entered in Settings replace the stored ones, even if those could not be loaded
+        self._secrets_loaded = True
         try:
-            save_config(config)
+            # Supersedes a pending auto-save; written at once so failures can be shown
+            self._config_writer.schedule(config)
+            self._config_writer.flush()
             self.page.show_dialog(ft.SnackBar(content=ft.Text("Settings saved")))
         except Exception as e:
             logger.error("Failed to save config: %s", e)
@@ -109,7 +182,9 @@ class KnowledgeImporterApp:
     def _on_config_changed(self, config: AppConfig) -> None:
         """Called when config changes from upload view (e.g. last_source_dir)."""
         self.config = config
-        try:
-            save_config(config)
-        except Exception as e:
-            logger.warning("Failed to auto-save config: %s", e)
+        if not self._secrets_ready.is_set():
+            # Saving now would write the still-empty secrets; save once they are loaded
+            self._save_pending = True
+            return
+        # Picking folders in a row is written once
+        self._config_writer.schedule(config)
@@ -1,10 +1,11 @@
 """Universal document converter package."""
 
-from .base import BaseConverter, ConversionResult, RawDocument, Section, ValidationResult
+from .base import BaseConverter, ConversionOptions, ConversionResult, RawDocument, Section, ValidationResult
 from .universal_converter import UniversalConverter, UnsupportedFormatError
 
 __all__ = [
     "BaseConverter",
+    "ConversionOptions",
     "ConversionResult",
     "RawDocument",
     "Section",
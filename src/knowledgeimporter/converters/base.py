@@ -2,23 +2,42 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
+import math
+import os
+import random
+import re
+import shutil
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import yaml
 
+from knowledgeimporter.utils.metrics import CACHE_REQUESTS
+from knowledgeimporter.utils.tracing import span
 
-@dataclass
+from .encoding import redetect_encoding
+from .tabular import RowSection
+
+
+@dataclass(slots=True)
 class Section:
-    """A structural section of a document with key-value pairs."""
+    """A structural section of a document with key-value pairs.
+
+    Streaming converters may pass an iterator as kv_pairs; it is consumed
+    once when the section is rendered.
+    """
 
     level: int
     title: str
-    kv_pairs: list[tuple[str, str]]
+    kv_pairs: list[tuple[str, str]] | Iterator[tuple[str, str]]
     free_text: str | None = None
 
 
@@ -31,7 +50,7 @@ class RawDocument:
     title: str
     language: str
     date: str | None
-    sections: list[Section]
+    sections: list[Section | RowSection]
     metadata: dict[str, Any]
     raw_text: str
 
@@ -45,6 +64,8 @@ class ValidationResult:
     issues: list[str]
     ai_used: bool
     corrected_markdown: str | None
+    sample_size: int | None = None  # key tokens checked, set in sampled mode
+    confidence_interval: tuple[float, float] | None = None  # 95 % bounds of coverage_score in sampled mode
 
 
 @dataclass
@@ -56,75 +77,370 @@ class ConversionResult:
     validation: ValidationResult
     duration_seconds: float = 0.0
     ai_calls: int = 0
+    output_path: str | None = None
+
+
+@dataclass
+class ConversionOptions:
+    """Tuning options handed from the pipeline to every converter."""
+
+    sheet_workers: int = 1  # XLSX: sheets rendered in parallel processes when > 1
+    flatten_max_depth: int | None = None  # JSON/YAML: deeper containers are kept as one JSON value
+    validation: str = "full"  # "full" or "sampled"
+    validation_sample_rate: float = 0.05  # share of sections/source windows checked in sampled mode
+    max_part_bytes: int | None = None  # split converted output into parts below this size
+    max_part_sections: int | None = None  # ... and/or with at most this many sections per part
+    tabular_engine: str = "auto"  # CSV: "python", "vectorized" (pandas/pyarrow) or "auto" (vectorized for large files)
+    deterministic: bool = False  # no conversion time in the frontmatter; a content fingerprint instead
 
 
 CONVERTER_VERSION = "1.0.0"
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def source_fingerprint(path: str, options: ConversionOptions | None = None) -> str:
+    """``sha256:<hex>`` of the source bytes, the converter version and the options shaping the output.
+
+    Cached per path, size and modification time, so a batch hashes each file once.
+    """
+    opts = options or ConversionOptions()
+    st = os.stat(path)
+    # Validation and tabular engine do not change the Markdown; splitting changes the uploaded parts
+    option_key = f"{opts.flatten_max_depth}|{opts.max_part_bytes}|{opts.max_part_sections}"
+    misses = _fingerprint.cache_info().misses
+    fingerprint = _fingerprint(os.path.abspath(path), st.st_size, st.st_mtime_ns, option_key)
+    # Approximate under concurrent calls; enough for a hit ratio
+    hit = _fingerprint.cache_info().misses == misses
+    CACHE_REQUESTS.inc(cache="fingerprint", result="hit" if hit else "miss")
+    return fingerprint
+
+
+@lru_cache(maxsize=256)
+def _fingerprint(path: str, size: int, mtime_ns: int, option_key: str) -> str:
+    h = hashlib.sha256(f"{CONVERTER_VERSION}|{option_key}\n".encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return "sha256:" + h.hexdigest()
 
 
 def build_frontmatter(doc: RawDocument) -> str:
-    """Build YAML frontmatter according to LangDock schema."""
+    """Build YAML frontmatter according to LangDock schema.
+
+    With a ``fingerprint`` in doc.metadata (deterministic mode) the conversion
+    time is replaced by converter version and fingerprint, so the same source
+    always yields byte-identical Markdown.
+    """
+    fingerprint = doc.metadata.get("fingerprint")
     meta = {
         "quelle": doc.source_type,
         "titel": doc.title,
         "sprache": doc.language,
         "stand": doc.date or "",
-        "konvertiert": datetime.now().isoformat(timespec="seconds"),
-        "quelldatei": Path(doc.source_path).name,
     }
+    if fingerprint:
+        meta["konverter"] = CONVERTER_VERSION
+    else:
+        meta["konvertiert"] = datetime.now().isoformat(timespec="seconds")
+    meta["quelldatei"] = Path(doc.source_path).name
+    if fingerprint:
+        meta["fingerprint"] = fingerprint
     return "---\n" + yaml.dump(meta, allow_unicode=True, sort_keys=False) + "---"
 
 
-def sections_to_markdown(sections: list[Section]) -> str:
-    """Convert sections into chunking-safe Markdown."""
-    lines: list[str] = []
-    for section in sections:
-        heading = "#" * section.level + " " + section.title
-        lines.append(heading)
+def markdown_header(doc: RawDocument) -> str:
+    """Return frontmatter and document title that precede the sections."""
+    return "\n".join([build_frontmatter(doc), "", f"# {doc.title}", "", ""])
+
+
+def section_to_markdown(section: Section | RowSection) -> str:
+    """Convert a single section into chunking-safe Markdown."""
+    lines = ["#" * section.level + " " + section.title, ""]
+    header = len(lines)
+    # computed on access for RowSection, possibly a lazy iterator for Section
+    for key, value in section.kv_pairs:
+        lines.append(f"- **{key}:** {value}")
+    if len(lines) > header:
+        lines.append("")
+    if section.free_text:
+        lines.append(section.free_text)
         lines.append("")
-        if section.kv_pairs:
-            for key, value in section.kv_pairs:
-                lines.append(f"- **{key}:** {value}")
-            lines.append("")
-        if section.free_text:
-            lines.append(section.free_text)
-            lines.append("")
     return "\n".join(lines)
 
 
+def sections_to_markdown(sections: list[Section | RowSection]) -> str:
+    """Convert sections into chunking-safe Markdown."""
+    return "\n".join(section_to_markdown(section) for section in sections)
+
+
+# Token characters: everything except whitespace and the structural punctuation of
+# CSV/JSON/XML/YAML sources and of the generated Markdown (``**key:**``, ``# ``, ``[0]``).
+# Single characters are never checked, so the pattern skips them right away.
+_TOKEN = re.compile(r"[^\s,;:\"'*#\[\]{}()<>=|/\\`]{2,}")
+# Window size for sampling raw text in sampled mode (in-memory validation)
+_SAMPLE_WINDOW_CHARS = 4096
+_Z_95 = 1.96
+_SPACE = re.compile(r"\s")
+_COPY_CHARS = 64 * 1024
+
+
+def _key_tokens(text: str) -> set[str]:
+    """Return the tokens of a source text that must reappear in the Markdown."""
+    return {w for w in set(_TOKEN.findall(text)) if len(w) <= 20 or w.isdigit()}
+
+
+def _markdown_index(markdown: str) -> set[str]:
+    """Token index of the generated Markdown; one linear pass."""
+    return set(_TOKEN.findall(markdown))
+
+
+def _wilson_interval(found: int, total: int) -> tuple[float, float]:
+    """95 % Wilson score interval for found/total."""
+    p = found / total
+    denom = 1 + _Z_95**2 / total
+    center = (p + _Z_95**2 / (2 * total)) / denom
+    half = _Z_95 * math.sqrt(p * (1 - p) / total + _Z_95**2 / (4 * total**2)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def _coverage_result(found: int, total: int, sampled: bool = False) -> ValidationResult:
+    score = found / total if total else 1.0
+    status = "ok" if score >= 0.95 else "warning"
+    issues = [] if score >= 0.95 else [f"Coverage nur {score:.0%} – manuell prüfen"]
+    result = ValidationResult(
+        status=status, coverage_score=score, issues=issues, ai_used=False, corrected_markdown=None
+    )
+    if sampled:
+        result.sample_size = total
+        if total:
+            # Tokens are treated as independent draws, which slightly narrows the interval
+            result.confidence_interval = _wilson_interval(found, total)
+    return result
+
+
+class CoverageAccumulator:
+    """Incremental coverage validation for streaming conversions.
+
+    Each source chunk is checked against the Markdown rendered from it, so
+    neither the full source text nor the full Markdown has to be retained.
+    With ``sample_rate < 1`` only a random share of the chunks is checked.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, seed: int = 0) -> None:
+        self.total = 0
+        self.found = 0
+        self.sample_rate = sample_rate
+        self._rng = random.Random(seed)
+
+    @property
+    def sampled(self) -> bool:
+        return self.sample_rate < 1.0
+
+    def add(self, raw_text: str, markdown: str) -> None:
+        if self.sampled and self._rng.random() >= self.sample_rate:
+            return
+        tokens = _key_tokens(raw_text)
+        self.total += len(tokens)
+        self.found += len(tokens & _markdown_index(markdown))
+
+    def add_many(self, raw_texts: Iterable[str], markdown: str) -> None:
+        """Check several source chunks against the Markdown rendered from all of them.
+
+        Each chunk is counted (and sampled) like a separate :meth:`add`, but
+        the Markdown is indexed once.
+        """
+        index: set[str] | None = None
+        for raw_text in raw_texts:
+            if self.sampled and self._rng.random() >= self.sample_rate:
+                continue
+            if index is None:
+                index = _markdown_index(markdown)
+            tokens = _key_tokens(raw_text)
+            self.total += len(tokens)
+            self.found += len(tokens & index)
+
+    def merge(self, other: CoverageAccumulator) -> None:
+        self.total += other.total
+        self.found += other.found
+
+    def result(self) -> ValidationResult:
+        return _coverage_result(self.found, self.total, self.sampled)
+
+
+class MarkdownWriter:
+    """Renders frontmatter, headings and key-value lines straight to a text stream.
+
+    Coverage is validated section by section as it is written, so neither the
+    source text nor the full Markdown has to be retained. Produces the same
+    output as :func:`markdown_header` followed by :func:`sections_to_markdown`.
+    """
+
+    def __init__(self, out: TextIO, coverage: CoverageAccumulator | None = None) -> None:
+        self.out = out
+        self.coverage = coverage if coverage is not None else CoverageAccumulator()
+        self._empty = True
+
+    def write_header(self, doc: RawDocument) -> None:
+        """Write frontmatter and document title; only the metadata of doc is used."""
+        self.out.write(markdown_header(doc))
+
+    def write_section(self, section: Section | RowSection, raw_text: str = "") -> None:
+        """Write one section; raw_text is the source it was built from, for validation."""
+        chunk = section_to_markdown(section)
+        if not self._empty:
+            self.out.write("\n")
+        self.out.write(chunk)
+        self.coverage.add(raw_text, chunk)
+        self._empty = False
+
+    def write_sections(self, items: Iterable[tuple[Section | RowSection, str]]) -> None:
+        for section, raw_text in items:
+            self.write_section(section, raw_text)
+
+    def write_rendered(self, f: TextIO) -> None:
+        """Append sections another writer already rendered (e.g. in a worker process)."""
+        first = f.read(_COPY_CHARS)
+        if not first:
+            return
+        if not self._empty:
+            self.out.write("\n")
+        self.out.write(first)
+        shutil.copyfileobj(f, self.out, _COPY_CHARS)
+        self._empty = False
+
+    def write_markdown(self, markdown: str, sources: Iterable[str] = ()) -> None:
+        """Append sections rendered elsewhere (joined by blank lines).
+
+        sources are the source texts of those sections; their tokens are
+        looked up in markdown.
+        """
+        if not markdown:
+            return
+        if not self._empty:
+            self.out.write("\n")
+        self.out.write(markdown)
+        self.coverage.add_many(sources, markdown)
+        self._empty = False
+
+    def result(self) -> ValidationResult:
+        return self.coverage.result()
+
+
+def _sample_windows(text: str, rate: float, seed: int = 0) -> str:
+    """Return a random share of fixed-size windows of text, cut at whitespace."""
+    windows = max(1, len(text) // _SAMPLE_WINDOW_CHARS)
+    picks = max(1, round(windows * rate))
+    if picks >= windows:
+        return text
+    parts: list[str] = []
+    for idx in sorted(random.Random(seed).sample(range(windows), picks)):
+        start = idx * _SAMPLE_WINDOW_CHARS
+        end = start + _SAMPLE_WINDOW_CHARS
+        # Drop the tokens cut by the window boundaries
+        if start > 0:
+            start = _next_whitespace(text, start)
+        parts.append(text[start : _next_whitespace(text, end)])
+    return "\n".join(parts)
+
+
+def _next_whitespace(text: str, pos: int) -> int:
+    match = _SPACE.search(text, pos)
+    return match.start() if match else len(text)
+
+
 class BaseConverter(ABC):
     """Abstract base class for all format converters."""
 
+    # Value of the ``quelle`` frontmatter field
+    source_type = ""
+    # Set by converters that implement iter_sections() or stream()
+    supports_streaming = False
+
+    def __init__(self, options: ConversionOptions | None = None) -> None:
+        self.options = options or ConversionOptions()
+
     @abstractmethod
     def extract(self, path: str) -> RawDocument:
         """Extract structured data from the source file."""
         ...
 
+    def header_document(self, path: str) -> RawDocument:
+        """Metadata-only document (no sections, no source text) for the Markdown header."""
+        return RawDocument(
+            source_path=path,
+            source_type=self.source_type,
+            title=Path(path).stem,
+            language="de",
+            date=None,
+            sections=[],
+            metadata={"fingerprint": self.fingerprint(path)} if self.options.deterministic else {},
+            raw_text="",
+        )
+
+    def fingerprint(self, path: str) -> str:
+        """Content fingerprint of the Markdown this converter produces for path."""
+        return source_fingerprint(path, self.options)
+
+    def iter_sections(self, path: str) -> Iterator[tuple[Section | RowSection, str]]:
+        """Yield (section, source text) pairs incrementally from the source file."""
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+
+    def stream(self, path: str, out: TextIO) -> ValidationResult:
+        """Convert the source incrementally, writing Markdown to out.
+
+        The first section is pulled before the header is written, so a
+        converter whose iter_sections raises for a source without records
+        fails before anything is written. Sources that legitimately yield no
+        sections get just the header, as in the in-memory path.
+        """
+        items = self.iter_sections(path)
+        first = next(items, None)
+        writer = MarkdownWriter(out, self.new_coverage())
+        writer.write_header(self.header_document(path))
+        if first is not None:
+            writer.write_section(*first)
+            writer.write_sections(items)
+        return writer.result()
+
+    def new_coverage(self, seed: int = 0) -> CoverageAccumulator:
+        """Return a coverage accumulator for the configured validation mode."""
+        rate = self.options.validation_sample_rate if self.options.validation == "sampled" else 1.0
+        return CoverageAccumulator(sample_rate=rate, seed=seed)
+
     def generate_markdown(self, doc: RawDocument) -> str:
         """Generate LangDock-optimized Markdown with YAML frontmatter."""
-        parts = [build_frontmatter(doc), "", f"# {doc.title}", ""]
-        parts.append(sections_to_markdown(doc.sections))
-        return "\n".join(parts)
+        buf = io.StringIO()
+        writer = MarkdownWriter(buf)
+        writer.write_header(doc)
+        for section in doc.sections:
+            writer.write_section(section)
+        return buf.getvalue()
 
     def validate(self, doc: RawDocument, markdown: str) -> ValidationResult:
-        """Python validation: coverage score based on numeric/ID values."""
-        original_words = set(doc.raw_text.split())
-        key_tokens = {w for w in original_words if len(w) >= 2 and (w.isdigit() or len(w) <= 20)}
-        if not key_tokens:
-            return ValidationResult(status="ok", coverage_score=1.0, issues=[], ai_used=False, corrected_markdown=None)
-        found = sum(1 for t in key_tokens if t in markdown)
-        score = found / len(key_tokens)
-        status = "ok" if score >= 0.95 else "warning"
-        issues = [] if score >= 0.95 else [f"Coverage nur {score:.0%} – manuell prüfen"]
-        return ValidationResult(
-            status=status, coverage_score=score, issues=issues, ai_used=False, corrected_markdown=None
-        )
+        """Python validation: coverage score based on numeric/ID values.
+
+        Linear in the size of source and Markdown: source tokens are looked up
+        in a token index of the Markdown. In sampled mode only random windows
+        of the source are tokenized, and the result carries a 95 % interval.
+        """
+        sampled = self.options.validation == "sampled"
+        raw_text = _sample_windows(doc.raw_text, self.options.validation_sample_rate) if sampled else doc.raw_text
+        key_tokens = _key_tokens(raw_text)
+        found = len(key_tokens & _markdown_index(markdown)) if key_tokens else 0
+        return _coverage_result(found, len(key_tokens), sampled)
 
     def run(self, path: str) -> ConversionResult:
         """Orchestrate extract → generate_markdown → validate."""
         t0 = time.time()
-        doc = self.extract(path)
-        markdown = self.generate_markdown(doc)
-        validation = self.validate(doc, markdown)
+        name = Path(path).name
+        with span("extract", file=name):
+            doc = self.extract(path)
+            if self.options.deterministic:
+                doc.metadata["fingerprint"] = self.fingerprint(path)
+        with span("markdown", file=name):
+            markdown = self.generate_markdown(doc)
+        with span("validate", file=name):
+            validation = self.validate(doc, markdown)
         duration = time.time() - t0
         return ConversionResult(
             source_path=path,
@@ -132,3 +448,46 @@ class BaseConverter(ABC):
             validation=validation,
             duration_seconds=round(duration, 3),
         )
+
+    def run_to_file(self, path: str, out_path: str, streaming: bool = True) -> ConversionResult:
+        """Convert path and write the Markdown to out_path.
+
+        Converters that support it stream by default; pass ``streaming=False``
+        to force the in-memory path. Streaming results carry an empty
+        ``markdown_content``; the Markdown lives in out_path only.
+
+        If the encoding detected from the head of the file does not hold
+        further on, the conversion restarts with the encoding detected from
+        the whole file, and as a last resort runs in memory.
+        """
+        if not (streaming and self.supports_streaming):
+            result = self.run(path)
+            with span("write", file=Path(path).name) as args:
+                Path(out_path).write_text(result.markdown_content, encoding="utf-8")
+                args["bytes"] = Path(out_path).stat().st_size
+            result.output_path = out_path
+            return result
+
+        t0 = time.time()
+        # Extraction, rendering, validation and writing interleave: one span
+        with span("stream", file=Path(path).name) as args:
+            try:
+                validation = self._stream_to_file(path, out_path)
+            except UnicodeDecodeError:
+                redetect_encoding(path)
+                try:
+                    validation = self._stream_to_file(path, out_path)
+                except UnicodeDecodeError:
+                    return self.run_to_file(path, out_path, streaming=False)
+            args["bytes"] = Path(out_path).stat().st_size
+        return ConversionResult(
+            source_path=path,
+            markdown_content="",
+            validation=validation,
+            duration_seconds=round(time.time() - t0, 3),
+            output_path=out_path,
+        )
+
+    def _stream_to_file(self, path: str, out_path: str) -> ValidationResult:
+        with open(out_path, "w", encoding="utf-8") as out:
+            return self.stream(path, out)
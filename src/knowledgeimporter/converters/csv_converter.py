@@ -3,44 +3,104 @@
 from __future__ import annotations
 
 import csv
+import logging
+import os
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TextIO
 
-import chardet
+from .base import BaseConverter, RawDocument, ValidationResult
+from .encoding import open_text, read_text
+from .tabular import RowSection, Table
 
-from .base import BaseConverter, RawDocument, Section
+logger = logging.getLogger(__name__)
+
+# In "auto" mode smaller files stay row by row: importing pandas costs more than it saves
+VECTORIZED_MIN_BYTES = 1024 * 1024
+
+
+class CsvRow(RowSection):
+    """CSV data row; whitespace-only cells count as empty, the title uses the first column."""
+
+    __slots__ = ()
+
+    @property
+    def kv_pairs(self) -> list[tuple[str, str]]:
+        return [
+            (h, str(v))
+            for h, v in zip(self.table.headers, self.values, strict=False)
+            if v is not None and str(v).strip()
+        ]
+
+    @property
+    def title(self) -> str:
+        first_val = self.values[0] if self.values else ""
+        return f"Zeile {self.number}: {first_val}" if first_val else f"Zeile {self.number}"
+
+
+def _iter_csv_rows(reader: csv.DictReader, pooled: bool = False) -> Iterator[CsvRow]:
+    """Yield compact rows sharing one header table; numbering starts at 2 (line 1 is the header).
+
+    With ``pooled`` repeated cell values share one string (for rows that are retained).
+    """
+    table: Table | None = None
+    for idx, row in enumerate(reader, start=2):
+        if table is None:
+            table = Table(tuple(row.keys()))
+        values = tuple(row.values())
+        # Rows with surplus fields carry an extra ``None`` key (DictReader restkey)
+        row_table = table if len(values) == len(table.headers) else Table(tuple(row.keys()))
+        yield CsvRow(row_table, idx, row_table.compact(values) if pooled else values)
 
 
 class CsvConverter(BaseConverter):
     """Converts CSV files into chunking-safe Markdown."""
 
+    source_type = "csv"
+    supports_streaming = True
+
     def extract(self, path: str) -> RawDocument:
-        raw_bytes = Path(path).read_bytes()
-        # Try UTF-8 first (most common), fall back to chardet detection
-        try:
-            text = raw_bytes.decode("utf-8")
-        except UnicodeDecodeError:
-            encoding = chardet.detect(raw_bytes)["encoding"] or "latin-1"
-            text = raw_bytes.decode(encoding, errors="replace")
-
-        lines = list(csv.DictReader(text.splitlines()))
-        if not lines:
+        text = read_text(path)
+
+        sections = list(_iter_csv_rows(csv.DictReader(text.splitlines()), pooled=True))
+        if not sections:
             raise ValueError("Keine Datensätze im CSV gefunden")
 
-        headers = list(lines[0].keys())
-        sections: list[Section] = []
-        for idx, row in enumerate(lines, start=2):
-            first_val = row.get(headers[0], "") if headers else ""
-            title = f"Zeile {idx}: {first_val}" if first_val else f"Zeile {idx}"
-            kv = [(k, str(v)) for k, v in row.items() if v is not None and str(v).strip()]
-            sections.append(Section(level=2, title=title, kv_pairs=kv))
+        headers = list(sections[0].table.headers)
 
         return RawDocument(
             source_path=path,
-            source_type="csv",
+            source_type=self.source_type,
             title=Path(path).stem,
             language="de",
             date=None,
             sections=sections,
-            metadata={"headers": headers, "row_count": len(lines)},
+            metadata={"headers": headers, "row_count": len(sections)},
             raw_text=text,
         )
+
+    def stream(self, path: str, out: TextIO) -> ValidationResult:
+        """Convert with the vectorized engine if selected and able to, else row by row."""
+        engine = self.options.tabular_engine
+        if engine == "vectorized" or (engine == "auto" and os.path.getsize(path) >= VECTORIZED_MIN_BYTES):
+            try:
+                from .vectorized import UnsupportedInput, stream_csv
+            except ImportError as e:
+                logger.debug("Vectorized CSV engine unavailable: %s", e)
+            else:
+                try:
+                    return stream_csv(path, out, self.header_document(path), self.new_coverage)
+                except UnsupportedInput:
+                    logger.debug("Falling back to row-by-row conversion for %s", path)
+        return super().stream(path, out)
+
+    def iter_sections(self, path: str) -> Iterator[tuple[CsvRow, str]]:
+        """Yield row by row from the file handle; memory stays flat in the row count."""
+        empty = True
+        with open_text(path) as f:
+            for row in _iter_csv_rows(csv.DictReader(f)):
+                empty = False
+                raw = " ".join(" ".join(v) if isinstance(v, list) else v for v in row.values if v is not None)
+                yield row, raw
+        if empty:
+            raise ValueError("Keine Datensätze im CSV gefunden")
@@ -0,0 +1,191 @@
+"""Fast, sampled encoding detection shared by the text-based converters."""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import os
+import re
+from typing import TextIO
+
+import chardet
+
+from knowledgeimporter.utils.metrics import CACHE_REQUESTS
+
+# Bytes read from the head of a file for detection
+SAMPLE_BYTES = 64 * 1024
+# Bytes around an undecodable position used to re-detect in read_text()
+_WINDOW_BYTES = 4 * 1024
+# chardet results below this confidence fall back to the Western default
+_MIN_CONFIDENCE = 0.5
+_FALLBACK_ENCODING = "cp1252"
+_CACHE_MAX = 1024
+
+# Order matters: the UTF-32 LE BOM starts with the UTF-16 LE BOM
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_XML_DECL = re.compile(rb"^\s*<\?xml[^>]*?encoding\s*=\s*[\"']([A-Za-z0-9._-]+)[\"']")
+# Emacs/Vim-style magic comment, as used in YAML and CSV exports
+_CODING_COMMENT = re.compile(rb"^[ \t]*#.*?(?:en)?coding[:=][ \t]*([-\w.]+)", re.MULTILINE)
+
+_cache: dict[str, str] = {}
+# Whole-file results of redetect_encoding, per path, size and modification time
+_overrides: dict[tuple[str, int, int], str] = {}
+
+
+def _file_key(path: str) -> tuple[str, int, int]:
+    st = os.stat(path)
+    return os.path.abspath(path), st.st_size, st.st_mtime_ns
+
+
+def detect_encoding(path: str) -> str:
+    """Return the text encoding of path, inspecting at most SAMPLE_BYTES.
+
+    Detection order: byte order mark, XML declaration or coding comment,
+    strict UTF-8 decode of the sample, chardet on the sample. Results are
+    cached per content hash of the sample and the file size. A result of
+    :func:`redetect_encoding` for the same file takes precedence.
+    """
+    override = _overrides.get(_file_key(path))
+    if override is not None:
+        return override
+    with open(path, "rb") as f:
+        sample = f.read(SAMPLE_BYTES)
+    key = hashlib.blake2b(sample, digest_size=16, key=str(os.path.getsize(path)).encode()).hexdigest()
+    encoding = _cache.get(key)
+    CACHE_REQUESTS.inc(cache="encoding", result="miss" if encoding is None else "hit")
+    if encoding is None:
+        encoding = detect_sample_encoding(sample)
+        if len(_cache) >= _CACHE_MAX:
+            _cache.clear()
+        _cache[key] = encoding
+    return encoding
+
+
+def detect_sample_encoding(sample: bytes) -> str:
+    """Detect the encoding of a byte sample (see detect_encoding)."""
+    for bom, name in _BOMS:
+        if sample.startswith(bom):
+            return name
+
+    utf16 = _sniff_utf16(sample)
+    if utf16:
+        return utf16
+
+    declared = _declared_encoding(sample)
+    if declared:
+        return declared
+
+    try:
+        # final=False tolerates a multi-byte sequence cut off at the sample boundary
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    return _guess(sample)
+
+
+def read_text(path: str) -> str:
+    """Read a whole file as text using the detected encoding.
+
+    If the sample looked like UTF-8 but a later part of the file is not,
+    the encoding is re-detected from a window around the offending bytes.
+    """
+    encoding = detect_encoding(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        return data.decode(encoding)
+    except UnicodeDecodeError as e:
+        window = data[max(0, e.start - _WINDOW_BYTES) : e.start + _WINDOW_BYTES]
+        return data.decode(_guess(window), errors="replace")
+
+
+def redetect_encoding(path: str) -> str:
+    """Detect the encoding of path from the whole file and use it from now on.
+
+    For files whose sample decodes but a later part does not (e.g. an ASCII
+    head followed by cp1252 umlauts). Only chunks with non-ASCII bytes are
+    fed to chardet; the result is returned by :func:`detect_encoding` for
+    this file until it changes.
+    """
+    detector = chardet.UniversalDetector()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(SAMPLE_BYTES), b""):
+            if chunk.isascii():
+                continue
+            detector.feed(chunk)
+            if detector.done:
+                break
+    result = detector.close()
+    encoding = _FALLBACK_ENCODING
+    if result.get("encoding") and (result.get("confidence") or 0.0) >= _MIN_CONFIDENCE:
+        try:
+            encoding = codecs.lookup(result["encoding"]).name
+        except LookupError:
+            pass
+    if len(_overrides) >= _CACHE_MAX:
+        _overrides.clear()
+    _overrides[_file_key(path)] = encoding
+    return encoding
+
+
+def open_text(path: str) -> TextIO:
+    """Open path for incremental reading with the detected encoding.
+
+    Decoding is strict: bytes after the sample that do not match the detected
+    encoding raise UnicodeDecodeError instead of being replaced silently
+    (see :func:`redetect_encoding`).
+    """
+    return open(path, encoding=detect_encoding(path), newline="")
+
+
+def _sniff_utf16(sample: bytes) -> str | None:
+    """Recognise BOM-less UTF-16 by the NUL bytes of ASCII characters."""
+    head = sample[:1024]
+    if len(head) < 4 or b"\x00" not in head:
+        return None
+    even_nuls = head[0::2].count(0)
+    odd_nuls = head[1::2].count(0)
+    half = len(head) // 2
+    if odd_nuls > 0.6 * half and even_nuls < 0.1 * half:
+        return "utf-16-le"
+    if even_nuls > 0.6 * half and odd_nuls < 0.1 * half:
+        return "utf-16-be"
+    return None
+
+
+def _declared_encoding(sample: bytes) -> str | None:
+    head = sample[:1024]
+    match = _XML_DECL.match(head)
+    if match is None:
+        # Only the first two lines may carry a coding comment
+        match = _CODING_COMMENT.search(b"\n".join(head.split(b"\n", 2)[:2]))
+    if match is None:
+        return None
+    name = match.group(1).decode("ascii")
+    try:
+        codec = codecs.lookup(name).name
+    except LookupError:
+        return None
+    # A UTF-16/32 declaration in a byte-oriented sample is wrong; let detection decide
+    if codec.startswith(("utf-16", "utf-32")):
+        return None
+    return codec
+
+
+def _guess(sample: bytes) -> str:
+    result = chardet.detect(sample)
+    encoding = result.get("encoding")
+    if not encoding or (result.get("confidence") or 0.0) < _MIN_CONFIDENCE:
+        return _FALLBACK_ENCODING
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return _FALLBACK_ENCODING
@@ -0,0 +1,162 @@
+"""Iterative flattening of nested JSON/YAML data into dot-notation key-value pairs."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from itertools import chain
+from typing import Any
+
+# Joined key paths per parent path, shared between records: ``produkt.preis``
+# is built once and reused instead of once per record. The caches outlive a
+# conversion, so parents and keys together are capped at _KEY_CACHE_MAX, and
+# only the first list indices are cached (long lists would fill it with keys
+# no other record repeats).
+_KEY_CACHE_MAX = 8192
+_INDEX_CACHE_MAX = 64
+_dict_keys: dict[str, dict[str, str]] = {}
+_index_keys: dict[str, dict[int, str]] = {}
+_cached = 0
+
+
+def _keys_for(cache: dict[str, dict[Any, str]], parent: str) -> dict[Any, str]:
+    global _cached
+    keys = cache.get(parent)
+    if keys is None:
+        keys = {}
+        if _cached < _KEY_CACHE_MAX:
+            cache[parent] = keys
+            _cached += 1
+    return keys
+
+
+def clear_key_cache() -> None:
+    """Drop the cached key paths."""
+    global _cached
+    _dict_keys.clear()
+    _index_keys.clear()
+    _cached = 0
+
+
+def _collapsed(value: Any) -> str:
+    """Render a container below the depth cutoff as compact JSON."""
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def flatten_into(
+    out: list[tuple[str, str]], data: Any, prefix: str = "", max_depth: int | None = None
+) -> list[tuple[str, str]]:
+    """Append the (dot.key, value) pairs of data to out, depth-first, without recursion.
+
+    Dict keys are joined with ``.``, list indices appended as ``[i]``. With
+    ``max_depth`` set, containers nested deeper than that many levels are
+    emitted as a single compact JSON value. Returns out.
+    """
+    global _cached
+    append = out.append
+    if not isinstance(data, (dict, list)):
+        append((prefix, "" if data is None else str(data)))
+        return out
+
+    # One entry per open container: (path, child iterator, is_list, depth, key cache)
+    stack: list[tuple[str, Iterator[tuple[Any, Any]], bool, int, dict[Any, str]]] = []
+    if isinstance(data, dict):
+        stack.append((prefix, iter(data.items()), False, 1, _keys_for(_dict_keys, prefix)))
+    else:
+        stack.append((prefix, enumerate(data), True, 1, _keys_for(_index_keys, prefix)))
+
+    while stack:
+        parent, children, is_list, depth, keys = stack[-1]
+        for k, v in children:
+            key = keys.get(k) if is_list or type(k) is str else None
+            if key is None:
+                if is_list:
+                    key = f"{parent}[{k}]" if parent else f"[{k}]"
+                    if k < _INDEX_CACHE_MAX and _cached < _KEY_CACHE_MAX:
+                        keys[k] = key
+                        _cached += 1
+                else:
+                    key = f"{parent}.{k}" if parent else str(k)
+                    # Only str keys are cached: True == 1 == 1.0 would collide
+                    if type(k) is str and _cached < _KEY_CACHE_MAX:
+                        keys[k] = key
+                        _cached += 1
+            if isinstance(v, dict):
+                if max_depth is not None and depth >= max_depth:
+                    append((key, _collapsed(v)))
+                    continue
+                stack.append((key, iter(v.items()), False, depth + 1, _keys_for(_dict_keys, key)))
+                break
+            if isinstance(v, list):
+                if max_depth is not None and depth >= max_depth:
+                    append((key, _collapsed(v)))
+                    continue
+                stack.append((key, enumerate(v), True, depth + 1, _keys_for(_index_keys, key)))
+                break
+            append((key, "" if v is None else str(v)))
+        else:
+            stack.pop()
+    return out
+
+
+def flatten(data: Any, prefix: str = "", max_depth: int | None = None) -> list[tuple[str, str]]:
+    """Flatten nested data into a single list of (dot.key, value) pairs."""
+    return flatten_into([], data, prefix, max_depth)
+
+
+def iter_flatten(data: Any, prefix: str = "", max_depth: int | None = None) -> Iterator[tuple[str, str]]:
+    """Generator form of :func:`flatten` for streaming converters.
+
+    Walks the same explicit stack and yields each pair as it is reached, so
+    the pairs of a large record are never collected into a list.
+    """
+    global _cached
+    if not isinstance(data, (dict, list)):
+        yield prefix, "" if data is None else str(data)
+        return
+
+    stack: list[tuple[str, Iterator[tuple[Any, Any]], bool, int, dict[Any, str]]] = []
+    if isinstance(data, dict):
+        stack.append((prefix, iter(data.items()), False, 1, _keys_for(_dict_keys, prefix)))
+    else:
+        stack.append((prefix, enumerate(data), True, 1, _keys_for(_index_keys, prefix)))
+
+    while stack:
+        parent, children, is_list, depth, keys = stack[-1]
+        for k, v in children:
+            key = keys.get(k) if is_list or type(k) is str else None
+            if key is None:
+                if is_list:
+                    key = f"{parent}[{k}]" if parent else f"[{k}]"
+                    if k < _INDEX_CACHE_MAX and _cached < _KEY_CACHE_MAX:
+                        keys[k] = key
+                        _cached += 1
+                else:
+                    key = f"{parent}.{k}" if parent else str(k)
+                    if type(k) is str and _cached < _KEY_CACHE_MAX:
+                        keys[k] = key
+                        _cached += 1
+            if isinstance(v, dict):
+                if max_depth is not None and depth >= max_depth:
+                    yield key, _collapsed(v)
+                    continue
+                stack.append((key, iter(v.items()), False, depth + 1, _keys_for(_dict_keys, key)))
+                break
+            if isinstance(v, list):
+                if max_depth is not None and depth >= max_depth:
+                    yield key, _collapsed(v)
+                    continue
+                stack.append((key, enumerate(v), True, depth + 1, _keys_for(_index_keys, key)))
+                break
+            yield key, "" if v is None else str(v)
+        else:
+            stack.pop()
+
+
+def peek_flatten(
+    data: Any, prefix: str = "", max_depth: int | None = None
+) -> tuple[tuple[str, str] | None, Iterator[tuple[str, str]]]:
+    """Return the first pair of :func:`iter_flatten` (None if there is none) and an iterator over all pairs."""
+    pairs = iter_flatten(data, prefix, max_depth)
+    first = next(pairs, None)
+    return first, (chain((first,), pairs) if first is not None else pairs)
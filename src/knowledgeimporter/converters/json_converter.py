@@ -3,51 +3,149 @@
 from __future__ import annotations
 
 import json
+import re
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
-from .base import BaseConverter, RawDocument, Section
+from .base import BaseConverter, MarkdownWriter, RawDocument, Section, ValidationResult
+from .encoding import open_text, read_text
+from .flatten import flatten, peek_flatten
 
+try:
+    import orjson
+except ImportError:  # optional faster backend
+    orjson = None
 
-def _flatten(data: Any, prefix: str = "") -> list[tuple[str, str]]:
-    """Recursively flatten JSON data with dot-notation keys."""
-    items: list[tuple[str, str]] = []
-    if isinstance(data, dict):
-        for k, v in data.items():
-            key = f"{prefix}.{k}" if prefix else k
-            items.extend(_flatten(v, key))
-    elif isinstance(data, list):
-        for i, v in enumerate(data):
-            items.extend(_flatten(v, f"{prefix}[{i}]" if prefix else f"[{i}]"))
+# Characters read per refill in streaming mode
+_CHUNK_CHARS = 64 * 1024
+_WHITESPACE = " \t\n\r"
+# orjson turns integers outside [-2**63, 2**64) into floats; documents with numbers
+# of 19 or more digits (the shortest such, e.g. -9999999999999999999) use the stdlib
+_BIG_INT = re.compile(r"-?\d{19,}")
+
+
+def loads(text: str) -> Any:
+    """Parse JSON text, using orjson when installed.
+
+    Inputs orjson handles differently from the stdlib (integers beyond 64
+    bit, NaN/Infinity) transparently fall back to json.loads, which also
+    produces the error message for genuinely invalid input.
+    """
+    if orjson is not None and not _BIG_INT.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _entry_section(idx: int, item: Any, max_depth: int | None = None, lazy: bool = False) -> Section:
+    """Section for one array element; lazy sections flatten the element only while being written."""
+    if lazy:
+        first, kv = peek_flatten(item, max_depth=max_depth)
     else:
-        value = "" if data is None else str(data)
-        items.append((prefix, value))
-    return items
+        kv = flatten(item, max_depth=max_depth)
+        first = kv[0] if kv else None
+    first_val = first[1] if first is not None else str(idx)
+    return Section(level=2, title=f"Eintrag {idx}: {first_val}", kv_pairs=kv)
+
+
+def iter_array(f: TextIO) -> Iterator[tuple[Any, str]]:
+    """Yield (item, raw JSON text) for each element of a top-level JSON array.
+
+    Only the current element is buffered; the stream must be positioned at
+    (or before whitespace preceding) the opening bracket.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill(min_chars: int = _CHUNK_CHARS) -> None:
+        nonlocal buf, pos, eof
+        chunk = f.read(max(min_chars, _CHUNK_CHARS))
+        buf = buf[pos:] + chunk
+        pos = 0
+        eof = not chunk
+
+    def skip_ws() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf) or eof:
+                return buf[pos] if pos < len(buf) else ""
+            fill()
+
+    fill()
+    if skip_ws() != "[":
+        raise ValueError("JSON-Fehler: Top-Level-Array erwartet")
+    pos += 1
+    expect_item = True
+    if skip_ws() == "]":
+        return
+    while True:
+        if expect_item:
+            want = _CHUNK_CHARS
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if eof:
+                        raise ValueError(f"JSON-Fehler: {e}") from e
+                    # Element not complete yet: read more, growing geometrically for huge elements
+                    fill(want)
+                    want *= 2
+                    continue
+                if end == len(buf) and not eof:
+                    # A number at the buffer end may continue in the next chunk
+                    fill(want)
+                    want *= 2
+                    continue
+                break
+            yield item, buf[pos:end]
+            pos = end
+            expect_item = False
+        char = skip_ws()
+        if char == ",":
+            pos += 1
+            skip_ws()
+            expect_item = True
+        elif char == "]":
+            pos += 1
+            if skip_ws():
+                raise ValueError("JSON-Fehler: Daten nach Array-Ende")
+            return
+        else:
+            raise ValueError(f"JSON-Fehler: ',' oder ']' erwartet, gefunden {char!r}")
 
 
 class JsonConverter(BaseConverter):
     """Converts JSON files into chunking-safe Markdown."""
 
+    source_type = "json"
+    supports_streaming = True
+
     def extract(self, path: str) -> RawDocument:
-        text = Path(path).read_text(encoding="utf-8")
+        text = read_text(path)
         try:
-            data = json.loads(text)
+            data = loads(text)
         except json.JSONDecodeError as e:
             raise ValueError(f"JSON-Fehler: {e}") from e
 
+        max_depth = self.options.flatten_max_depth
         sections: list[Section] = []
         if isinstance(data, list):
             for idx, item in enumerate(data, start=1):
-                kv = _flatten(item)
-                first_val = kv[0][1] if kv else str(idx)
-                sections.append(Section(level=2, title=f"Eintrag {idx}: {first_val}", kv_pairs=kv))
+                sections.append(_entry_section(idx, item, max_depth))
         else:
-            kv = _flatten(data)
+            kv = flatten(data, max_depth=max_depth)
             sections.append(Section(level=2, title="Inhalt", kv_pairs=kv))
 
         return RawDocument(
             source_path=path,
-            source_type="json",
+            source_type=self.source_type,
             title=Path(path).stem,
             language="de",
             date=None,
@@ -55,3 +153,24 @@ class JsonConverter(BaseConverter):
             metadata={},
             raw_text=text,
         )
+
+    def stream(self, path: str, out: TextIO) -> ValidationResult:
+        """Convert a top-level array one element at a time.
+
+        Documents whose top level is not an array hold a single section
+        anyway and are converted in memory.
+        """
+        with open_text(path) as f:
+            head = f.read(_CHUNK_CHARS).lstrip(_WHITESPACE)
+            if not head.startswith("["):
+                result = self.run(path)
+                out.write(result.markdown_content)
+                return result.validation
+
+            f.seek(0)
+            writer = MarkdownWriter(out, self.new_coverage())
+            writer.write_header(self.header_document(path))
+            max_depth = self.options.flatten_max_depth
+            for idx, (item, raw) in enumerate(iter_array(f), start=1):
+                writer.write_section(_entry_section(idx, item, max_depth, lazy=True), raw)
+            return writer.result()
@@ -0,0 +1,63 @@
+"""JSON Lines (.jsonl / .ndjson) to chunking-safe Markdown converter."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from .base import BaseConverter, RawDocument, Section
+from .encoding import open_text, read_text
+from .json_converter import _entry_section, loads
+
+
+def _iter_records(
+    lines: Iterable[str], max_depth: int | None = None, lazy: bool = False
+) -> Iterator[tuple[Section, str]]:
+    """Yield one (section, raw line) pair per non-empty line; lazy sections are flattened while written."""
+    idx = 0
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            item = loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON-Fehler in Zeile {line_no}: {e}") from e
+        idx += 1
+        yield _entry_section(idx, item, max_depth, lazy), line
+
+
+class JsonLinesConverter(BaseConverter):
+    """Converts JSON Lines files (one JSON value per line) into chunking-safe Markdown."""
+
+    source_type = "jsonl"
+    supports_streaming = True
+
+    def extract(self, path: str) -> RawDocument:
+        text = read_text(path)
+        # Not splitlines(): JSON strings may contain U+2028 and similar separators
+        sections = [section for section, _ in _iter_records(text.split("\n"), self.options.flatten_max_depth)]
+        if not sections:
+            raise ValueError("Keine Datensätze im JSON-Lines-Dokument gefunden")
+
+        return RawDocument(
+            source_path=path,
+            source_type=self.source_type,
+            title=Path(path).stem,
+            language="de",
+            date=None,
+            sections=sections,
+            metadata={"record_count": len(sections)},
+            raw_text=text,
+        )
+
+    def iter_sections(self, path: str) -> Iterator[tuple[Section, str]]:
+        """Yield line by line; only the current record is held in memory."""
+        empty = True
+        with open_text(path) as f:
+            for item in _iter_records(f, self.options.flatten_max_depth, lazy=True):
+                empty = False
+                yield item
+        if empty:
+            raise ValueError("Keine Datensätze im JSON-Lines-Dokument gefunden")
@@ -0,0 +1,77 @@
+"""Compact row representation for tabular sources (CSV, XLSX).
+
+A ``Section`` per row repeats every header string in its own list of
+key-value tuples and carries a formatted title. For tabular sources the
+headers are shared through one :class:`Table` per file or sheet, and a row
+only keeps its number and value tuple; title and key-value pairs are built
+when the row is rendered.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Distinct values pooled per column before pooling is given up for that column
+_POOL_MAX = 1024
+
+
+class Table:
+    """Header row shared by all rows of a CSV file or XLSX sheet.
+
+    :meth:`compact` pools the values of low-cardinality columns (status,
+    unit, category) so that repeated cells share one string object.
+    """
+
+    __slots__ = ("headers", "name", "_pools")
+
+    def __init__(self, headers: tuple[Any, ...], name: str = "") -> None:
+        self.headers = headers
+        self.name = name
+        self._pools: list[dict[Any, Any] | None] = [{} for _ in headers]
+
+    def compact(self, values: tuple[Any, ...]) -> tuple[Any, ...]:
+        """Return values with repeated strings replaced by their pooled instance."""
+        pools = self._pools
+        out = list(values)
+        for i, pool in enumerate(pools[: len(out)]):
+            if pool is None:
+                continue
+            v = out[i]
+            if type(v) is str:
+                out[i] = pool.setdefault(v, v)
+                if len(pool) > _POOL_MAX:
+                    # High-cardinality column (IDs, names): pooling only costs memory
+                    pools[i] = None
+        return tuple(out)
+
+
+class RowSection:
+    """One data row as a level-2 section, interchangeable with ``Section``.
+
+    Values stay as parsed (``None`` for missing cells) and are stringified on
+    access. Subclasses may override which values count as empty and the title.
+    """
+
+    __slots__ = ("table", "number", "values")
+
+    level = 2
+    free_text = None
+
+    def __init__(self, table: Table, number: int, values: tuple[Any, ...]) -> None:
+        self.table = table
+        self.number = number
+        self.values = values
+
+    @property
+    def kv_pairs(self) -> list[tuple[str, str]]:
+        return [(h, str(v)) for h, v in zip(self.table.headers, self.values, strict=False) if v is not None]
+
+    @property
+    def title(self) -> str:
+        """``[<sheet> – ]Zeile <n>: <first value>``."""
+        label = f"{self.table.name} – Zeile {self.number}" if self.table.name else f"Zeile {self.number}"
+        first = next((v for _, v in zip(self.table.headers, self.values, strict=False) if v is not None), None)
+        return f"{label}: {first}" if first is not None else label
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(number={self.number}, values={self.values!r})"
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from .base import BaseConverter, ConversionResult
+from .base import BaseConverter, ConversionOptions, ConversionResult
 from .csv_converter import CsvConverter
 from .json_converter import JsonConverter
+from .jsonl_converter import JsonLinesConverter
 from .xlsx_converter import XlsxConverter
 from .xml_converter import XmlConverter
 from .yaml_converter import YamlConverter
@@ -26,20 +27,32 @@ class UniversalConverter:
     _REGISTRY: dict[str, type[BaseConverter]] = {
         ".csv": CsvConverter,
         ".json": JsonConverter,
+        ".jsonl": JsonLinesConverter,
+        ".ndjson": JsonLinesConverter,
         ".yaml": YamlConverter,
         ".yml": YamlConverter,
         ".xml": XmlConverter,
         ".xlsx": XlsxConverter,
     }
 
+    def __init__(self, options: ConversionOptions | None = None) -> None:
+        self.options = options or ConversionOptions()
+
     def supported_extensions(self) -> list[str]:
         """Return list of supported file extensions."""
         return list(self._REGISTRY.keys())
 
     def convert(self, path: str) -> ConversionResult:
         """Convert a file to Markdown, dispatching to the registered converter."""
+        return self._converter_for(path).run(path)
+
+    def convert_to_file(self, path: str, out_path: str, streaming: bool = True) -> ConversionResult:
+        """Convert a file and write the Markdown to out_path, streaming where supported."""
+        return self._converter_for(path).run_to_file(path, out_path, streaming=streaming)
+
+    def _converter_for(self, path: str) -> BaseConverter:
         ext = Path(path).suffix.lower()
         converter_cls = self._REGISTRY.get(ext)
         if converter_cls is None:
             raise UnsupportedFormatError(ext)
-        return converter_cls().run(path)
+        return converter_cls(self.options)
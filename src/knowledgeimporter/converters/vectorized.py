@@ -0,0 +1,206 @@
+"""Vectorized CSV engine: chunked pandas/pyarrow parsing with columnar Markdown rendering.
+
+Produces the same Markdown and coverage as the row-by-row ``CsvConverter``
+path. Inputs whose rows the vectorized readers would number or split
+differently from the ``csv`` module (whitespace-only lines, surplus fields,
+duplicate headers) raise :class:`UnsupportedInput` so that the caller can
+fall back to the row-by-row path.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import re
+from collections.abc import Callable, Iterator
+from typing import Any, TextIO
+
+import numpy as np
+import pandas as pd
+
+from .base import CoverageAccumulator, MarkdownWriter, RawDocument, ValidationResult
+from .encoding import open_text
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # optional faster reader
+    pa = None
+    pa_csv = None
+
+logger = logging.getLogger(__name__)
+
+# Rows parsed and rendered per chunk
+CHUNK_ROWS = 50_000
+_READ_CHARS = 1024 * 1024
+# pyarrow needs a type per column name up front; auto-generated names are f0, f1, ...
+_MAX_COLUMNS = 4096
+_WHITESPACE_LINE = re.compile(r"^[ \t\f\v]+\r?$", re.MULTILINE)
+_BARE_CR = re.compile(r"\r(?!\n)")
+
+
+class UnsupportedInput(Exception):
+    """The vectorized readers cannot reproduce the csv module's rows for this input."""
+
+
+class _GuardedText:
+    """Text stream proxy that rejects lines the readers would treat differently.
+
+    The csv module keeps whitespace-only lines as rows (shifting the row
+    numbers) while pandas and pyarrow skip or reject them. Bare CR line
+    ends (classic Mac) are rejected as a whole: the line checks assume LF.
+    """
+
+    def __init__(self, f: TextIO) -> None:
+        self._f = f
+        self._tail = ""
+        self._first = True
+
+    def read(self, size: int = -1) -> str:
+        chunk = self._f.read(size if size and size > 0 else _READ_CHARS)
+        text = self._tail + chunk
+        if self._first and text[:1] in ("\n", "\r"):
+            raise UnsupportedInput("leading blank line")
+        self._first = False
+        # A CR at the end may still be followed by the LF of a CRLF
+        pending_cr = bool(chunk) and text.endswith("\r")
+        if _BARE_CR.search(text, 0, len(text) - pending_cr):
+            raise UnsupportedInput("bare CR line ends")
+        cut = text.rfind("\n") + 1 if chunk else len(text)
+        if _WHITESPACE_LINE.search(text, 0, cut):
+            raise UnsupportedInput("whitespace-only line")
+        self._tail = text[cut:]
+        if self._tail.strip():
+            # The line already has content; only its last character matters for the checks
+            self._tail = "x\r" if pending_cr else "x"
+        return chunk
+
+
+class _Utf8Bytes(io.RawIOBase):
+    """Binary UTF-8 view of a text stream, for pyarrow."""
+
+    def __init__(self, f: _GuardedText) -> None:
+        self._f = f
+        self._buf = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        while not self._buf:
+            chunk = self._f.read(_READ_CHARS)
+            if not chunk:
+                return 0
+            self._buf = chunk.encode("utf-8")
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+
+def _pyarrow_chunks(f: _GuardedText) -> Iterator[pd.DataFrame]:
+    pending: pd.DataFrame | None = None
+    try:
+        reader = pa_csv.open_csv(
+            pa.PythonFile(_Utf8Bytes(f), mode="r"),
+            read_options=pa_csv.ReadOptions(autogenerate_column_names=True, block_size=4 * _READ_CHARS),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True, ignore_empty_lines=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={f"f{i}": pa.string() for i in range(_MAX_COLUMNS)},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+        for batch in reader:
+            frame = batch.to_pandas()
+            pending = frame if pending is None else pd.concat([pending, frame], ignore_index=True)
+            if len(pending) >= CHUNK_ROWS:
+                yield pending
+                pending = None
+    except pa.ArrowInvalid as e:
+        # Short/long rows: the csv module pads or collects them, pyarrow rejects them
+        raise UnsupportedInput(str(e)) from e
+    if pending is not None:
+        yield pending
+
+
+def _pandas_chunks(f: _GuardedText) -> Iterator[pd.DataFrame]:
+    try:
+        yield from pd.read_csv(
+            f,
+            header=None,
+            dtype=object,
+            na_filter=False,
+            skip_blank_lines=True,
+            chunksize=CHUNK_ROWS,
+            engine="c",
+        )
+    except pd.errors.EmptyDataError:
+        return
+    except pd.errors.ParserError as e:
+        # Rows with surplus fields: the csv module collects them, pandas rejects them
+        raise UnsupportedInput(str(e)) from e
+
+
+def _render(frame: pd.DataFrame, headers: list[str], first_number: int) -> tuple[str, Any]:
+    """Render a chunk of rows; return the Markdown and the source text per row."""
+    n = len(frame)
+    numbers = np.arange(first_number, first_number + n).astype(str).astype(object)
+    kv = np.full(n, "", dtype=object)
+    raw = np.full(n, "", dtype=object)
+    for i, header in enumerate(headers):
+        col = frame.iloc[:, i].to_numpy(dtype=object)
+        present = frame.iloc[:, i].str.strip().to_numpy() != ""
+        kv = kv + np.where(present, f"- **{header}:** " + col + "\n", "")
+        raw = raw + " " + col
+    first = frame.iloc[:, 0].to_numpy(dtype=object)
+    titles = "## Zeile " + numbers + np.where(first != "", ": " + first, "")
+    sections = titles + "\n" + np.where(kv != "", "\n" + kv, "")
+    return "\n".join(sections.tolist()), raw
+
+
+def stream_csv(
+    path: str, out: TextIO, header_doc: RawDocument, new_coverage: Callable[[], CoverageAccumulator]
+) -> ValidationResult:
+    """Convert a CSV file chunk by chunk, writing the Markdown to out.
+
+    Tries pyarrow (when installed) and then pandas. Raises
+    :class:`UnsupportedInput`, with out truncated back to its start position,
+    when the input needs the csv module's row handling.
+    """
+    start = out.tell()
+    readers = [_pandas_chunks] if pa_csv is None else [_pyarrow_chunks, _pandas_chunks]
+    for read_chunks in readers:
+        writer = MarkdownWriter(out, new_coverage())
+        try:
+            with open_text(path) as f:
+                _write_chunks(read_chunks(_GuardedText(f)), writer, header_doc)
+            return writer.result()
+        except UnsupportedInput as e:
+            logger.debug("%s cannot convert %s: %s", read_chunks.__name__, path, e)
+            out.seek(start)
+            out.truncate()
+    raise UnsupportedInput(path)
+
+
+def _write_chunks(chunks: Iterator[pd.DataFrame], writer: MarkdownWriter, header_doc: RawDocument) -> None:
+    headers: list[str] | None = None
+    number = 2  # line 1 is the header
+    for frame in chunks:
+        if headers is None:
+            headers = [str(h) for h in frame.iloc[0].tolist()]
+            if len(set(headers)) != len(headers):
+                # The csv module merges duplicate columns into one key
+                raise UnsupportedInput("duplicate headers")
+            frame = frame.iloc[1:]
+        if not len(frame):
+            continue
+        if number == 2:
+            # Written only once a data row exists, like the row-by-row path
+            writer.write_header(header_doc)
+        markdown, raw = _render(frame, headers, number)
+        # One token lookup per chunk: per-row checks would cost most of the speedup
+        writer.write_markdown(markdown, ["\n".join(raw.tolist())])
+        number += len(frame)
+    if number == 2:
+        raise ValueError("Keine Datensätze im CSV gefunden")
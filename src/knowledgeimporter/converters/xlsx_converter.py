@@ -2,48 +2,88 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, TextIO
 
 import openpyxl
 
-from .base import BaseConverter, RawDocument, Section
+from .base import BaseConverter, CoverageAccumulator, MarkdownWriter, RawDocument, ValidationResult
+from .tabular import RowSection, Table
+
+
+def _iter_sheet_rows(sheet_name: str, rows: Iterable[tuple[Any, ...]]) -> Iterator[tuple[RowSection, str]]:
+    """Yield one (row section, source text) pair per data row of a sheet."""
+    table: Table | None = None
+    idx = 1
+    for row in rows:
+        # Skip empty rows
+        if not any(c is not None for c in row):
+            continue
+        if table is None:
+            table = _sheet_table(sheet_name, row)
+            continue
+        idx += 1
+        section = RowSection(table, idx, row)
+        kv = section.kv_pairs
+        if not kv:
+            continue
+        yield section, " ".join(v for _, v in kv)
+
+
+def _sheet_table(sheet_name: str, header_row: tuple[Any, ...]) -> Table:
+    headers = tuple(str(h) if h is not None else f"Spalte{i}" for i, h in enumerate(header_row, start=1))
+    return Table(headers, sheet_name)
+
+
+def _render_sheet(path: str, sheet_name: str, out_path: str, coverage: CoverageAccumulator) -> CoverageAccumulator:
+    """Worker: render a single sheet into out_path (runs in a separate process)."""
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        with open(out_path, "w", encoding="utf-8") as out:
+            MarkdownWriter(out, coverage).write_sections(
+                _iter_sheet_rows(sheet_name, wb[sheet_name].iter_rows(values_only=True))
+            )
+        return coverage
+    finally:
+        wb.close()
 
 
 class XlsxConverter(BaseConverter):
     """Converts XLSX files into chunking-safe Markdown (one section per data row)."""
 
+    source_type = "xlsx"
+    supports_streaming = True
+
     def extract(self, path: str) -> RawDocument:
         wb = openpyxl.load_workbook(path, data_only=True)
-        sections: list[Section] = []
+        sections: list[RowSection] = []
         all_text_parts: list[str] = []
 
         for sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
-            rows = list(ws.iter_rows(values_only=True))
             # Filter empty rows
-            rows = [r for r in rows if any(c is not None for c in r)]
+            rows = [r for r in ws.iter_rows(values_only=True) if any(c is not None for c in r)]
             if not rows:
                 continue
 
-            headers = [str(h) if h is not None else f"Spalte{i}" for i, h in enumerate(rows[0], start=1)]
-            all_text_parts.extend(str(h) for h in headers)
+            table = _sheet_table(sheet_name, rows[0])
+            all_text_parts.extend(table.headers)
 
             for idx, row in enumerate(rows[1:], start=2):
-                kv: list[tuple[str, str]] = []
-                for h, val in zip(headers, row, strict=False):
-                    if val is not None:
-                        s_val = str(val)
-                        all_text_parts.append(s_val)
-                        kv.append((h, s_val))
-                if not kv:
+                values = [str(val) for _, val in zip(table.headers, row, strict=False) if val is not None]
+                if not values:
                     continue
-                first_val = kv[0][1] if kv else str(idx)
-                title = f"{sheet_name} – Zeile {idx}: {first_val}"
-                sections.append(Section(level=2, title=title, kv_pairs=kv))
+                all_text_parts.extend(values)
+                sections.append(RowSection(table, idx, row))
 
         return RawDocument(
             source_path=path,
-            source_type="xlsx",
+            source_type=self.source_type,
             title=Path(path).stem,
             language="de",
             date=None,
@@ -51,3 +91,42 @@ class XlsxConverter(BaseConverter):
             metadata={"sheets": wb.sheetnames},
             raw_text=" ".join(all_text_parts),
         )
+
+    def stream(self, path: str, out: TextIO) -> ValidationResult:
+        """Convert via read-only workbook access, row by row.
+
+        With ``options.sheet_workers > 1`` the sheets are rendered in parallel
+        worker processes into temporary files and concatenated in sheet order.
+        """
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            sheet_names = wb.sheetnames
+            writer = MarkdownWriter(out, self.new_coverage())
+            writer.write_header(self.header_document(path))
+            if self.options.sheet_workers > 1 and len(sheet_names) > 1:
+                self._stream_parallel(path, sheet_names, writer)
+            else:
+                for name in sheet_names:
+                    writer.write_sections(_iter_sheet_rows(name, wb[name].iter_rows(values_only=True)))
+            return writer.result()
+        finally:
+            wb.close()
+
+    def _stream_parallel(self, path: str, sheet_names: list[str], writer: MarkdownWriter) -> None:
+        tmp_dir = tempfile.mkdtemp(prefix="knowledgeimporter_xlsx_")
+        try:
+            parts = [os.path.join(tmp_dir, f"sheet_{i}.md") for i in range(len(sheet_names))]
+            workers = min(self.options.sheet_workers, len(sheet_names))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_render_sheet, path, name, part, self.new_coverage(seed=i))
+                    for i, (name, part) in enumerate(zip(sheet_names, parts, strict=True))
+                ]
+                for future in futures:
+                    writer.coverage.merge(future.result())
+
+            for part in parts:
+                with open(part, encoding="utf-8") as f:
+                    writer.write_rendered(f)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TextIO
 
 import lxml.etree as ET
 
-from .base import BaseConverter, RawDocument, Section
+from .base import BaseConverter, MarkdownWriter, RawDocument, Section, ValidationResult
+from .encoding import open_text, read_text
+
+# Characters decoded per feed() call in streaming mode
+_CHUNK_CHARS = 256 * 1024
+
+
+class _NotAListDocument(Exception):
+    """Raised while streaming when the root turns out not to hold a record list."""
+
+
+@functools.lru_cache(maxsize=4096)
+def _local_name(tag: str) -> str:
+    """Strip the namespace from a tag (cached: record lists repeat the same tags)."""
+    return tag.split("}")[-1]
 
 
 def _elem_to_kv(elem: ET._Element, prefix: str = "") -> list[tuple[str, str]]:
     """Recursively convert XML element to key-value pairs with dot-notation."""
-    tag = elem.tag.split("}")[-1]  # Strip namespace
+    tag = _local_name(elem.tag)  # Strip namespace
     full_key = f"{prefix}.{tag}" if prefix else tag
     results: list[tuple[str, str]] = []
 
@@ -32,26 +49,41 @@ def _elem_to_kv(elem: ET._Element, prefix: str = "") -> list[tuple[str, str]]:
     return results
 
 
+def _record_section(idx: int, tag: str, elem: ET._Element) -> Section:
+    kv = _elem_to_kv(elem)
+    first_val = kv[0][1] if kv else str(idx)
+    return Section(level=2, title=f"{tag} {idx}: {first_val}", kv_pairs=kv)
+
+
+def _record_text(elem: ET._Element) -> str:
+    """Source text of a record (attribute values and text nodes) for validation."""
+    parts = [v for e in elem.iter() for v in e.attrib.values()]
+    parts.extend(elem.itertext())
+    return " ".join(parts)
+
+
 class XmlConverter(BaseConverter):
     """Converts XML files into chunking-safe Markdown."""
 
+    source_type = "xml"
+    supports_streaming = True
+
     def extract(self, path: str) -> RawDocument:
-        text = Path(path).read_text(encoding="utf-8")
+        text = read_text(path)
         try:
-            root = ET.fromstring(text.encode("utf-8"))
+            # Already decoded: the parser encoding overrides any declaration in the document
+            root = ET.fromstring(text.encode("utf-8"), parser=ET.XMLParser(encoding="utf-8"))
         except ET.XMLSyntaxError as e:
             raise ValueError(f"XML-Fehler: {e}") from e
 
-        root_tag = root.tag.split("}")[-1]
+        root_tag = _local_name(root.tag)
         sections: list[Section] = []
 
         # Check if root has multiple children of the same tag (list pattern)
-        child_tags = [c.tag.split("}")[-1] for c in root]
+        child_tags = [_local_name(c.tag) for c in root]
         if len(set(child_tags)) == 1 and len(child_tags) > 1:
             for idx, child in enumerate(root, start=1):
-                kv = _elem_to_kv(child)
-                first_val = kv[0][1] if kv else str(idx)
-                sections.append(Section(level=2, title=f"{child_tags[0]} {idx}: {first_val}", kv_pairs=kv))
+                sections.append(_record_section(idx, child_tags[0], child))
         else:
             # Root attributes with root tag, children without root prefix
             kv: list[tuple[str, str]] = []
@@ -63,7 +95,7 @@ class XmlConverter(BaseConverter):
 
         return RawDocument(
             source_path=path,
-            source_type="xml",
+            source_type=self.source_type,
             title=Path(path).stem,
             language="de",
             date=None,
@@ -71,3 +103,69 @@ class XmlConverter(BaseConverter):
             metadata={"root_tag": root_tag},
             raw_text=text,
         )
+
+    def stream(self, path: str, out: TextIO) -> ValidationResult:
+        """Convert record-list documents incrementally with a pull parser.
+
+        Each record element is rendered and discarded as soon as it closes, so
+        memory is bounded by the record size. Documents that turn out not to
+        follow the list pattern are rewritten via the in-memory path, which
+        requires a seekable output stream.
+        """
+        start = out.tell()
+        writer = MarkdownWriter(out, self.new_coverage())
+        writer.write_header(self.header_document(path))
+        try:
+            writer.write_sections(self.iter_sections(path))
+            return writer.result()
+        except _NotAListDocument:
+            out.seek(start)
+            out.truncate()
+            result = self.run(path)
+            out.write(result.markdown_content)
+            return result.validation
+
+    def iter_sections(self, path: str) -> Iterator[tuple[Section, str]]:
+        """Yield one (section, source text) pair per record element of the root."""
+        parser = ET.XMLPullParser(events=("start", "end"), encoding="utf-8")
+        root: ET._Element | None = None
+        record_tag: str | None = None
+        depth = 0
+        idx = 0
+
+        with open_text(path) as f:
+            while True:
+                chunk = f.read(_CHUNK_CHARS)
+                try:
+                    if chunk:
+                        # Already decoded: the parser encoding overrides any declaration in the document
+                        parser.feed(chunk.encode("utf-8"))
+                    else:
+                        parser.close()
+                except ET.XMLSyntaxError as e:
+                    raise ValueError(f"XML-Fehler: {e}") from e
+
+                for event, elem in parser.read_events():
+                    if event == "start":
+                        depth += 1
+                        if root is None:
+                            root = elem
+                        continue
+                    depth -= 1
+                    if depth != 1:
+                        continue
+                    tag = _local_name(elem.tag)
+                    if record_tag is None:
+                        record_tag = tag
+                    elif tag != record_tag:
+                        raise _NotAListDocument
+                    idx += 1
+                    yield _record_section(idx, record_tag, elem), _record_text(elem)
+                    root.remove(elem)
+
+                if not chunk:
+                    break
+
+        # A single child is not a list (matches extract())
+        if idx < 2:
+            raise _NotAListDocument
@@ -2,47 +2,174 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from pathlib import Path
+from typing import Any, TextIO
 
 import yaml
 
 from .base import BaseConverter, RawDocument, Section
-from .json_converter import _flatten
+from .encoding import open_text, read_text
+from .flatten import flatten, flatten_into, iter_flatten, peek_flatten
+
+# libyaml C loader when PyYAML was built with it, pure-Python loader otherwise
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _NodeSource:
+    """Source text of a composed YAML document, sliced per list item or top-level entry."""
+
+    def __init__(self, node: yaml.Node, text: str, offset: int) -> None:
+        self.node = node
+        self.text = text
+        self.offset = offset
+
+    def _slice(self, first: yaml.Node, last: yaml.Node) -> str:
+        return self.text[first.start_mark.index - self.offset : last.end_mark.index - self.offset]
+
+    def document(self) -> str:
+        return self._slice(self.node, self.node)
+
+    def item(self, idx: int) -> str:
+        if isinstance(self.node, yaml.SequenceNode) and idx < len(self.node.value):
+            return self._slice(self.node.value[idx], self.node.value[idx])
+        return ""
+
+    def entries(self, keys: Iterable[str]) -> str:
+        """Source of the top-level entries with the given keys."""
+        if not isinstance(self.node, yaml.MappingNode):
+            return ""
+        wanted = set(keys)
+        return "\n".join(
+            self._slice(k, v) for k, v in self.node.value if isinstance(k, yaml.ScalarNode) and k.value in wanted
+        )
+
+
+class _RecordingText:
+    """Text stream proxy that keeps what the YAML loader read until the document is sliced off."""
+
+    def __init__(self, f: TextIO) -> None:
+        self._f = f
+        self._chunks: list[str] = []
+        self._offset = 0  # stream index of the first kept character
+
+    def read(self, size: int = -1) -> str:
+        chunk = self._f.read(size)
+        if chunk:
+            self._chunks.append(chunk)
+        return chunk
+
+    def take(self, end: int) -> tuple[str, int]:
+        """Return the kept text up to stream index end and its offset, dropping it."""
+        text = "".join(self._chunks)
+        taken, offset = text[: end - self._offset], self._offset
+        self._chunks = [text[end - self._offset :]]
+        self._offset = end
+        return taken, offset
+
+
+def _load_documents(f: TextIO) -> Iterator[tuple[Any, _NodeSource]]:
+    """Like ``yaml.load_all``, pairing every document with its source text."""
+    recorder = _RecordingText(f)
+    loader = SafeLoader(recorder)
+    try:
+        while loader.check_node():
+            node = loader.get_node()
+            text, offset = recorder.take(node.end_mark.index)
+            yield loader.construct_document(node), _NodeSource(node, text, offset)
+    finally:
+        loader.dispose()
+
+
+def _document_sections(
+    data: Any, max_depth: int | None = None, source: _NodeSource | None = None
+) -> list[tuple[Section, str]]:
+    """Convert one YAML document into (section, source text) pairs; without source the text is empty.
+
+    With a source (streaming), the key-value pairs are flattened lazily while
+    each section is written instead of being collected up front.
+    """
+    sections: list[tuple[Section, str]] = []
+    if isinstance(data, list):
+        for idx, item in enumerate(data, start=1):
+            if source:
+                first, kv = peek_flatten(item, max_depth=max_depth)
+            else:
+                kv = flatten(item, max_depth=max_depth)
+                first = kv[0] if kv else None
+            first_val = first[1] if first is not None else str(idx)
+            raw = source.item(idx - 1) if source else ""
+            sections.append((Section(level=2, title=f"Eintrag {idx}: {first_val}", kv_pairs=kv), raw))
+    elif isinstance(data, dict):
+        # Top-level keys with dict values become separate sections
+        top: list[tuple[str, Any]] = []
+        for k, v in data.items():
+            if isinstance(v, dict):
+                kv = iter_flatten(v, str(k), max_depth) if source else flatten(v, str(k), max_depth)
+                raw = source.entries([str(k)]) if source else ""
+                sections.append((Section(level=2, title=str(k), kv_pairs=kv), raw))
+            else:
+                top.append((str(k), v))
+        if source:
+            top_kv = chain.from_iterable(iter_flatten(v, k, max_depth) for k, v in top)
+            first = next(top_kv, None)
+            has_top = first is not None
+            if has_top:
+                top_kv = chain((first,), top_kv)
+        else:
+            top_kv = []
+            for k, v in top:
+                flatten_into(top_kv, v, k, max_depth)
+            has_top = bool(top_kv)
+        if has_top:
+            raw = source.entries([k for k, _ in top]) if source else ""
+            sections.insert(0, (Section(level=2, title="Grunddaten", kv_pairs=top_kv), raw))
+    else:
+        raw = source.document() if source else ""
+        sections.append((Section(level=2, title="Inhalt", kv_pairs=[("Wert", str(data))]), raw))
+    return sections
+
+
+def _iter_sections(
+    documents: Iterable[tuple[Any, _NodeSource | None]], max_depth: int | None = None
+) -> Iterator[tuple[Section, str]]:
+    """Yield the (section, source text) pairs of every document in a (multi-document) stream.
+
+    Sections of the second and later documents are prefixed with the
+    document number; empty documents (e.g. after a trailing ``---``) are
+    skipped unless the stream holds nothing else.
+    """
+    produced = False
+    try:
+        for doc_no, (data, source) in enumerate(documents, start=1):
+            if data is None and doc_no > 1:
+                continue
+            for section, raw in _document_sections(data, max_depth, source):
+                if doc_no > 1:
+                    section.title = f"Dokument {doc_no} – {section.title}"
+                produced = True
+                yield section, raw
+    except yaml.YAMLError as e:
+        raise ValueError(f"YAML-Fehler: {e}") from e
+    if not produced:
+        yield from _document_sections(None)
 
 
 class YamlConverter(BaseConverter):
     """Converts YAML files into chunking-safe Markdown."""
 
+    source_type = "yaml"
+    supports_streaming = True
+
     def extract(self, path: str) -> RawDocument:
-        text = Path(path).read_text(encoding="utf-8")
-        try:
-            data = yaml.safe_load(text)
-        except yaml.YAMLError as e:
-            raise ValueError(f"YAML-Fehler: {e}") from e
-
-        sections: list[Section] = []
-        if isinstance(data, list):
-            for idx, item in enumerate(data, start=1):
-                kv = _flatten(item)
-                first_val = kv[0][1] if kv else str(idx)
-                sections.append(Section(level=2, title=f"Eintrag {idx}: {first_val}", kv_pairs=kv))
-        elif isinstance(data, dict):
-            # Top-level keys with dict values become separate sections
-            top_kv: list[tuple[str, str]] = []
-            for k, v in data.items():
-                if isinstance(v, dict):
-                    kv = _flatten(v, prefix=str(k))
-                    sections.append(Section(level=2, title=str(k), kv_pairs=kv))
-                else:
-                    top_kv.extend(_flatten(v, prefix=str(k)))
-            if top_kv:
-                sections.insert(0, Section(level=2, title="Grunddaten", kv_pairs=top_kv))
-        else:
-            sections.append(Section(level=2, title="Inhalt", kv_pairs=[("Wert", str(data))]))
+        text = read_text(path)
+        documents = ((data, None) for data in yaml.load_all(text, Loader=SafeLoader))
+        sections = [section for section, _ in _iter_sections(documents, self.options.flatten_max_depth)]
 
         return RawDocument(
             source_path=path,
-            source_type="yaml",
+            source_type=self.source_type,
             title=Path(path).stem,
             language="de",
             date=None,
@@ -50,3 +177,12 @@ class YamlConverter(BaseConverter):
             metadata={},
             raw_text=text,
         )
+
+    def iter_sections(self, path: str) -> Iterator[tuple[Section, str]]:
+        """Parse and convert one document at a time from the file handle.
+
+        Each section is validated against the source text of its list item
+        or top-level entries.
+        """
+        with open_text(path) as f:
+            yield from _iter_sections(_load_documents(f), self.options.flatten_max_depth)
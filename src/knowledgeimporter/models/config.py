@@ -28,6 +28,8 @@ class AppConfig(BaseModel):
             # Universal Converter formats
             "*.csv",
             "*.json",
+            "*.jsonl",
+            "*.ndjson",
             "*.yaml",
             "*.yml",
             "*.xml",
@@ -35,3 +37,24 @@ class AppConfig(BaseModel):
         ]
     )
     replace_existing: bool = True
+    # Include files in subfolders of the source folder (ignore files are honoured)
+    recursive_scan: bool = False
+    # Deterministic conversion output; files unchanged since their last upload are skipped
+    skip_unchanged: bool = False
+    # Coverage validation of converted files: "full" or "sampled" (faster for large batches)
+    validation_mode: str = Field(default="full", pattern="^(full|sampled)$")
+    # Split converted documents into parts below these budgets (0 = no limit)
+    max_part_size_mb: int = Field(default=0, ge=0)
+    max_part_sections: int = Field(default=0, ge=0)
+    # XLSX workbooks: sheets rendered in this many parallel processes (1 = sequential)
+    xlsx_sheet_workers: int = Field(default=1, ge=1)
+    # Days of upload sessions kept in the history database (0 = keep all)
+    history_retention_days: int = Field(default=365, ge=0)
+    # Metrics: textfile for node_exporter's textfile collector, written after every batch ("" = off),
+    # and a local scrape endpoint on 127.0.0.1 (0 = off)
+    metrics_textfile: str = ""
+    metrics_port: int = Field(default=0, ge=0, le=65535)
+    # Write cProfile/tracemalloc reports next to the upload log (env: KNOWLEDGEIMPORTER_PROFILE);
+    # with a threshold only conversions taking at least that many seconds are kept
+    profiling: bool = False
+    profile_threshold_seconds: float = Field(default=0.0, ge=0)
@@ -0,0 +1,81 @@
+"""Per-file outcomes of an upload batch, with a filtered view for the results table."""
+
+import threading
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class FileResult:
+    """Outcome of one source file ("success", "error" or "unchanged")."""
+
+    path: str
+    name: str
+    status: str
+    size: int | None = None
+    convert_seconds: float | None = None
+    upload_seconds: float | None = None
+    error: str | None = None
+
+
+class UploadResults:
+    """All results of a batch and the indices of those matching the current filter.
+
+    Results arrive from the upload thread; the table reads windows of the
+    filtered view from the UI thread. Adding keeps the view up to date in
+    constant time; changing the filter rebuilds it once.
+    """
+
+    def __init__(self) -> None:
+        self._rows: list[FileResult] = []
+        self._view: list[int] = []
+        self._failed = 0
+        self.failed_only = False
+        self.query = ""
+        self._lock = threading.Lock()
+
+    def add(self, result: FileResult) -> None:
+        with self._lock:
+            self._rows.append(result)
+            if result.status == "error":
+                self._failed += 1
+            if self._matches(result):
+                self._view.append(len(self._rows) - 1)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._view.clear()
+            self._failed = 0
+
+    def set_filter(self, failed_only: bool | None = None, query: str | None = None) -> None:
+        """Change the filter (None keeps a setting); search matches file name, path and error."""
+        with self._lock:
+            if failed_only is not None:
+                self.failed_only = failed_only
+            if query is not None:
+                self.query = query.strip().lower()
+            self._view = [i for i, row in enumerate(self._rows) if self._matches(row)]
+
+    def window(self, offset: int, count: int) -> list[FileResult]:
+        """Up to count results of the filtered view, starting at offset."""
+        with self._lock:
+            return [self._rows[i] for i in self._view[max(0, offset) : max(0, offset) + count]]
+
+    @property
+    def total(self) -> int:
+        return len(self._rows)
+
+    @property
+    def failed(self) -> int:
+        return self._failed
+
+    def __len__(self) -> int:
+        """Number of results matching the filter."""
+        return len(self._view)
+
+    def _matches(self, row: FileResult) -> bool:
+        if self.failed_only and row.status != "error":
+            return False
+        if not self.query:
+            return True
+        return self.query in row.path.lower() or (row.error is not None and self.query in row.error.lower())
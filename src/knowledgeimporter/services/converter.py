@@ -4,6 +4,14 @@ import logging
 import shutil
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from knowledgeimporter.services.splitter import split_markdown
+from knowledgeimporter.utils.profiling import profile_conversion
+from knowledgeimporter.utils.tracing import span
+
+if TYPE_CHECKING:
+    from knowledgeimporter.converters.base import ConversionOptions
 
 logger = logging.getLogger(__name__)
 
@@ -15,9 +23,11 @@ CONVERTIBLE_EXTENSIONS = {
     ".html",
     ".htm",
     ".odt",
-    # Universal Converter (CSV/JSON/YAML/XML/XLSX)
+    # Universal Converter (CSV/JSON/JSONL/YAML/XML/XLSX)
     ".csv",
     ".json",
+    ".jsonl",
+    ".ndjson",
     ".yaml",
     ".yml",
     ".xml",
@@ -40,8 +50,9 @@ class ConversionError(Exception):
 class ConversionService:
     """Converts non-Markdown documents to Markdown for upload."""
 
-    def __init__(self) -> None:
+    def __init__(self, options: "ConversionOptions | None" = None) -> None:
         self._temp_dir: Path | None = None
+        self._options = options
 
     @staticmethod
     def needs_conversion(path: Path) -> bool:
@@ -79,21 +90,29 @@ class ConversionService:
         if path.suffix.lower() in NATIVE_EXTENSIONS:
             return path
 
+        with (
+            span("convert", file=path.name, ext=path.suffix.lower(), bytes_in=path.stat().st_size) as args,
+            profile_conversion(path.name),
+        ):
+            out_path = self._convert(path)
+            args["bytes_out"] = out_path.stat().st_size
+        return out_path
+
+    def _convert(self, path: Path) -> Path:
         if not self._temp_dir:
             self.create_temp_dir()
 
         ext = path.suffix.lower()
 
-        # Universal Converter handles CSV, JSON, YAML, XML, XLSX
+        # Universal Converter handles CSV, JSON, JSONL, YAML, XML, XLSX
         from knowledgeimporter.converters.universal_converter import UniversalConverter, UnsupportedFormatError
 
-        uc = UniversalConverter()
+        uc = UniversalConverter(self._options)
         if ext in uc.supported_extensions():
             try:
-                result = uc.convert(str(path))
                 assert self._temp_dir is not None
                 out_path = self._temp_dir / (path.stem + ".md")
-                out_path.write_text(result.markdown_content, encoding="utf-8")
+                uc.convert_to_file(str(path), str(out_path))
                 logger.debug("Converted %s -> %s via UniversalConverter", path.name, out_path.name)
                 return out_path
             except UnsupportedFormatError:
@@ -106,6 +125,29 @@ class ConversionService:
 
         raise ConversionError(path.name, f"Unsupported format: {ext}")
 
+    def fingerprint(self, path: Path) -> str:
+        """Fingerprint of the upload produced for path (source bytes, converter version, options)."""
+        from knowledgeimporter.converters.base import source_fingerprint
+
+        return source_fingerprint(str(path), self._options)
+
+    def split_output(self, path: Path) -> list[Path]:
+        """
+        Split a converted file into parts below the configured byte/section budget.
+
+        Returns [path] when no budget is set or the document fits.
+        """
+        opts = self._options
+        if opts is None or (opts.max_part_bytes is None and opts.max_part_sections is None):
+            return [path]
+        if not self._temp_dir:
+            self.create_temp_dir()
+        assert self._temp_dir is not None
+        try:
+            return split_markdown(path, self._temp_dir, opts.max_part_bytes, opts.max_part_sections)
+        except OSError as e:
+            raise ConversionError(path.name, f"Splitting failed: {e}") from e
+
     def _convert_with_markitdown(self, path: Path) -> Path:
         """Convert PDF, DOCX, or HTML to Markdown using markitdown."""
         try:
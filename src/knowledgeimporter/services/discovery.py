@@ -0,0 +1,307 @@
+"""Source file discovery: compiled name patterns, ignore files and parallel directory walking."""
+
+import fnmatch
+import logging
+import os
+import queue
+import re
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from knowledgeimporter.utils.metrics import QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+# Files with .gitignore syntax that exclude paths below their directory
+IGNORE_FILES = (".gitignore", ".knowledgeignore")
+# Directories scanned concurrently; scandir calls mostly wait on the (network) filesystem
+SCAN_WORKERS = 8
+# How often an iterator waiting for directories checks its cancel event (seconds)
+_CANCEL_POLL = 0.1
+
+_CASE_INSENSITIVE = os.path.normcase("A") == "a"
+
+
+def compile_patterns(patterns: list[str]) -> Callable[[str], bool]:
+    """Compile glob patterns into one matcher for file names (same rules as ``fnmatch.fnmatch``)."""
+    if not patterns:
+        return lambda _name: False
+    flags = re.IGNORECASE if _CASE_INSENSITIVE else 0
+    regex = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), flags)
+    return lambda name: regex.match(name) is not None
+
+
+def _translate_ignore(pattern: str) -> str:
+    """Regex body for one .gitignore pattern, matched against a '/'-separated relative path."""
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            # A "]" right after "[" or "[!" belongs to the class
+            j = i + 1
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            end = pattern.find("]", j)
+            if end < 0:
+                out.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class IgnoreRules:
+    """Rules of one ignore file, applying to paths below its directory."""
+
+    def __init__(self, base: Path, lines: list[str]) -> None:
+        self.base = base
+        self.rules: list[tuple[re.Pattern[str], bool, bool]] = []  # (regex, negated, directories only)
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip("\r")
+            if not line.endswith("\\ "):
+                line = line.rstrip(" ")
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            body = _translate_ignore(line.lstrip("/"))
+            flags = re.IGNORECASE if _CASE_INSENSITIVE else 0
+            regex = re.compile(body if anchored else f"(?:.*/)?{body}", flags)
+            self.rules.append((regex, negated, dir_only))
+
+    @classmethod
+    def load(cls, path: Path) -> "IgnoreRules | None":
+        try:
+            return cls(path.parent, path.read_text(encoding="utf-8", errors="replace").splitlines())
+        except OSError as e:
+            logger.warning("Could not read ignore file %s: %s", path, e)
+            return None
+
+    def match(self, rel_path: str, is_dir: bool) -> bool | None:
+        """True (ignored), False (re-included by a ``!`` rule) or None (no rule matched)."""
+        result = None
+        for regex, negated, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(rel_path):
+                result = not negated
+        return result
+
+
+def is_ignored(path: Path, is_dir: bool, rules: tuple[IgnoreRules, ...]) -> bool:
+    """Apply the ignore files from the root down; the deepest matching rule wins."""
+    ignored = False
+    for rule_set in rules:
+        rel = path.relative_to(rule_set.base).as_posix()
+        verdict = rule_set.match(rel, is_dir)
+        if verdict is not None:
+            ignored = verdict
+    return ignored
+
+
+class SourceEntry(NamedTuple):
+    """A discovered file; size and mtime are -1 unless the scan stats files."""
+
+    path: Path
+    size: int = -1
+    mtime_ns: int = -1
+
+
+class FileScan:
+    """Iterates the files below root whose names match patterns, while scanning continues.
+
+    Directories are scanned by a thread pool, so matches of one directory
+    are available while others are still being listed. Files of a directory
+    come in name order; the order between directories is not defined.
+    ``found`` counts the matches discovered so far, ``done`` tells whether
+    the scan finished. In recursive mode, ignore files (:data:`IGNORE_FILES`)
+    exclude paths below their directory and excluded directories are not
+    entered; a flat scan lists every matching file of root.
+
+    With ``with_stat``, :meth:`entries` carries size and mtime of every file,
+    and ``watched`` maps each scanned directory and ignore file to its mtime.
+    Setting the ``cancel`` event from another thread stops the scan, even
+    while the iterator waits for a slow directory listing.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        patterns: list[str],
+        recursive: bool = False,
+        workers: int = SCAN_WORKERS,
+        with_stat: bool = False,
+        cancel: threading.Event | None = None,
+    ) -> None:
+        self.root = Path(root)
+        self.recursive = recursive
+        self.with_stat = with_stat
+        self.found = 0
+        self.done = False
+        self.watched: dict[str, int] = {}
+        self._match = compile_patterns(patterns)
+        self._workers = workers if recursive else 1
+        self._queue: queue.Queue[list[SourceEntry] | None] = queue.Queue()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._pool: ThreadPoolExecutor | None = None
+        self._cancel = cancel
+
+    def __iter__(self) -> Iterator[Path]:
+        for entry in self.entries():
+            yield entry.path
+
+    def entries(self) -> Iterator[SourceEntry]:
+        """Iterate the matches with their (optional) stat data."""
+        if not self.root.is_dir():
+            self.done = True
+            return
+        self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="scan")
+        try:
+            self._submit(self.root, ())
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    break
+                self.found += len(batch)
+                yield from batch
+            self.done = not self._stopped.is_set()
+        finally:
+            self.close()
+
+    def _next_batch(self) -> list[SourceEntry] | None:
+        if self._cancel is None:
+            return self._queue.get()
+        while not self._cancel.is_set():
+            try:
+                return self._queue.get(timeout=_CANCEL_POLL)
+            except queue.Empty:
+                continue
+        self.close()
+        return None
+
+    def close(self) -> None:
+        """Stop scanning; directories not yet listed are skipped."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        if self._pool is not None:
+            # Queued directories still run, but return at once: each one's _finish keeps the counts balanced
+            self._pool.shutdown(wait=False)
+        # Wake an iterator waiting for directories that will no longer be scanned
+        self._queue.put(None)
+
+    def _submit(self, directory: Path, rules: tuple[IgnoreRules, ...]) -> None:
+        with self._lock:
+            self._pending += 1
+        QUEUE_DEPTH.inc(queue="directories")
+        assert self._pool is not None
+        try:
+            self._pool.submit(self._scan, directory, rules)
+        except RuntimeError:
+            # Pool already shut down by close()
+            self._finish()
+
+    def _finish(self) -> None:
+        QUEUE_DEPTH.dec(queue="directories")
+        with self._lock:
+            self._pending -= 1
+            last = self._pending == 0
+        if last:
+            self._queue.put(None)
+
+    def _scan(self, directory: Path, rules: tuple[IgnoreRules, ...]) -> None:
+        try:
+            if self._stopped.is_set():
+                return
+            if self.with_stat:
+                # Taken before listing: a change during the listing shows up as a newer mtime
+                self._watch(directory)
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError as e:
+                logger.warning("Could not scan %s: %s", directory, e)
+                return
+
+            names = {e.name for e in entries} if self.recursive else set()
+            for ignore_name in IGNORE_FILES:
+                if ignore_name in names:
+                    if self.with_stat:
+                        self._watch(directory / ignore_name)
+                    loaded = IgnoreRules.load(directory / ignore_name)
+                    if loaded is not None and loaded.rules:
+                        rules = (*rules, loaded)
+
+            matches: list[SourceEntry] = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    continue
+                path = Path(entry.path)
+                if is_dir:
+                    if self.recursive and not (rules and is_ignored(path, True, rules)):
+                        self._submit(path, rules)
+                elif is_file and self._match(entry.name) and not (rules and is_ignored(path, False, rules)):
+                    if self.with_stat:
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        matches.append(SourceEntry(path, st.st_size, st.st_mtime_ns))
+                    else:
+                        matches.append(SourceEntry(path))
+            if matches:
+                self._queue.put(matches)
+        finally:
+            self._finish()
+
+    def _watch(self, path: Path) -> None:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = -1  # never matches: the snapshot counts as stale
+        with self._lock:
+            self.watched[str(path)] = mtime
+
+
+def collect_files(root: str | Path, patterns: list[str], recursive: bool = False) -> list[Path]:
+    """All matching files below root, sorted by path."""
+    return sorted(FileScan(root, patterns, recursive))
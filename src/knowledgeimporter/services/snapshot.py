@@ -0,0 +1,217 @@
+"""Cached snapshot of a source directory, shared by the file count display and the upload."""
+
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent import futures
+from dataclasses import dataclass
+from pathlib import Path
+
+from knowledgeimporter.services.discovery import FileScan, SourceEntry, compile_patterns
+from knowledgeimporter.utils.metrics import CACHE_REQUESTS
+
+# Directories modified this recently may still change within their mtime granularity (FAT: 2 s)
+_SETTLE_NS = 2_000_000_000
+
+# Interval (seconds) at which a caller waiting for another caller's scan checks its cancel event
+_WAIT_POLL_SECONDS = 0.1
+
+# Called with every file as the scan finds it
+EntryCallback = Callable[[SourceEntry], None]
+
+
+class ScanCancelled(Exception):
+    """Raised when a snapshot scan was cancelled before it finished."""
+
+
+@dataclass
+class SnapshotSummary:
+    """Matching files of a snapshot for one set of patterns."""
+
+    count: int
+    total_bytes: int
+    by_extension: dict[str, int]
+
+
+class ListScan:
+    """A finished scan over a known list of files; same interface as :class:`FileScan`."""
+
+    def __init__(self, paths: list[Path]) -> None:
+        self._paths = paths
+        self.found = len(paths)
+        self.done = True
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(self._paths)
+
+    def close(self) -> None:
+        pass
+
+
+class SourceSnapshot:
+    """All files below a source directory with size and mtime, taken in one scan.
+
+    Patterns are applied to the cached entries, so changing them needs no
+    rescan. The snapshot is stale once a scanned directory or ignore file
+    has a different mtime (a file was added, removed or renamed, or the
+    ignore rules changed). Edits to existing files do not change directory
+    mtimes; sizes may then be outdated, but the listing is still correct.
+
+    on_entry sees every file while the scan runs (for a running count);
+    setting cancel stops the scan and raises :class:`ScanCancelled`.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        recursive: bool = False,
+        on_entry: EntryCallback | None = None,
+        cancel: threading.Event | None = None,
+    ) -> None:
+        self.root = Path(root)
+        self.recursive = recursive
+        self.scanned_ns = time.time_ns()
+        scan = FileScan(self.root, ["*"], recursive, with_stat=True, cancel=cancel)
+        entries: list[SourceEntry] = []
+        for entry in scan.entries():
+            entries.append(entry)
+            if on_entry is not None:
+                on_entry(entry)
+        if not scan.done:
+            raise ScanCancelled(str(self.root))
+        entries.sort()
+        self.entries = entries
+        self._watched = scan.watched
+
+    def is_stale(self) -> bool:
+        """True if a watched directory or ignore file changed (or may still change) since the scan."""
+        if not self._watched:
+            # Root did not exist (or could not be read); check whether it does now
+            return self.root.is_dir()
+        settled = self.scanned_ns - _SETTLE_NS
+        for path, mtime in self._watched.items():
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                return True
+            if current != mtime or current >= settled:
+                return True
+        return False
+
+    def matching(self, patterns: list[str]) -> list[SourceEntry]:
+        """Entries whose file names match patterns, sorted by path."""
+        match = compile_patterns(patterns)
+        return [e for e in self.entries if match(e.path.name)]
+
+    def summary(self, patterns: list[str]) -> SnapshotSummary:
+        matched = self.matching(patterns)
+        by_extension = Counter(e.path.suffix.lower() or "(none)" for e in matched)
+        return SnapshotSummary(
+            count=len(matched),
+            total_bytes=sum(e.size for e in matched),
+            by_extension=dict(by_extension.most_common()),
+        )
+
+    def scan(self, patterns: list[str]) -> ListScan:
+        """The matching files, in the form upload_batch consumes a scan."""
+        return ListScan([e.path for e in self.matching(patterns)])
+
+
+class SnapshotCache:
+    """Snapshots per (directory, recursive), rescanned only when stale."""
+
+    def __init__(self) -> None:
+        self._snapshots: dict[tuple[str, bool], SourceSnapshot] = {}
+        # Scans in progress; the lock only guards these dicts, scans run outside it
+        self._scans: dict[tuple[str, bool], futures.Future[SourceSnapshot]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        root: str | Path,
+        recursive: bool = False,
+        on_entry: EntryCallback | None = None,
+        cancel: threading.Event | None = None,
+    ) -> SourceSnapshot:
+        """The cached snapshot, or a new scan if it is missing or stale (see :class:`SourceSnapshot`).
+
+        A caller asking while the same directory is being scanned waits for
+        that scan and reuses its snapshot (without on_entry calls); if that
+        scan is cancelled, it scans itself.
+        """
+        key = (os.path.abspath(root), recursive)
+        while True:
+            with self._lock:
+                snapshot = self._snapshots.get(key)
+                pending = self._scans.get(key)
+            if pending is not None:
+                snapshot = self._wait(pending, key[0], cancel)
+                if snapshot is None:
+                    continue
+                CACHE_REQUESTS.inc(cache="snapshot", result="hit")
+                return snapshot
+            if snapshot is not None and not snapshot.is_stale():
+                CACHE_REQUESTS.inc(cache="snapshot", result="hit")
+                return snapshot
+            with self._lock:
+                # Another caller may have started or finished a scan in the meantime
+                if key in self._scans or self._snapshots.get(key) is not snapshot:
+                    continue
+                pending = self._scans[key] = futures.Future()
+            break
+
+        CACHE_REQUESTS.inc(cache="snapshot", result="miss")
+        try:
+            snapshot = SourceSnapshot(key[0], recursive, on_entry, cancel)
+        except BaseException as e:
+            with self._lock:
+                del self._scans[key]
+            pending.set_exception(e)
+            raise
+        with self._lock:
+            self._snapshots[key] = snapshot
+            del self._scans[key]
+        pending.set_result(snapshot)
+        return snapshot
+
+    @staticmethod
+    def _wait(
+        pending: futures.Future[SourceSnapshot], root: str, cancel: threading.Event | None
+    ) -> SourceSnapshot | None:
+        """Result of another caller's scan; None if that scan was cancelled."""
+        while True:
+            if cancel is not None and cancel.is_set():
+                raise ScanCancelled(root)
+            try:
+                return pending.result(timeout=_WAIT_POLL_SECONDS)
+            except futures.TimeoutError:
+                continue
+            except ScanCancelled:
+                return None
+
+    def fresh(self, root: str | Path, recursive: bool = False) -> SourceSnapshot | None:
+        """The cached snapshot if it is still valid, without scanning otherwise."""
+        key = (os.path.abspath(root), recursive)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None or snapshot.is_stale():
+                CACHE_REQUESTS.inc(cache="snapshot", result="miss")
+                return None
+            CACHE_REQUESTS.inc(cache="snapshot", result="hit")
+            return snapshot
+
+    def invalidate(self, root: str | Path | None = None) -> None:
+        """Drop the snapshots of root (all snapshots when None)."""
+        with self._lock:
+            if root is None:
+                self._snapshots.clear()
+                return
+            path = os.path.abspath(root)
+            for key in [k for k in self._snapshots if k[0] == path]:
+                del self._snapshots[key]
+
+
+# Process-wide cache: the file count display fills it, the upload reuses it
+snapshots = SnapshotCache()
@@ -0,0 +1,148 @@
+"""Size-aware splitting of converted Markdown documents at section boundaries."""
+
+import logging
+import re
+from pathlib import Path
+from typing import BinaryIO
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Headings outside fenced code blocks start a section
+_HEADING = re.compile(rb"#{1,6}[ \t]")
+_FENCE = re.compile(rb"(```|~~~)")
+# Part numbering keys of a document that is itself a part
+_PART_KEY = re.compile(r"teile?:")
+
+
+def part_name(stem: str, number: int, count: int) -> str:
+    """Upload name of part ``number`` of ``count``, e.g. ``Artikel_teil03.md``."""
+    return f"{stem}_teil{number:0{len(str(count))}d}.md"
+
+
+def _read_header(f: BinaryIO) -> tuple[str | None, str | None, int]:
+    """Find frontmatter and H1 title; return the frontmatter text and title with the byte offset of the body."""
+    offset = 0
+    meta: str | None = None
+    line = f.readline()
+    if line.rstrip(b"\r\n") == b"---":
+        block: list[bytes] = []
+        end = offset + len(line)
+        for line in iter(f.readline, b""):
+            end += len(line)
+            if line.rstrip(b"\r\n") == b"---":
+                text = b"".join(block).decode("utf-8")
+                try:
+                    parsed = yaml.safe_load(text)
+                except yaml.YAMLError:
+                    parsed = None
+                if isinstance(parsed, dict):
+                    meta, offset = text, end
+                break
+            block.append(line)
+    f.seek(offset)
+
+    title: str | None = None
+    for line in iter(f.readline, b""):
+        if line.strip():
+            if line.startswith(b"# "):
+                title = line[2:].decode("utf-8").strip()
+                offset += len(line)
+            break
+        offset += len(line)
+    # Blank lines after the title belong to the header, not to part 1
+    f.seek(offset)
+    for line in iter(f.readline, b""):
+        if line.strip():
+            break
+        offset += len(line)
+    return meta, title, offset
+
+
+def _part_header(meta: str | None, title: str | None, number: int, count: int) -> bytes:
+    # The frontmatter is copied verbatim (re-dumping would turn quoted dates into timestamps)
+    lines = ["---", *(line for line in (meta or "").splitlines() if not _PART_KEY.match(line))]
+    lines += [f"teil: {number}", f"teile: {count}", "---", ""]
+    if title is not None:
+        lines += [f"# {title} (Teil {number}/{count})", ""]
+    lines.append("")
+    return "\n".join(lines).encode("utf-8")
+
+
+def _cut_offsets(f: BinaryIO, body_start: int, budget: int | None, max_sections: int | None) -> list[int]:
+    """Byte offsets where a new part starts, chosen greedily at section starts."""
+    cuts: list[int] = []
+    part_start = body_start
+    part_sections = 0
+    section_start: int | None = None
+    in_fence = False
+    offset = body_start
+
+    def close_section(end: int) -> None:
+        nonlocal part_start, part_sections
+        if section_start is None:
+            return
+        full = max_sections is not None and part_sections >= max_sections
+        if part_sections and (full or (budget is not None and end - part_start > budget)):
+            cuts.append(section_start)
+            part_start = section_start
+            part_sections = 0
+        part_sections += 1
+
+    f.seek(body_start)
+    for line in iter(f.readline, b""):
+        if _FENCE.match(line):
+            in_fence = not in_fence
+        elif not in_fence and _HEADING.match(line):
+            close_section(offset)
+            section_start = offset
+        offset += len(line)
+    close_section(offset)
+    return cuts
+
+
+def split_markdown(
+    path: Path, out_dir: Path, max_bytes: int | None = None, max_sections: int | None = None
+) -> list[Path]:
+    """Split a Markdown file into parts below a byte and/or section budget.
+
+    Parts are cut only at headings outside code blocks; a single section
+    larger than the byte budget becomes a part of its own. Every part repeats
+    the frontmatter (plus ``teil``/``teile``) and the title. Returns ``[path]``
+    unchanged when the document fits.
+    """
+    if max_bytes is None and max_sections is None:
+        return [path]
+    if max_sections is None and max_bytes is not None and path.stat().st_size <= max_bytes:
+        return [path]
+
+    with open(path, "rb") as f:
+        meta, title, body_start = _read_header(f)
+        # Leave room for the repeated header in every part (part numbers may grow longer)
+        overhead = len(_part_header(meta, title, 1, 1)) + 16
+        budget = None if max_bytes is None else max(1, max_bytes - overhead)
+        cuts = _cut_offsets(f, body_start, budget, max_sections)
+        if not cuts:
+            return [path]
+
+        size = path.stat().st_size
+        bounds = list(zip([body_start, *cuts], [*cuts, size], strict=True))
+        count = len(bounds)
+        parts: list[Path] = []
+        for number, (start, end) in enumerate(bounds, start=1):
+            part_path = out_dir / part_name(path.stem, number, count)
+            f.seek(start)
+            with open(part_path, "wb") as out:
+                out.write(_part_header(meta, title, number, count))
+                remaining = end - start
+                while remaining > 0:
+                    chunk = f.read(min(remaining, 1024 * 1024))
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    remaining -= len(chunk)
+            parts.append(part_path)
+
+    logger.debug("Split %s into %d parts", path.name, count)
+    return parts
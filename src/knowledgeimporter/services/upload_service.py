@@ -1,19 +1,68 @@
 """Upload orchestration service for batch uploading files to LangDock Knowledge Folders."""
 
-import fnmatch
 import logging
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from eq_chatbot_core.providers.langdock_provider import LangDockKnowledgeManager
 
+from knowledgeimporter.models.upload_results import FileResult
 from knowledgeimporter.services.converter import ConversionError, ConversionService
+from knowledgeimporter.services.discovery import FileScan, collect_files
+from knowledgeimporter.services.snapshot import SourceSnapshot
+from knowledgeimporter.utils.metrics import BYTES, CONVERT_SECONDS, FILES, QUEUE_DEPTH, UPLOAD_SECONDS
+from knowledgeimporter.utils.profiling import BatchProfiler, profile_batch
+from knowledgeimporter.utils.tracing import Tracer, activate, span
+from knowledgeimporter.utils.upload_history import HistorySession
+from knowledgeimporter.utils.upload_manifest import UploadManifest
+
+if TYPE_CHECKING:
+    from knowledgeimporter.converters.base import ConversionOptions
 
 logger = logging.getLogger(__name__)
 
 # Type alias for progress callback: (current, total, filename, status)
 ProgressCallback = Callable[[int, int, str, str], None]
+# Called with the outcome of every file
+ResultCallback = Callable[[FileResult], None]
+
+# Concurrent uploads for the parts of one split document
+PART_UPLOAD_WORKERS = 4
+
+
+def _record(
+    history: HistorySession | None,
+    on_result: ResultCallback | None,
+    path: Path,
+    status: str,
+    convert_seconds: float | None = None,
+    upload_seconds: float | None = None,
+    error: str | None = None,
+) -> None:
+    """Report one file outcome to the upload history and the result callback, if given."""
+    if history is None and on_result is None:
+        return
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = None
+    if history is not None:
+        history.record_file(path, status, size, convert_seconds, upload_seconds, error)
+    if on_result is not None:
+        on_result(FileResult(str(path), path.name, status, size, convert_seconds, upload_seconds, error))
+
+
+def _observe(stage: str, fmt: str, status: str, seconds: float, size: int = 0) -> None:
+    """Count one conversion or upload ("convert"/"upload") in the metrics."""
+    FILES.inc(stage=stage, format=fmt, status=status)
+    if status == "success":
+        BYTES.inc(size, stage=stage, format=fmt)
+    (CONVERT_SECONDS if stage == "convert" else UPLOAD_SECONDS).observe(seconds, format=fmt)
 
 
 class UploadService:
@@ -49,21 +98,9 @@ class UploadService:
                     logger.warning("Failed to delete file %s: %s", file_id, e)
         return deleted
 
-    def collect_files(self, source_dir: str, patterns: list[str]) -> list[Path]:
+    def collect_files(self, source_dir: str, patterns: list[str], recursive: bool = False) -> list[Path]:
         """Collect files matching the given glob patterns from source directory."""
-        source = Path(source_dir)
-        if not source.is_dir():
-            return []
-
-        matched: list[Path] = []
-        for item in sorted(source.iterdir()):
-            if not item.is_file():
-                continue
-            for pattern in patterns:
-                if fnmatch.fnmatch(item.name, pattern):
-                    matched.append(item)
-                    break
-        return matched
+        return collect_files(source_dir, patterns, recursive)
 
     def upload_batch(
         self,
@@ -72,103 +109,237 @@ class UploadService:
         patterns: list[str],
         replace: bool = True,
         on_progress: ProgressCallback | None = None,
+        conversion_options: "ConversionOptions | None" = None,
+        tracer: Tracer | None = None,
+        manifest: UploadManifest | None = None,
+        recursive: bool = False,
+        snapshot: SourceSnapshot | None = None,
+        history: HistorySession | None = None,
+        profiler: BatchProfiler | None = None,
+        on_result: ResultCallback | None = None,
+        skip_unchanged: bool = True,
     ) -> dict[str, Any]:
         """
         Upload all matching files from source_dir to the LangDock folder.
 
-        Returns a summary dict with keys: total, success, failed, skipped, errors.
+        conversion_options (e.g. the validation mode) apply to every file of the batch.
+        With a part budget set there, oversized converted documents are split
+        and their parts uploaded concurrently.
+
+        With a tracer, the stages (listing, conversion, splitting, deleting,
+        uploading) are recorded as spans carrying file name and byte counts.
+
+        With a manifest, files whose fingerprint matches their last upload to
+        this folder (and whose uploads still exist there) are skipped as
+        unchanged, without converting them; with skip_unchanged=False the
+        manifest only records the upload names. Replace mode deletes the
+        file's current upload names and those the manifest recorded for it,
+        so the stale parts of an earlier, longer split go too, while files of
+        other sources with part-like names (``Artikel_teil1.md``) are kept.
+
+        Files are processed while the source directory (with recursive, its
+        whole tree) is still being scanned; the total reported to on_progress
+        grows until the scan is done. With a snapshot of source_dir (see
+        :mod:`knowledgeimporter.services.snapshot`) its cached listing is used
+        instead of scanning again. With a history session, the outcome of
+        every file (status, bytes, conversion and upload time, error) is
+        recorded there. A profiler (see :mod:`knowledgeimporter.utils.profiling`)
+        profiles the batch or its slow conversions. on_result receives a
+        :class:`FileResult` for every file, as the history does.
+
+        Returns a summary dict with keys: total, success, failed, skipped, unchanged, converted, errors.
         """
         self._cancelled = False
-        files = self.collect_files(source_dir, patterns)
-        total = len(files)
+        scan = snapshot.scan(patterns) if snapshot is not None else FileScan(source_dir, patterns, recursive)
+        files = iter(scan)
+        first = next(files, None)
         success = 0
         failed = 0
         skipped = 0
         converted = 0
+        unchanged = 0
         errors: list[dict[str, str]] = []
 
-        if total == 0:
-            return {"total": 0, "success": 0, "failed": 0, "skipped": 0, "converted": 0, "errors": []}
+        if first is None:
+            return {"total": 0, "success": 0, "failed": 0, "skipped": 0, "unchanged": 0, "converted": 0, "errors": []}
 
-        converter = ConversionService()
+        converter = ConversionService(conversion_options)
         converter.create_temp_dir()
+        splitting = conversion_options is not None and (
+            conversion_options.max_part_bytes is not None or conversion_options.max_part_sections is not None
+        )
 
-        try:
-            # If replace mode, get existing files for comparison
-            existing_files: dict[str, str] = {}
-            if replace:
-                try:
-                    for f in self._km.list_files(folder_id):
-                        name = f.get("name", "")
-                        file_id = f.get("id", "")
-                        if name and file_id:
-                            existing_files[name] = file_id
-                except Exception as e:
-                    logger.warning("Could not list existing files: %s", e)
+        with activate(tracer), profile_batch(profiler):
+            try:
+                # If replace mode (or skipping unchanged files), get existing files for comparison
+                existing_files: dict[str, str] = {}
+                if replace or (manifest is not None and skip_unchanged):
+                    try:
+                        with span("list", folder=folder_id) as args:
+                            listed = self._km.list_files(folder_id)
+                            args["files"] = len(listed)
+                        for f in listed:
+                            name = f.get("name", "")
+                            file_id = f.get("id", "")
+                            if name and file_id:
+                                existing_files[name] = file_id
+                    except Exception as e:
+                        logger.warning("Could not list existing files: %s", e)
 
-            for i, file_path in enumerate(files):
-                if self._cancelled:
-                    skipped = total - i
-                    if on_progress:
-                        on_progress(i, total, "", "cancelled")
-                    break
+                seen_names: set[str] = set()
+                for i, file_path in enumerate(chain([first], files)):
+                    total = scan.found
+                    if self._cancelled:
+                        scan.close()
+                        skipped = total - i
+                        if on_progress:
+                            on_progress(i, total, "", "cancelled")
+                        break
+                    QUEUE_DEPTH.set(total - i - 1, queue="files")
 
-                filename = file_path.name
+                    filename = file_path.name
+                    ext = file_path.suffix.lower()
+                    convert_seconds: float | None = None
 
-                # Convert non-Markdown files to Markdown
-                upload_path = file_path
-                upload_name = filename
-                if converter.needs_conversion(file_path):
-                    if on_progress:
-                        on_progress(i, total, filename, "converting")
-                    try:
-                        upload_path = converter.convert_file(file_path)
-                        upload_name = file_path.stem + ".md"
-                        converted += 1
-                        logger.info("Converted %s -> %s", filename, upload_name)
-                    except ConversionError as e:
+                    # The knowledge folder is flat: a recursive scan may find the same name twice
+                    if filename in seen_names:
                         failed += 1
-                        errors.append({"file": filename, "error": str(e)})
-                        logger.error("Conversion failed for %s: %s", filename, e.reason)
+                        errors.append({"file": str(file_path), "error": "Duplicate file name in source tree"})
+                        _record(history, on_result, file_path, "error", error="Duplicate file name in source tree")
+                        logger.error("Skipping %s: a file named %s was already uploaded", file_path, filename)
                         if on_progress:
                             on_progress(i + 1, total, filename, "error")
                         continue
+                    seen_names.add(filename)
 
-                if on_progress:
-                    on_progress(i, total, filename, "uploading")
+                    fingerprint = None
+                    if manifest is not None and skip_unchanged:
+                        with span("fingerprint", file=filename):
+                            fingerprint = converter.fingerprint(file_path)
+                        if manifest.unchanged(folder_id, filename, fingerprint, existing_files):
+                            unchanged += 1
+                            FILES.inc(stage="upload", format=ext, status="unchanged")
+                            _record(history, on_result, file_path, "unchanged")
+                            logger.info("Unchanged since last upload: %s", filename)
+                            if on_progress:
+                                on_progress(i + 1, total, filename, "unchanged")
+                            continue
 
-                try:
-                    # Delete existing file if replace mode is on
-                    if replace and upload_name in existing_files:
+                    # Convert non-Markdown files to Markdown
+                    upload_path = file_path
+                    upload_name = filename
+                    uploads = [(upload_path, upload_name)]
+                    is_converted = converter.needs_conversion(file_path)
+                    if is_converted:
+                        if on_progress:
+                            on_progress(i, total, filename, "converting")
+                        t0 = time.perf_counter()
                         try:
-                            self._km.delete_file(folder_id, existing_files[upload_name])
-                            logger.debug("Deleted existing file: %s", upload_name)
-                        except Exception as e:
-                            logger.warning("Could not delete existing %s: %s", upload_name, e)
-
-                    self._km.upload_file(folder_id, str(upload_path), filename=upload_name)
-                    success += 1
+                            upload_path = converter.convert_file(file_path)
+                            upload_name = file_path.stem + ".md"
+                            uploads = [(upload_path, upload_name)]
+                            if splitting:
+                                with span("split", file=filename) as args:
+                                    part_paths = converter.split_output(upload_path)
+                                    args["parts"] = len(part_paths)
+                                if len(part_paths) > 1:
+                                    uploads = [(p, p.name) for p in part_paths]
+                                    logger.info("Split %s into %d parts", upload_name, len(part_paths))
+                            converted += 1
+                            convert_seconds = time.perf_counter() - t0
+                            _observe("convert", ext, "success", convert_seconds, file_path.stat().st_size)
+                            logger.info("Converted %s -> %s", filename, upload_name)
+                        except ConversionError as e:
+                            failed += 1
+                            convert_seconds = time.perf_counter() - t0
+                            _observe("convert", ext, "error", convert_seconds)
+                            errors.append({"file": filename, "error": str(e)})
+                            _record(history, on_result, file_path, "error", convert_seconds, error=str(e))
+                            logger.error("Conversion failed for %s: %s", filename, e.reason)
+                            if on_progress:
+                                on_progress(i + 1, total, filename, "error")
+                            continue
 
                     if on_progress:
-                        on_progress(i + 1, total, filename, "success")
+                        on_progress(i, total, filename, "uploading")
 
-                except Exception as e:
-                    failed += 1
-                    error_msg = str(e)
-                    errors.append({"file": filename, "error": error_msg})
-                    logger.error("Upload failed for %s: %s", filename, error_msg)
+                    t0 = time.perf_counter()
+                    try:
+                        # Delete existing uploads of this file (including recorded parts) if replace mode is on
+                        if replace:
+                            replaced = {upload_name, *(name for _, name in uploads)}
+                            if manifest is not None:
+                                replaced.update(manifest.names(folder_id, filename))
+                            stale = sorted(n for n in replaced if n in existing_files)
+                            with span("delete", file=filename, files=len(stale)):
+                                for name in stale:
+                                    try:
+                                        self._km.delete_file(folder_id, existing_files.pop(name))
+                                        logger.debug("Deleted existing file: %s", name)
+                                    except Exception as e:
+                                        logger.warning("Could not delete existing %s: %s", name, e)
 
-                    if on_progress:
-                        on_progress(i + 1, total, filename, "error")
+                        size = sum(path.stat().st_size for path, _ in uploads)
+                        with span("upload", file=filename, ext=ext, bytes=size, parts=len(uploads)):
+                            if len(uploads) == 1:
+                                self._km.upload_file(folder_id, str(upload_path), filename=upload_name)
+                            else:
+                                self._upload_parts(folder_id, uploads)
+                        success += 1
+                        upload_seconds = time.perf_counter() - t0
+                        _observe("upload", ext, "success", upload_seconds, size)
+                        _record(history, on_result, file_path, "success", convert_seconds, upload_seconds)
+                        if manifest is not None:
+                            # Without a fingerprint only the names are kept (never counts as unchanged)
+                            manifest.record(folder_id, filename, fingerprint or "", [name for _, name in uploads])
+
+                        if on_progress:
+                            on_progress(i + 1, total, filename, "success")
 
-        finally:
-            converter.cleanup()
+                    except Exception as e:
+                        failed += 1
+                        if manifest is not None:
+                            manifest.forget(folder_id, filename)
+                        error_msg = str(e)
+                        _observe("upload", ext, "error", time.perf_counter() - t0)
+                        errors.append({"file": filename, "error": error_msg})
+                        _record(history, on_result, file_path, "error", convert_seconds, error=error_msg)
+                        logger.error("Upload failed for %s: %s", filename, error_msg)
+
+                        if on_progress:
+                            on_progress(i + 1, total, filename, "error")
+
+            finally:
+                QUEUE_DEPTH.set(0, queue="files")
+                scan.close()
+                converter.cleanup()
+                if manifest is not None:
+                    try:
+                        manifest.save()
+                    except OSError as e:
+                        logger.warning("Could not save upload manifest: %s", e)
 
         return {
-            "total": total,
+            "total": scan.found,
             "success": success,
             "failed": failed,
             "skipped": skipped,
+            "unchanged": unchanged,
             "converted": converted,
             "errors": errors,
         }
+
+    def _upload_parts(self, folder_id: str, parts: list[tuple[Path, str]]) -> None:
+        """Upload the parts of a split document concurrently; raises if any part failed."""
+        with ThreadPoolExecutor(max_workers=min(PART_UPLOAD_WORKERS, len(parts))) as pool:
+            # Each part runs in a copy of this context so that its span reaches the active tracer
+            futures = [
+                pool.submit(copy_context().run, self._upload_part, folder_id, path, name) for path, name in parts
+            ]
+        failures = [f"{name}: {f.exception()}" for (_, name), f in zip(parts, futures, strict=True) if f.exception()]
+        if failures:
+            raise RuntimeError("; ".join(failures))
+
+    def _upload_part(self, folder_id: str, path: Path, name: str) -> None:
+        with span("upload_part", file=name, bytes=path.stat().st_size):
+            self._km.upload_file(folder_id, str(path), filename=name)
@@ -0,0 +1,337 @@
+"""Counters and histograms of batch throughput, exported in the Prometheus/OpenMetrics text format.
+
+The process-wide :data:`registry` holds the importer's metrics. It can be
+written as a textfile for node_exporter's textfile collector
+(:func:`write_textfile`) or served on a local scrape endpoint
+(:func:`serve`).
+"""
+
+import logging
+import math
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Seconds; conversions of large spreadsheets and uploads of large documents take minutes
+DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric(ABC):
+    """A metric family; subclasses keep one value (or bucket set) per label set."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _labels(self, key: tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{n}="{_escape(v)}"' for n, v in zip(self.labelnames, key, strict=True)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def family_name(self, openmetrics: bool) -> str:
+        return self.name
+
+    @abstractmethod
+    def samples(self, openmetrics: bool) -> Iterator[str]:
+        """The sample lines of this family."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Drop all recorded values."""
+
+
+class Counter(_Metric):
+    """Monotonic count per label set; samples carry the ``_total`` suffix."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def family_name(self, openmetrics: bool) -> str:
+        # OpenMetrics names the family without the suffix, the Prometheus text format with it
+        return self.name if openmetrics else f"{self.name}_total"
+
+    def samples(self, openmetrics: bool) -> Iterator[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f"{self.name}_total{self._labels(key)} {_format_value(value)}"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """Current value per label set, e.g. a queue depth."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self, openmetrics: bool) -> Iterator[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{self._labels(key)} {_format_value(value)}"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: Iterable[float] = DURATION_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last), sum]
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return sum(entry[0]) if entry else 0
+
+    def samples(self, openmetrics: bool) -> Iterator[str]:
+        with self._lock:
+            values = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, n in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += n
+                le = "+Inf" if math.isinf(bound) else repr(float(bound))
+                labels = self._labels(key, f'le="{le}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_count{self._labels(key)} {cumulative}"
+            yield f"{self.name}_sum{self._labels(key)} {_format_value(total)}"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry:
+    """A set of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        metric = Gauge(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: Iterable[float] = DURATION_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.register(metric)
+        return metric
+
+    def render(self, openmetrics: bool = False) -> str:
+        """All metrics in the Prometheus text format, or in OpenMetrics (with ``# EOF``)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            family = metric.family_name(openmetrics)
+            lines.append(f"# HELP {family} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {family} {metric.kind}")
+            lines.extend(metric.samples(openmetrics))
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear all recorded values (metrics stay registered)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+registry = MetricsRegistry()
+
+FILES = registry.counter(
+    "knowledgeimporter_files",
+    "Files processed, by stage (convert, upload), source format and status",
+    ("stage", "format", "status"),
+)
+BYTES = registry.counter(
+    "knowledgeimporter_bytes",
+    "Bytes converted (source size) and uploaded (Markdown size), by stage and source format",
+    ("stage", "format"),
+)
+CONVERT_SECONDS = registry.histogram(
+    "knowledgeimporter_convert_duration_seconds",
+    "Conversion time per file, by source format",
+    ("format",),
+)
+UPLOAD_SECONDS = registry.histogram(
+    "knowledgeimporter_upload_duration_seconds",
+    "Upload time per file (replacing the old version and uploading all parts), by source format",
+    ("format",),
+)
+QUEUE_DEPTH = registry.gauge(
+    "knowledgeimporter_queue_depth",
+    "Items waiting: discovered files not yet processed, directories not yet scanned",
+    ("queue",),
+)
+CACHE_REQUESTS = registry.counter(
+    "knowledgeimporter_cache_requests",
+    "Cache lookups by cache and result (hit, miss)",
+    ("cache", "result"),
+)
+
+
+def write_textfile(path: str | Path, metrics: MetricsRegistry | None = None) -> Path:
+    """Write the metrics for node_exporter's textfile collector (atomically, via a temp file).
+
+    node_exporter only reads files ending in ``.prom``; the temp file is
+    renamed into place so a scrape never sees a partial file. The file is in
+    the Prometheus text format rather than OpenMetrics, because the textfile
+    collector parses only the former; OpenMetrics is served by the scrape
+    endpoint to clients that ask for it.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text((metrics or registry).render(), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+class MetricsServer:
+    """A local HTTP scrape endpoint (``/metrics``) on a daemon thread."""
+
+    def __init__(self, port: int, host: str = "127.0.0.1", metrics: MetricsRegistry | None = None) -> None:
+        source = metrics or registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                body = source.render(openmetrics).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug("metrics: " + format, *args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        logger.info("Serving metrics on http://%s:%d/metrics", host, self.port)
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+def serve(port: int, host: str = "127.0.0.1") -> MetricsServer:
+    """Start the scrape endpoint for the process-wide registry (port 0 picks a free port)."""
+    return MetricsServer(port, host)
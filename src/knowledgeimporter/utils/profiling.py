@@ -0,0 +1,183 @@
+"""Opt-in cProfile and tracemalloc hooks for upload batches and conversions.
+
+A :class:`BatchProfiler` writes its reports next to the upload log:
+
+- without a threshold, the whole batch is profiled: ``upload_<ts>.prof``
+  (open with ``snakeviz`` or ``python -m pstats``) and
+  ``upload_<ts>.alloc.txt`` (top allocations, tracemalloc);
+- with a threshold of N seconds, every conversion is profiled and only those
+  taking at least N seconds are kept, as ``upload_<ts>.<file>.prof`` and
+  ``upload_<ts>.<file>.alloc.txt``.
+
+cProfile sees the thread running the batch; work handed to other threads
+(sheet workers, part uploads) shows up as waiting time.
+"""
+
+import cProfile
+import logging
+import os
+import re
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "KNOWLEDGEIMPORTER_PROFILE"
+THRESHOLD_ENV = "KNOWLEDGEIMPORTER_PROFILE_THRESHOLD"
+# Frames kept per allocation; more frames cost more memory while tracing
+_TRACE_FRAMES = 5
+
+_current: ContextVar["BatchProfiler | None"] = ContextVar("knowledgeimporter_profiler", default=None)
+
+
+def profiling_settings(enabled: bool = False, threshold_seconds: float = 0.0) -> tuple[bool, float]:
+    """Apply the environment overrides to the configured settings.
+
+    ``KNOWLEDGEIMPORTER_PROFILE=1`` enables profiling (``0`` disables it),
+    ``KNOWLEDGEIMPORTER_PROFILE_THRESHOLD`` sets the per-conversion threshold.
+    """
+    env = os.environ.get(PROFILE_ENV, "").strip().lower()
+    if env:
+        enabled = env not in ("0", "false", "no", "off")
+    threshold_env = os.environ.get(THRESHOLD_ENV, "").strip()
+    if threshold_env:
+        try:
+            threshold_seconds = max(0.0, float(threshold_env))
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r", THRESHOLD_ENV, threshold_env)
+    return enabled, threshold_seconds
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name)
+
+
+def _enable(profile: cProfile.Profile) -> bool:
+    """Start profiling; False if another profiler is already active in this thread (Python 3.12+)."""
+    try:
+        profile.enable()
+    except ValueError as e:
+        logger.warning("Profiling not started: %s", e)
+        return False
+    return True
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Current allocations, without those of tracemalloc and the import machinery."""
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+
+
+class BatchProfiler:
+    """Profiles one batch (or its slow conversions) into files starting with base."""
+
+    def __init__(self, base: Path, threshold_seconds: float = 0.0, top: int = 25) -> None:
+        self.base = base
+        self.threshold_seconds = threshold_seconds
+        self.top = top
+        self.written: list[Path] = []
+        self._started_tracemalloc = False
+
+    @classmethod
+    def for_log(cls, log_file: Path, threshold_seconds: float = 0.0) -> "BatchProfiler":
+        """A profiler writing next to log_file (``upload_<ts>.log`` → ``upload_<ts>.prof``)."""
+        return cls(log_file.with_suffix(""), threshold_seconds)
+
+    @contextmanager
+    def batch(self) -> Iterator["BatchProfiler"]:
+        """Profile the block as the batch; conversions inside it report to this profiler."""
+        token = _current.set(self)
+        self._start_tracemalloc()
+        profile = cProfile.Profile() if not self.threshold_seconds else None
+        snapshot = _snapshot() if profile else None
+        if profile and not _enable(profile):
+            profile = None
+        try:
+            yield self
+        finally:
+            if profile:
+                profile.disable()
+                self._write(self.base, profile, snapshot)
+            self._stop_tracemalloc()
+            _current.reset(token)
+
+    @contextmanager
+    def conversion(self, name: str) -> Iterator[None]:
+        """Profile one conversion; reports are kept if it took at least the threshold."""
+        if not self.threshold_seconds:
+            yield
+            return
+        snapshot = _snapshot()
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        enabled = _enable(profile)
+        try:
+            yield
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - start
+            if enabled and elapsed >= self.threshold_seconds:
+                logger.info("Conversion of %s took %.2fs, writing profile", name, elapsed)
+                self._write(self.base.with_name(f"{self.base.name}.{_safe_name(name)}"), profile, snapshot)
+
+    def _start_tracemalloc(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(_TRACE_FRAMES)
+            self._started_tracemalloc = True
+
+    def _stop_tracemalloc(self) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _write(self, base: Path, profile: cProfile.Profile, before: tracemalloc.Snapshot | None) -> None:
+        prof_path = base.with_name(base.name + ".prof")
+        alloc_path = base.with_name(base.name + ".alloc.txt")
+        try:
+            profile.dump_stats(prof_path)
+            alloc_path.write_text(self._allocation_report(before), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not write profile %s: %s", prof_path.name, e)
+            return
+        self.written += [prof_path, alloc_path]
+
+    def _allocation_report(self, before: tracemalloc.Snapshot | None) -> str:
+        """Top allocations by source line: still allocated, and grown since before."""
+        snapshot = _snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Traced memory: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB", ""]
+        lines.append(f"Top {self.top} allocations by line:")
+        lines += [f"  {stat}" for stat in snapshot.statistics("lineno")[: self.top]]
+        if before is not None:
+            lines += ["", f"Top {self.top} growth during the profiled block:"]
+            lines += [f"  {stat}" for stat in snapshot.compare_to(before, "lineno")[: self.top]]
+        return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def profile_batch(profiler: BatchProfiler | None) -> Iterator[None]:
+    """Run the block under profiler (a no-op for None)."""
+    if profiler is None:
+        yield
+        return
+    with profiler.batch():
+        yield
+
+
+@contextmanager
+def profile_conversion(name: str) -> Iterator[None]:
+    """Profile a conversion under the active batch profiler; a no-op without one."""
+    profiler = _current.get()
+    if profiler is None:
+        yield
+        return
+    with profiler.conversion(name):
+        yield
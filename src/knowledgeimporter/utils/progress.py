@@ -0,0 +1,101 @@
+"""Coalescing of progress events into UI updates at a bounded rate."""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# 10 Hz: smooth enough for a progress bar, cheap for the Flet event loop
+DEFAULT_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class ProgressState:
+    """The latest progress event, plus counts over all events so far."""
+
+    current: int
+    total: int
+    filename: str
+    status: str
+    events: int
+    failed: int
+
+
+class ProgressAggregator:
+    """Pushes the latest progress state at most once per interval.
+
+    The first event after a quiet period is pushed at once; events within
+    the interval are coalesced into one trailing push of the latest state,
+    so the last event is never lost. ``push`` runs on the calling thread or
+    on a timer thread and must be thread-safe (e.g. ``page.run_task``).
+    """
+
+    def __init__(self, push: Callable[[ProgressState], None], interval: float = DEFAULT_INTERVAL) -> None:
+        self._push = push
+        self.interval = interval
+        self.events = 0
+        self.pushes = 0
+        self._failed = 0
+        self._latest: ProgressState | None = None
+        self._last_push = float("-inf")
+        self._timer: threading.Timer | None = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def update(self, current: int, total: int, filename: str, status: str) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self.events += 1
+            if status == "error":
+                self._failed += 1
+            self._latest = ProgressState(current, total, filename, status, self.events, self._failed)
+            if self._timer is not None:
+                return  # a trailing push is scheduled and will carry this state
+            wait = self._last_push + self.interval - time.monotonic()
+            if wait > 0:
+                self._timer = threading.Timer(wait, self._fire)
+                self._timer.daemon = True
+                self._timer.start()
+                return
+            state = self._take()
+        self._deliver(state)
+
+    def flush(self) -> None:
+        """Push a pending state now instead of at the next frame."""
+        with self._lock:
+            self._cancel_timer()
+            state = self._take()
+        self._deliver(state)
+
+    def close(self) -> None:
+        """Push a pending state, then ignore further events (e.g. once the batch finished)."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._cancel_timer()
+            state = self._take()
+        self._deliver(state)
+
+    def _fire(self) -> None:
+        with self._lock:
+            self._timer = None
+            state = self._take()
+        self._deliver(state)
+
+    def _take(self) -> ProgressState | None:
+        state, self._latest = self._latest, None
+        if state is not None:
+            self._last_push = time.monotonic()
+            self.pushes += 1
+        return state
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _deliver(self, state: ProgressState | None) -> None:
+        if state is not None:
+            self._push(state)
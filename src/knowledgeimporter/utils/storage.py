@@ -1,7 +1,12 @@
 """Config storage with encrypted API key management."""
 
+import hashlib
 import json
 import logging
+import os
+import threading
+import time
+from collections.abc import Callable
 
 import keyring
 from eq_chatbot_core.security.encryption import FernetEncryption
@@ -13,19 +18,120 @@ logger = logging.getLogger(__name__)
 KEYRING_SERVICE = "knowledgeimporter"
 KEYRING_KEY = "master_key"
 
+SECRET_FIELDS = ("langdock_api_key", "default_folder_id")
+
+# Config saves requested within this many seconds are written once
+CONFIG_SAVE_DELAY_SECONDS = 0.5
+
+# Keyring lookups can take seconds on some backends: the master key is read once
+# per process, and the ciphertext of each secret is kept so unchanged secrets are
+# not re-encrypted (Fernet tokens differ on every encryption). The plaintext is kept
+# next to its ciphertext for the lifetime of the process (or until
+# clear_secret_cache). Both are guarded by _secret_lock, reentrant because
+# _encrypt_secrets fetches the master key while holding it.
+_master_key: str | None = None
+_ciphertexts: dict[str, tuple[str, str]] = {}
+_secret_lock = threading.RLock()
+# Serializes writes from the UI thread and the debounce timer
+_write_lock = threading.Lock()
+_last_written: str | None = None
+
+# Successful validations are reused this long (seconds), so repeated clicks skip the API
+VALIDATION_CACHE_SECONDS = 60.0
+_validation_cache: dict[tuple[str, ...], tuple[float, int]] = {}
+_validation_lock = threading.Lock()
+
+
+def _validation_key(kind: str, api_key: str, *parts: str) -> tuple[str, ...]:
+    # Cache entries are keyed by a hash, so the cache holds no copy of the API key
+    return (kind, hashlib.sha256(api_key.encode()).hexdigest(), *parts)
+
+
+def _cached_validation(key: tuple[str, ...]) -> int | None:
+    with _validation_lock:
+        entry = _validation_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > VALIDATION_CACHE_SECONDS:
+            del _validation_cache[key]
+            return None
+        return entry[1]
+
+
+def _remember_validation(key: tuple[str, ...], value: int) -> None:
+    with _validation_lock:
+        _validation_cache[key] = (time.monotonic(), value)
+
+
+def clear_validation_cache() -> None:
+    """Forget cached validation results (e.g. after the API key changed)."""
+    with _validation_lock:
+        _validation_cache.clear()
+
+
+def clear_secret_cache() -> None:
+    """Forget the cached master key and ciphertexts (e.g. after the keyring entry changed)."""
+    global _master_key, _last_written
+    with _secret_lock:
+        _master_key = None
+        _ciphertexts.clear()
+    with _write_lock:
+        _last_written = None
+
 
 def get_or_create_master_key() -> str:
-    """Retrieve master encryption key from OS keyring, or create one if missing."""
-    key = keyring.get_password(KEYRING_SERVICE, KEYRING_KEY)
-    if key is None:
-        key = FernetEncryption.generate_key()
-        keyring.set_password(KEYRING_SERVICE, KEYRING_KEY, key)
-        logger.info("Generated new master encryption key")
-    return key
+    """Retrieve master encryption key from OS keyring, or create one if missing.
+
+    The key is cached for the lifetime of the process.
+    """
+    global _master_key
+    with _secret_lock:
+        if _master_key is not None:
+            return _master_key
+        key = keyring.get_password(KEYRING_SERVICE, KEYRING_KEY)
+        if key is None:
+            key = FernetEncryption.generate_key()
+            keyring.set_password(KEYRING_SERVICE, KEYRING_KEY, key)
+            logger.info("Generated new master encryption key")
+        _master_key = key
+        return key
+
+
+def _encrypt_secrets(data: dict) -> None:
+    """Replace the secret fields in data by their ciphertext, reusing it for unchanged values."""
+    enc: FernetEncryption | None = None
+    with _secret_lock:
+        for field in SECRET_FIELDS:
+            plain = data[field]
+            if not plain:
+                continue
+            cached = _ciphertexts.get(field)
+            if cached is not None and cached[0] == plain:
+                data[field] = cached[1]
+                continue
+            if enc is None:
+                enc = FernetEncryption(get_or_create_master_key())
+            data[field] = enc.encrypt_to_string(plain)
+            _ciphertexts[field] = (plain, data[field])
+
+
+def _stored_secrets() -> dict[str, str]:
+    """Encrypted secret fields of the config file as stored; empty if it cannot be read."""
+    try:
+        raw = json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    return {f: raw[f] for f in SECRET_FIELDS if isinstance(raw.get(f), str)}
 
 
-def load_config() -> AppConfig:
-    """Load config from disk. Decrypts the API key using the master key."""
+def load_config(decrypt: bool = True) -> AppConfig:
+    """Load config from disk. Decrypts the API key using the master key.
+
+    With ``decrypt=False`` the encrypted fields are left empty and the OS
+    keyring is not touched, for a fast first frame at startup.
+    """
     if not CONFIG_FILE.exists():
         return AppConfig()
 
@@ -35,14 +141,20 @@ def load_config() -> AppConfig:
         logger.warning("Failed to read config file: %s", e)
         return AppConfig()
 
-    fields_to_decrypt = [f for f in ("langdock_api_key", "default_folder_id") if raw.get(f, "")]
-    if fields_to_decrypt:
+    fields_to_decrypt = [f for f in SECRET_FIELDS if raw.get(f, "")]
+    if not decrypt:
+        for field in fields_to_decrypt:
+            raw[field] = ""
+    elif fields_to_decrypt:
         try:
             master_key = get_or_create_master_key()
             enc = FernetEncryption(master_key)
             for field in fields_to_decrypt:
                 try:
-                    raw[field] = enc.decrypt_from_string(raw[field])
+                    cipher = raw[field]
+                    raw[field] = enc.decrypt_from_string(cipher)
+                    with _secret_lock:
+                        _ciphertexts[field] = (raw[field], cipher)
                 except Exception as e:
                     logger.warning("Failed to decrypt %s: %s", field, e)
                     raw[field] = ""
@@ -54,33 +166,101 @@ def load_config() -> AppConfig:
     return AppConfig(**raw)
 
 
-def save_config(config: AppConfig) -> None:
-    """Save config to disk. Encrypts the API key before writing."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+def save_config(config: AppConfig, keep_secrets: bool = False) -> None:
+    """Save config to disk. Encrypts the API key before writing.
 
+    With ``keep_secrets`` the encrypted fields already on disk are kept
+    instead of those of config (e.g. when they could not be decrypted).
+    The file is replaced atomically via a temp file; a save identical to the
+    last one is skipped.
+    """
+    global _last_written
     data = config.model_dump()
+    if keep_secrets:
+        stored = _stored_secrets()
+        for field in SECRET_FIELDS:
+            data[field] = stored.get(field, "")
+    else:
+        _encrypt_secrets(data)
+    content = json.dumps(data, indent=2, ensure_ascii=False)
 
-    fields_to_encrypt = [f for f in ("langdock_api_key", "default_folder_id") if data[f]]
-    if fields_to_encrypt:
-        master_key = get_or_create_master_key()
-        enc = FernetEncryption(master_key)
-        for field in fields_to_encrypt:
-            data[field] = enc.encrypt_to_string(data[field])
-
-    CONFIG_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    with _write_lock:
+        if content == _last_written:
+            return
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = CONFIG_FILE.with_suffix(".tmp")
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, CONFIG_FILE)
+        _last_written = content
     logger.info("Config saved to %s", CONFIG_FILE)
 
 
+class ConfigWriter:
+    """Debounced config saves: a burst of requests is written once, with the latest config.
+
+    Each :meth:`schedule` restarts the delay. The timer thread is not a
+    daemon, so a pending save still completes when the app exits.
+    """
+
+    def __init__(
+        self, delay: float = CONFIG_SAVE_DELAY_SECONDS, save: Callable[[AppConfig], None] = save_config
+    ) -> None:
+        self.delay = delay
+        self._save = save
+        self._pending: AppConfig | None = None
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def schedule(self, config: AppConfig) -> None:
+        """Save a copy of config after the delay, replacing any pending save."""
+        with self._lock:
+            self._pending = config.model_copy(deep=True)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self._fire)
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write a pending save now; errors propagate to the caller."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            config, self._pending = self._pending, None
+        if config is not None:
+            self._save(config)
+
+    def _fire(self) -> None:
+        with self._lock:
+            self._timer = None
+            config, self._pending = self._pending, None
+        if config is None:
+            return
+        try:
+            self._save(config)
+        except Exception as e:
+            logger.warning("Failed to auto-save config: %s", e)
+
+
 def validate_folder(api_key: str, folder_id: str, region: str = "eu") -> tuple[bool, int]:
-    """Validate a folder by listing its files. Returns (is_valid, file_count)."""
+    """Validate a folder by listing its files. Returns (is_valid, file_count).
+
+    Successful results are cached for :data:`VALIDATION_CACHE_SECONDS`.
+    """
     if not api_key or not folder_id:
         return False, 0
 
+    key = _validation_key("folder", api_key, folder_id, region)
+    cached = _cached_validation(key)
+    if cached is not None:
+        return True, cached
+
     try:
         from eq_chatbot_core.providers.langdock_provider import LangDockKnowledgeManager
 
         km = LangDockKnowledgeManager(api_key=api_key)
         files = km.list_files(folder_id)
+        _remember_validation(key, len(files))
         return True, len(files)
     except Exception as e:
         logger.warning("Folder validation failed: %s", e)
@@ -88,20 +268,26 @@ def validate_folder(api_key: str, folder_id: str, region: str = "eu") -> tuple[b
 
 
 def test_api_connection(api_key: str) -> bool:
-    """Test if the API key is valid by attempting a basic API call."""
+    """Test if the API key is valid by attempting a basic API call (successes are cached)."""
     if not api_key:
         return False
 
+    key = _validation_key("connection", api_key)
+    if _cached_validation(key) is not None:
+        return True
+
     try:
         import httpx
         from eq_chatbot_core.providers.langdock_provider import LangDockKnowledgeManager
 
         km = LangDockKnowledgeManager(api_key=api_key)
         km.list_files("00000000-0000-0000-0000-000000000000")
+        _remember_validation(key, 0)
         return True
     except httpx.HTTPStatusError as e:
         # 404 = key works, folder doesn't exist — that's fine
         if e.response.status_code == 404:
+            _remember_validation(key, 0)
             return True
         # 401/403 = invalid API key
         return False
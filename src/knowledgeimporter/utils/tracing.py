@@ -0,0 +1,127 @@
+"""Lightweight tracing spans for conversion and upload stages.
+
+Spans are recorded only while a :class:`Tracer` is active (see
+:func:`activate`); otherwise :func:`span` costs a context-variable lookup.
+A batch's spans can be exported as a Chrome trace (``chrome://tracing``,
+Perfetto) and summed per file for the upload log.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+_current: ContextVar["Tracer | None"] = ContextVar("knowledgeimporter_tracer", default=None)
+
+
+@dataclass(slots=True)
+class Span:
+    """A finished span; times in nanoseconds relative to the tracer's start."""
+
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """Collects spans from any thread of one batch."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        # Self seconds per stage and file, kept as spans finish so breakdown() does not scan all spans
+        self._totals: dict[str, dict[str, float]] = {}
+        # Per thread: nanoseconds spent in finished child spans of each open span
+        self._open = threading.local()
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[dict[str, Any]]:
+        """Time the block; the yielded dict takes further args (e.g. byte counts)."""
+        stack: list[int] = self._open.__dict__.setdefault("stack", [])
+        stack.append(0)
+        start = time.perf_counter_ns()
+        try:
+            yield args
+        finally:
+            end = time.perf_counter_ns()
+            duration = end - start
+            child_ns = stack.pop()
+            if stack:
+                stack[-1] += duration
+            record = Span(name, start - self._origin, duration, threading.get_native_id(), args)
+            file = args.get("file")
+            with self._lock:
+                self.spans.append(record)
+                if file is not None:
+                    totals = self._totals.setdefault(file, {})
+                    totals[name] = totals.get(name, 0.0) + (duration - child_ns) / 1e9
+
+    def breakdown(self, file: str) -> dict[str, float]:
+        """Seconds per stage spent on file, summed over its finished spans.
+
+        Each stage counts its self time: nested spans of the same thread (e.g.
+        ``extract`` within ``convert``) are subtracted from their parent, so
+        the stages add up to the time spent on the file.
+        """
+        with self._lock:
+            return dict(self._totals.get(file, {}))
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Spans as Chrome trace complete events (microsecond timestamps)."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        events = [
+            {
+                "name": s.name,
+                "cat": "knowledgeimporter",
+                "ph": "X",
+                "ts": s.start_ns / 1000,
+                "dur": s.duration_ns / 1000,
+                "pid": pid,
+                "tid": s.thread_id,
+                "args": s.args,
+            }
+            for s in sorted(spans, key=lambda s: s.start_ns)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        """Write the Chrome trace JSON to path."""
+        path.write_text(json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8")
+        return path
+
+
+@contextmanager
+def activate(tracer: Tracer | None) -> Iterator[Tracer | None]:
+    """Make tracer the target of :func:`span` in this context (None disables tracing)."""
+    token = _current.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def span(name: str, **args: Any) -> Iterator[dict[str, Any]]:
+    """Record a span on the active tracer; a no-op without one."""
+    tracer = _current.get()
+    if tracer is None:
+        yield args
+        return
+    with tracer.span(name, **args) as span_args:
+        yield span_args
+
+
+def format_breakdown(timings: dict[str, float]) -> str:
+    """``extract 0.12s, markdown 0.30s, upload 1.05s`` for the upload log."""
+    return ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
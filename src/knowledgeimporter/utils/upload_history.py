@@ -0,0 +1,249 @@
+"""Local SQLite history of upload sessions and per-file outcomes."""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from knowledgeimporter.models.config import CONFIG_DIR, AppConfig
+
+logger = logging.getLogger(__name__)
+
+HISTORY_FILE = CONFIG_DIR / "history.sqlite3"
+# VACUUM once this share of the database file is free pages
+_VACUUM_FREE_RATIO = 0.25
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    source_dir TEXT NOT NULL,
+    folder_id TEXT NOT NULL,
+    log_file TEXT,
+    total INTEGER,
+    success INTEGER,
+    failed INTEGER,
+    skipped INTEGER,
+    unchanged INTEGER,
+    converted INTEGER
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    recorded_at REAL NOT NULL,
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    ext TEXT NOT NULL,
+    status TEXT NOT NULL,
+    bytes INTEGER,
+    convert_seconds REAL,
+    upload_seconds REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions(started_at);
+CREATE INDEX IF NOT EXISTS idx_files_session ON files(session_id);
+-- "slowest formats last N days": successful files by time
+CREATE INDEX IF NOT EXISTS idx_files_status_time ON files(status, recorded_at);
+-- "files failing repeatedly": failures per path
+CREATE INDEX IF NOT EXISTS idx_files_path_status ON files(path, status, recorded_at);
+"""
+
+
+@dataclass
+class FormatStats:
+    """Throughput of one file extension."""
+
+    ext: str
+    files: int
+    total_bytes: int
+    avg_convert_seconds: float
+    avg_upload_seconds: float
+    bytes_per_second: float
+
+
+@dataclass
+class FailingFile:
+    """A source file that failed in several sessions."""
+
+    path: str
+    failures: int  # sessions in which the file failed
+    last_failure: float
+    last_error: str | None
+
+
+class HistorySession:
+    """Recorder for one upload session, handed to ``UploadService.upload_batch``."""
+
+    def __init__(self, history: "UploadHistory", session_id: int) -> None:
+        self.history = history
+        self.id = session_id
+
+    def record_file(
+        self,
+        path: Path,
+        status: str,
+        size: int | None = None,
+        convert_seconds: float | None = None,
+        upload_seconds: float | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Record the outcome of one file ("success", "error", "unchanged").
+
+        A failing history database is logged but never fails the upload.
+        """
+        try:
+            self.history.record_file(self.id, path, status, size, convert_seconds, upload_seconds, error)
+        except sqlite3.Error as e:
+            logger.warning("Could not record %s in upload history: %s", path.name, e)
+
+    def finish(self, result: dict) -> None:
+        try:
+            self.history.finish_session(self.id, result)
+        except sqlite3.Error as e:
+            logger.warning("Could not finish upload history session: %s", e)
+
+
+class UploadHistory:
+    """Sessions and per-file outcomes, queryable across months.
+
+    One connection is shared by the UI and the upload thread, serialized by
+    a lock. Opening applies the retention (``retention_days``, 0 keeps
+    everything; by default the AppConfig default) and compacts the file
+    when much of it is free space.
+    """
+
+    def __init__(self, path: Path | None = None, retention_days: int | None = None) -> None:
+        if retention_days is None:
+            retention_days = AppConfig.model_fields["history_retention_days"].default
+        self.path = path or HISTORY_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        if retention_days > 0:
+            self.prune(retention_days)
+            self.compact()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def start_session(self, source_dir: str, folder_id: str, log_file: Path | None = None) -> HistorySession:
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT INTO sessions (started_at, source_dir, folder_id, log_file) VALUES (?, ?, ?, ?)",
+                (time.time(), source_dir, folder_id, str(log_file) if log_file else None),
+            )
+        return HistorySession(self, int(cur.lastrowid or 0))
+
+    def finish_session(self, session_id: int, result: dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sessions SET finished_at = ?, total = ?, success = ?, failed = ?, skipped = ?,"
+                " unchanged = ?, converted = ? WHERE id = ?",
+                (
+                    time.time(),
+                    result.get("total", 0),
+                    result.get("success", 0),
+                    result.get("failed", 0),
+                    result.get("skipped", 0),
+                    result.get("unchanged", 0),
+                    result.get("converted", 0),
+                    session_id,
+                ),
+            )
+
+    def record_file(
+        self,
+        session_id: int,
+        path: Path,
+        status: str,
+        size: int | None = None,
+        convert_seconds: float | None = None,
+        upload_seconds: float | None = None,
+        error: str | None = None,
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO files (session_id, recorded_at, path, name, ext, status, bytes,"
+                " convert_seconds, upload_seconds, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    session_id,
+                    time.time(),
+                    str(path),
+                    path.name,
+                    path.suffix.lower(),
+                    status,
+                    size,
+                    convert_seconds,
+                    upload_seconds,
+                    error,
+                ),
+            )
+
+    def slowest_formats(self, days: int = 30, limit: int = 10) -> list[FormatStats]:
+        """Extensions with the lowest throughput among successful files of the last days."""
+        since = time.time() - days * 86400
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT ext, COUNT(*), COALESCE(SUM(bytes), 0), AVG(COALESCE(convert_seconds, 0)),"
+                " AVG(COALESCE(upload_seconds, 0)),"
+                " SUM(COALESCE(convert_seconds, 0) + COALESCE(upload_seconds, 0))"
+                " FROM files WHERE status = 'success' AND recorded_at >= ? GROUP BY ext",
+                (since,),
+            ).fetchall()
+        stats = [
+            FormatStats(ext, n, total, conv, up, total / seconds if seconds else 0.0)
+            for ext, n, total, conv, up, seconds in rows
+        ]
+        return sorted(stats, key=lambda s: s.bytes_per_second)[:limit]
+
+    def failing_files(self, min_failures: int = 2, days: int = 30) -> list[FailingFile]:
+        """Files that failed in at least min_failures sessions in the last days, most failures first.
+
+        Repeated error rows of one file within one session count once.
+        """
+        since = time.time() - days * 86400
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, COUNT(DISTINCT session_id), MAX(recorded_at),"
+                " (SELECT error FROM files AS last WHERE last.path = f.path AND last.status = 'error'"
+                "  ORDER BY recorded_at DESC, id DESC LIMIT 1)"
+                " FROM files AS f WHERE status = 'error' AND recorded_at >= ?"
+                " GROUP BY path HAVING COUNT(DISTINCT session_id) >= ?"
+                " ORDER BY COUNT(DISTINCT session_id) DESC, MAX(recorded_at) DESC",
+                (since, min_failures),
+            ).fetchall()
+        return [FailingFile(*row) for row in rows]
+
+    def recent_sessions(self, limit: int = 20) -> list[dict]:
+        with self._lock:
+            cur = self._conn.execute("SELECT * FROM sessions ORDER BY started_at DESC LIMIT ?", (limit,))
+            names = [d[0] for d in cur.description]
+            return [dict(zip(names, row, strict=True)) for row in cur.fetchall()]
+
+    def prune(self, retention_days: int) -> int:
+        """Delete sessions (and their files) older than retention_days. Returns the count."""
+        cutoff = time.time() - retention_days * 86400
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM sessions WHERE started_at < ?", (cutoff,))
+        if cur.rowcount:
+            logger.info("Pruned %d upload session(s) from history", cur.rowcount)
+        return cur.rowcount
+
+    def compact(self, force: bool = False) -> bool:
+        """VACUUM when free pages make up a large share of the file (or when forced)."""
+        with self._lock:
+            pages = self._conn.execute("PRAGMA page_count").fetchone()[0]
+            free = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if not force and (not pages or free / pages < _VACUUM_FREE_RATIO):
+                self._conn.execute("PRAGMA optimize")
+                return False
+            self._conn.execute("VACUUM")
+        return True
@@ -2,6 +2,8 @@
 
 import logging
 import os
+import queue
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -12,6 +14,10 @@ logger = logging.getLogger(__name__)
 
 LOG_DIR = CONFIG_DIR / "logs"
 DEFAULT_RETENTION_DAYS = 7
+# UploadLogWriter: seconds between flushes, size at which the log rotates, rotated files kept
+FLUSH_INTERVAL = 0.5
+MAX_LOG_BYTES = 10 * 1024 * 1024
+LOG_BACKUPS = 5
 
 
 def get_log_dir() -> Path:
@@ -39,6 +45,139 @@ def append_log(log_file: Path, message: str) -> None:
         f.write(f"[{timestamp}] {message}\n")
 
 
+class UploadLogWriter:
+    """Queue-backed writer for one upload log, fed from any number of threads.
+
+    :meth:`write` only timestamps and enqueues the line; a writer thread
+    appends queued lines in batches through one open file handle and
+    flushes every ``flush_interval`` seconds, on :meth:`flush` and on
+    :meth:`close`. Above ``max_bytes`` the log rotates like
+    ``logging.handlers.RotatingFileHandler``: the path stays the same, older
+    content moves to ``<log>.1`` … ``<log>.<backups>``.
+    """
+
+    def __init__(
+        self,
+        log_file: Path,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_bytes: int = MAX_LOG_BYTES,
+        backups: int = LOG_BACKUPS,
+    ) -> None:
+        self.path = log_file
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._queue: queue.SimpleQueue[str | threading.Event | None] = queue.SimpleQueue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="upload-log", daemon=True)
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """Append a timestamped message (same format as :func:`append_log`)."""
+        line = f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n"
+        with self._lock:
+            if not self._closed:
+                self._queue.put(line)
+                return
+        # Late messages (e.g. a cancel after the batch ended) are written directly
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def flush(self) -> None:
+        """Block until every message written so far is on disk."""
+        done = threading.Event()
+        with self._lock:
+            if self._closed:
+                return
+            self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        """Write the remaining messages and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def finalize(self, result: dict) -> None:
+        """Close the writer and append the batch summary (see :func:`finalize_log`)."""
+        self.close()
+        finalize_log(self.path, result)
+
+    def _run(self) -> None:
+        f = None
+        try:
+            f = open(self.path, "a", encoding="utf-8")
+            size = self.path.stat().st_size
+            last_flush = time.monotonic()
+            running = True
+            while running:
+                try:
+                    items = [self._queue.get(timeout=self.flush_interval)]
+                except queue.Empty:
+                    items = []
+                # Drain what else is queued into the same write
+                while True:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                lines: list[str] = []
+                waiters: list[threading.Event] = []
+                for item in items:
+                    if item is None:
+                        running = False
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        lines.append(item)
+
+                if lines:
+                    chunk = "".join(lines)
+                    chunk_bytes = len(chunk.encode("utf-8"))
+                    if size and size + chunk_bytes > self.max_bytes:
+                        f.close()
+                        self._rotate()
+                        f = open(self.path, "a", encoding="utf-8")
+                        header = "# KnowledgeImporter Upload Log (continued)\n"
+                        f.write(header)
+                        size = len(header)
+                    f.write(chunk)
+                    size += chunk_bytes
+                if waiters or not running or time.monotonic() - last_flush >= self.flush_interval:
+                    f.flush()
+                    last_flush = time.monotonic()
+                for waiter in waiters:
+                    waiter.set()
+        except Exception as e:
+            logger.error("Upload log writer failed: %s", e)
+            with self._lock:
+                self._closed = True
+            # Release flush() callers; lines still queued are lost
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if isinstance(item, threading.Event):
+                    item.set()
+        finally:
+            if f is not None:
+                f.close()
+
+    def _rotate(self) -> None:
+        """Shift <log>.1 … to <log>.2 …, dropping the oldest, and move the log to <log>.1."""
+        for n in range(self.backups - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{n}")
+            if src.exists():
+                os.replace(src, self.path.with_name(f"{self.path.name}.{n + 1}"))
+        if self.backups > 0:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+
 def finalize_log(log_file: Path, result: dict) -> None:
     """Write summary to the log file."""
     total = result.get("total", 0)
@@ -46,6 +185,7 @@ def finalize_log(log_file: Path, result: dict) -> None:
     failed = result.get("failed", 0)
     skipped = result.get("skipped", 0)
     converted = result.get("converted", 0)
+    unchanged = result.get("unchanged", 0)
 
     with open(log_file, "a", encoding="utf-8") as f:
         f.write(f"\n# {'=' * 60}\n")
@@ -53,6 +193,8 @@ def finalize_log(log_file: Path, result: dict) -> None:
         summary = f"# Total: {total} | Success: {success} | Failed: {failed} | Skipped: {skipped}"
         if converted > 0:
             summary += f" | Converted: {converted}"
+        if unchanged > 0:
+            summary += f" | Unchanged: {unchanged}"
         f.write(summary + "\n")
 
     errors = result.get("errors", [])
@@ -63,13 +205,24 @@ def finalize_log(log_file: Path, result: dict) -> None:
                 f.write(f"#   - {err}\n")
 
 
+def trace_path(log_file: Path) -> Path:
+    """Path of the Chrome trace written next to an upload log."""
+    return log_file.with_suffix(".trace.json")
+
+
 def cleanup_old_logs(retention_days: int = DEFAULT_RETENTION_DAYS) -> int:
-    """Delete log files older than retention_days. Returns count of deleted files."""
+    """Delete log, trace and profile files older than retention_days. Returns count of deleted files."""
     log_dir = get_log_dir()
     cutoff = time.time() - (retention_days * 86400)
     deleted = 0
 
-    for log_file in log_dir.glob("upload_*.log"):
+    for log_file in [
+        *log_dir.glob("upload_*.log"),
+        *log_dir.glob("upload_*.log.*"),
+        *log_dir.glob("upload_*.trace.json"),
+        *log_dir.glob("upload_*.prof"),
+        *log_dir.glob("upload_*.alloc.txt"),
+    ]:
         try:
             if log_file.stat().st_mtime < cutoff:
                 log_file.unlink()
@@ -84,9 +237,8 @@ def cleanup_old_logs(retention_days: int = DEFAULT_RETENTION_DAYS) -> int:
 
 def get_latest_log() -> Path | None:
     """Return the most recent log file, or None if no logs exist."""
-    log_dir = get_log_dir()
-    logs = sorted(log_dir.glob("upload_*.log"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return logs[0] if logs else None
+    # Names carry a sortable timestamp, so no file needs to be stat'ed
+    return max(get_log_dir().glob("upload_*.log"), default=None)
 
 
 def open_log_in_editor(log_file: Path) -> None:
@@ -0,0 +1,63 @@
+"""Record of uploaded fingerprints, to skip re-uploading unchanged files."""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+from knowledgeimporter.models.config import CONFIG_DIR
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = CONFIG_DIR / "uploads.json"
+
+
+class UploadManifest:
+    """Fingerprint and upload names of every file uploaded per knowledge folder.
+
+    The names also tell replace mode which uploads (e.g. parts) belong to a
+    file. An empty fingerprint records only the names. Stored as ``{folder_id: {filename: {"fingerprint": ..., "names": [...]}}}``.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or MANIFEST_FILE
+        self._folders: dict[str, dict[str, dict]] = {}
+        self._dirty = False
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if isinstance(data, dict):
+                    self._folders = data
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning("Failed to read upload manifest: %s", e)
+
+    def unchanged(self, folder_id: str, filename: str, fingerprint: str, existing: set[str] | dict[str, str]) -> bool:
+        """True if filename was uploaded with this fingerprint and all its uploads still exist."""
+        entry = self._folders.get(folder_id, {}).get(filename)
+        if not entry or not fingerprint or entry.get("fingerprint") != fingerprint:
+            return False
+        names = entry.get("names") or []
+        return bool(names) and all(name in existing for name in names)
+
+    def names(self, folder_id: str, filename: str) -> list[str]:
+        """Upload names recorded for filename (empty if unknown)."""
+        entry = self._folders.get(folder_id, {}).get(filename)
+        return list(entry.get("names") or []) if entry else []
+
+    def record(self, folder_id: str, filename: str, fingerprint: str, names: list[str]) -> None:
+        self._folders.setdefault(folder_id, {})[filename] = {"fingerprint": fingerprint, "names": names}
+        self._dirty = True
+
+    def forget(self, folder_id: str, filename: str) -> None:
+        if self._folders.get(folder_id, {}).pop(filename, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest if it changed (atomically, via a temp file)."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._folders, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._dirty = False
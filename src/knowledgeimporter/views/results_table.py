@@ -0,0 +1,160 @@
+"""Per-file results table of the upload view, rendering only the visible rows."""
+
+import flet as ft
+
+from knowledgeimporter.models.upload_results import FileResult, UploadResults
+
+# Rows materialized as controls; scrolling re-fills them from the model
+VISIBLE_ROWS = 15
+
+_STATUS_ICONS = {
+    "success": (ft.Icons.CHECK_CIRCLE, ft.Colors.GREEN),
+    "error": (ft.Icons.ERROR, ft.Colors.ERROR),
+    "unchanged": (ft.Icons.REMOVE_CIRCLE_OUTLINE, ft.Colors.OUTLINE),
+}
+
+
+def _format_size(size: int | None) -> str:
+    if size is None:
+        return ""
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def _format_seconds(seconds: float | None) -> str:
+    return f"{seconds:.2f}s" if seconds is not None else ""
+
+
+class _Row:
+    """One reusable table row."""
+
+    def __init__(self) -> None:
+        self.icon = ft.Icon(ft.Icons.CIRCLE, size=16)
+        self.name = ft.Text("", size=12, expand=3, max_lines=1, overflow=ft.TextOverflow.ELLIPSIS)
+        self.size = ft.Text("", size=12, width=80, text_align=ft.TextAlign.RIGHT)
+        self.convert = ft.Text("", size=12, width=70, text_align=ft.TextAlign.RIGHT)
+        self.upload = ft.Text("", size=12, width=70, text_align=ft.TextAlign.RIGHT)
+        self.error = ft.Text(
+            "", size=12, expand=4, max_lines=1, overflow=ft.TextOverflow.ELLIPSIS, color=ft.Colors.ERROR
+        )
+        self.control = ft.Row(
+            controls=[self.icon, self.name, self.size, self.convert, self.upload, self.error],
+            spacing=10,
+            height=24,
+            visible=False,
+        )
+
+    def show(self, result: FileResult | None) -> None:
+        if result is None:
+            self.control.visible = False
+            return
+        icon, color = _STATUS_ICONS.get(result.status, (ft.Icons.CIRCLE, None))
+        self.icon.icon = icon
+        self.icon.color = color
+        self.name.value = result.name
+        self.name.tooltip = result.path
+        self.size.value = _format_size(result.size)
+        self.convert.value = _format_seconds(result.convert_seconds)
+        self.upload.value = _format_seconds(result.upload_seconds)
+        self.error.value = result.error or ""
+        self.error.tooltip = result.error
+        self.control.visible = True
+
+
+class ResultsTable:
+    """Status, size, durations and error of every file, with a failed-only filter and search.
+
+    Only :data:`VISIBLE_ROWS` row controls exist, whatever the number of
+    results; the position slider selects which window of the filtered
+    results they show. While the window is at the end, it follows new
+    results. :meth:`refresh` updates the controls; the caller updates the page.
+    """
+
+    def __init__(self, results: UploadResults, page: ft.Page) -> None:
+        self.results = results
+        self.page = page
+        self._offset = 0
+        self._follow = True
+        self._rows = [_Row() for _ in range(VISIBLE_ROWS)]
+
+        self._failed_only = ft.Checkbox(label="Failed only", value=False, on_change=self._on_filter)
+        self._search = ft.TextField(
+            hint_text="Search files and errors",
+            prefix_icon=ft.Icons.SEARCH,
+            dense=True,
+            width=260,
+            on_change=self._on_filter,
+        )
+        self._summary = ft.Text("", size=12)
+        self._position = ft.Slider(min=0, max=1, value=0, expand=True, on_change=self._on_position)
+        self._prev_btn = ft.IconButton(ft.Icons.KEYBOARD_ARROW_UP, tooltip="Previous page", on_click=self._on_prev)
+        self._next_btn = ft.IconButton(ft.Icons.KEYBOARD_ARROW_DOWN, tooltip="Next page", on_click=self._on_next)
+        self.control = ft.Column(
+            controls=[
+                ft.Row(controls=[self._search, self._failed_only, self._summary], spacing=15),
+                ft.Row(
+                    controls=[
+                        ft.Text("File", size=12, weight=ft.FontWeight.W_600, expand=3),
+                        ft.Text("Size", size=12, weight=ft.FontWeight.W_600, width=80, text_align=ft.TextAlign.RIGHT),
+                        ft.Text(
+                            "Convert", size=12, weight=ft.FontWeight.W_600, width=70, text_align=ft.TextAlign.RIGHT
+                        ),
+                        ft.Text("Upload", size=12, weight=ft.FontWeight.W_600, width=70, text_align=ft.TextAlign.RIGHT),
+                        ft.Text("Error", size=12, weight=ft.FontWeight.W_600, expand=4),
+                    ],
+                    spacing=10,
+                ),
+                *(row.control for row in self._rows),
+                ft.Row(controls=[self._prev_btn, self._position, self._next_btn]),
+            ],
+            spacing=2,
+            visible=False,
+        )
+
+    def refresh(self) -> None:
+        """Show the current window of the filtered results."""
+        count = len(self.results)
+        last_page = max(0, count - VISIBLE_ROWS)
+        if self._follow or self._offset > last_page:
+            self._offset = last_page
+        window = self.results.window(self._offset, VISIBLE_ROWS)
+        for i, row in enumerate(self._rows):
+            row.show(window[i] if i < len(window) else None)
+
+        self._position.max = max(1, last_page)
+        self._position.value = self._offset
+        self._position.disabled = last_page == 0
+        self._prev_btn.disabled = self._offset == 0
+        self._next_btn.disabled = self._offset >= last_page
+        shown = f"{self._offset + 1}–{self._offset + len(window)} of {count}" if window else "No matching files"
+        self._summary.value = f"{shown} ({self.results.total} files, {self.results.failed} failed)"
+        self.control.visible = self.results.total > 0
+
+    def reset(self) -> None:
+        self.results.clear()
+        self._offset = 0
+        self._follow = True
+        self.refresh()
+
+    def _scroll_to(self, offset: int) -> None:
+        last_page = max(0, len(self.results) - VISIBLE_ROWS)
+        self._offset = min(max(0, offset), last_page)
+        self._follow = self._offset >= last_page
+        self.refresh()
+        self.page.update()
+
+    def _on_filter(self, _e: ft.ControlEvent) -> None:
+        self.results.set_filter(failed_only=bool(self._failed_only.value), query=self._search.value or "")
+        self._scroll_to(0)
+
+    def _on_position(self, e: ft.ControlEvent) -> None:
+        self._scroll_to(int(float(e.control.value or 0)))
+
+    def _on_prev(self, _e: ft.ControlEvent) -> None:
+        self._scroll_to(self._offset - VISIBLE_ROWS)
+
+    def _on_next(self, _e: ft.ControlEvent) -> None:
+        self._scroll_to(self._offset + VISIBLE_ROWS)
@@ -6,10 +6,19 @@ from collections.abc import Callable
 import flet as ft
 
 from knowledgeimporter.models.config import AppConfig
+from knowledgeimporter.utils.worker import BackgroundWorker
 
 logger = logging.getLogger(__name__)
 
 
+def _non_negative_int(value: str | None) -> int:
+    """Parse a numeric field; empty or invalid input means 0 (off)."""
+    try:
+        return max(0, int((value or "0").strip()))
+    except ValueError:
+        return 0
+
+
 class SettingsView:
     """Settings screen for configuring API key, folder, and upload options."""
 
@@ -23,6 +32,9 @@ class SettingsView:
         self.page = page
         self._on_config_saved = on_config_saved
         self._api_key_visible = False
+        # Network checks run off the UI thread; a second click while one runs is ignored
+        self._connection_worker = BackgroundWorker()
+        self._folder_worker = BackgroundWorker()
 
         # Controls
         self._api_key_field = ft.TextField(
@@ -63,6 +75,37 @@ class SettingsView:
             label="Replace existing files on upload",
             value=config.replace_existing,
         )
+        self._recursive_checkbox = ft.Checkbox(
+            label="Include subfolders (.gitignore / .knowledgeignore respected)",
+            value=config.recursive_scan,
+        )
+        self._skip_unchanged_checkbox = ft.Checkbox(
+            label="Skip files unchanged since last upload",
+            value=config.skip_unchanged,
+        )
+        self._validation_dropdown = ft.Dropdown(
+            label="Conversion Validation",
+            value=config.validation_mode,
+            width=300,
+            options=[
+                ft.dropdown.Option("full", "Full"),
+                ft.dropdown.Option("sampled", "Sampled (faster)"),
+            ],
+        )
+        self._part_size_field = ft.TextField(
+            label="Split above (MB)",
+            value=str(config.max_part_size_mb),
+            width=145,
+            hint_text="0 = off",
+            keyboard_type=ft.KeyboardType.NUMBER,
+        )
+        self._part_sections_field = ft.TextField(
+            label="Max sections/part",
+            value=str(config.max_part_sections),
+            width=145,
+            hint_text="0 = off",
+            keyboard_type=ft.KeyboardType.NUMBER,
+        )
         self._connection_status = ft.Text("", size=13)
         self._folder_status = ft.Text("", size=13)
 
@@ -108,6 +151,10 @@ class SettingsView:
                 ft.Text("Upload Preferences", size=16, weight=ft.FontWeight.W_600),
                 self._patterns_field,
                 self._replace_checkbox,
+                self._recursive_checkbox,
+                self._skip_unchanged_checkbox,
+                self._validation_dropdown,
+                ft.Row(controls=[self._part_size_field, self._part_sections_field], spacing=10),
                 ft.Divider(),
                 # Action Buttons
                 ft.Row(
@@ -136,20 +183,31 @@ class SettingsView:
         )
 
     def _build_config_from_fields(self) -> AppConfig:
-        """Create an AppConfig from the current field values."""
+        """Create an AppConfig from the current field values.
+
+        Settings without a field here (XLSX workers, history, metrics, profiling) keep
+        their current values.
+        """
         patterns_raw = self._patterns_field.value or "*.md"
         patterns = [p.strip() for p in patterns_raw.split(",") if p.strip()]
         if not patterns:
             patterns = ["*.md"]
 
-        return AppConfig(
-            langdock_api_key=self._api_key_field.value or "",
-            region=self._region_dropdown.value or "eu",
-            default_folder_id=self._folder_id_field.value or "",
-            folder_name=self._folder_name_field.value or "",
-            last_source_dir=self.config.last_source_dir,
-            file_patterns=patterns,
-            replace_existing=self._replace_checkbox.value or False,
+        return AppConfig.model_validate(
+            {
+                **self.config.model_dump(),
+                "langdock_api_key": self._api_key_field.value or "",
+                "region": self._region_dropdown.value or "eu",
+                "default_folder_id": self._folder_id_field.value or "",
+                "folder_name": self._folder_name_field.value or "",
+                "file_patterns": patterns,
+                "replace_existing": self._replace_checkbox.value or False,
+                "recursive_scan": self._recursive_checkbox.value or False,
+                "skip_unchanged": self._skip_unchanged_checkbox.value or False,
+                "validation_mode": self._validation_dropdown.value or "full",
+                "max_part_size_mb": _non_negative_int(self._part_size_field.value),
+                "max_part_sections": _non_negative_int(self._part_sections_field.value),
+            }
         )
 
     def _save_settings(self, _e: ft.ControlEvent) -> None:
@@ -164,6 +222,11 @@ class SettingsView:
         self._folder_name_field.value = self.config.folder_name
         self._patterns_field.value = ", ".join(self.config.file_patterns)
         self._replace_checkbox.value = self.config.replace_existing
+        self._recursive_checkbox.value = self.config.recursive_scan
+        self._skip_unchanged_checkbox.value = self.config.skip_unchanged
+        self._validation_dropdown.value = self.config.validation_mode
+        self._part_size_field.value = str(self.config.max_part_size_mb)
+        self._part_sections_field.value = str(self.config.max_part_sections)
         self._connection_status.value = ""
         self._folder_status.value = ""
         self.page.update()
@@ -176,25 +239,37 @@ class SettingsView:
             self.page.update()
             return
 
+        if self._connection_worker.is_running:
+            return
         self._connection_status.value = "Testing..."
         self._connection_status.color = None
         self.page.update()
 
-        try:
+        def check() -> bool:
             from knowledgeimporter.utils.storage import test_api_connection
 
-            ok = test_api_connection(api_key)
+            return test_api_connection(api_key)
+
+        def on_complete(ok: bool) -> None:
             if ok:
-                self._connection_status.value = "Connection successful"
-                self._connection_status.color = ft.Colors.GREEN
+                self._show_status(self._connection_status, "Connection successful", ft.Colors.GREEN)
             else:
-                self._connection_status.value = "Connection failed — check API key"
-                self._connection_status.color = ft.Colors.ERROR
-        except Exception as e:
-            self._connection_status.value = f"Error: {e}"
-            self._connection_status.color = ft.Colors.ERROR
+                self._show_status(self._connection_status, "Connection failed — check API key", ft.Colors.ERROR)
 
-        self.page.update()
+        def on_error(error: Exception) -> None:
+            self._show_status(self._connection_status, f"Error: {error}", ft.Colors.ERROR)
+
+        self._connection_worker.run(fn=check, on_complete=on_complete, on_error=on_error)
+
+    def _show_status(self, status: ft.Text, message: str, color: str | None) -> None:
+        """Set a status line from a background thread, via the Flet event loop."""
+
+        async def _update():
+            status.value = message
+            status.color = color
+            self.page.update()
+
+        self.page.run_task(_update)
 
     def _validate_folder(self, _e: ft.ControlEvent) -> None:
         api_key = self._api_key_field.value or ""
@@ -212,27 +287,38 @@ class SettingsView:
             self.page.update()
             return
 
+        if self._folder_worker.is_running:
+            return
         self._folder_status.value = "Validating..."
         self._folder_status.color = None
         self.page.update()
 
-        try:
+        region = self._region_dropdown.value or "eu"
+        # Saved on success as entered now, even if the fields change while validating
+        config = self._build_config_from_fields()
+
+        def check() -> tuple[bool, int]:
             from knowledgeimporter.utils.storage import validate_folder
 
-            region = self._region_dropdown.value or "eu"
-            ok, file_count = validate_folder(api_key, folder_id, region)
-            if ok:
+            return validate_folder(api_key, folder_id, region)
+
+        def on_complete(result: tuple[bool, int]) -> None:
+            ok, file_count = result
+            if not ok:
+                self._show_status(self._folder_status, "Folder not found or access denied", ft.Colors.ERROR)
+                return
+
+            async def _update():
                 self._folder_status.value = f"Folder valid — {file_count} file(s) found"
                 self._folder_status.color = ft.Colors.GREEN
                 # Auto-save config after successful validation
-                config = self._build_config_from_fields()
                 self._on_config_saved(config)
                 self.config = config
-            else:
-                self._folder_status.value = "Folder not found or access denied"
-                self._folder_status.color = ft.Colors.ERROR
-        except Exception as e:
-            self._folder_status.value = f"Validation error: {e}"
-            self._folder_status.color = ft.Colors.ERROR
+                self.page.update()
 
-        self.page.update()
+            self.page.run_task(_update)
+
+        def on_error(error: Exception) -> None:
+            self._show_status(self._folder_status, f"Validation error: {error}", ft.Colors.ERROR)
+
+        self._folder_worker.run(fn=check, on_complete=on_complete, on_error=on_error)
@@ -1,22 +1,36 @@
 """Upload view — main screen for batch uploading files to LangDock."""
 
 import logging
+import sqlite3
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import flet as ft
 
 from knowledgeimporter.models.config import AppConfig
-from knowledgeimporter.services.upload_service import UploadService
+from knowledgeimporter.models.upload_results import UploadResults
+from knowledgeimporter.services.discovery import SourceEntry, compile_patterns
+from knowledgeimporter.services.snapshot import ScanCancelled, SnapshotSummary, snapshots
+from knowledgeimporter.utils.metrics import write_textfile
+from knowledgeimporter.utils.profiling import BatchProfiler, profiling_settings
+from knowledgeimporter.utils.progress import ProgressAggregator, ProgressState
+from knowledgeimporter.utils.tracing import Tracer, format_breakdown
+from knowledgeimporter.utils.upload_history import HistorySession, UploadHistory
 from knowledgeimporter.utils.upload_logger import (
-    append_log,
+    UploadLogWriter,
     cleanup_old_logs,
     create_upload_log,
-    finalize_log,
     get_latest_log,
     open_log_in_editor,
+    trace_path,
 )
+from knowledgeimporter.utils.upload_manifest import UploadManifest
 from knowledgeimporter.utils.worker import BackgroundWorker
+from knowledgeimporter.views.results_table import ResultsTable
+
+if TYPE_CHECKING:
+    from knowledgeimporter.services.upload_service import UploadService
 
 logger = logging.getLogger(__name__)
 
@@ -37,14 +51,19 @@ class UploadView:
         self._upload_service: UploadService | None = None
         self._file_count = 0
         self._current_log: Path | None = None
+        self._log_writer: UploadLogWriter | None = None
+        self._tracer: Tracer | None = None
+        self._history: UploadHistory | None = None
+        self._session: HistorySession | None = None
+        self._profiler: BatchProfiler | None = None
+        self._progress: ProgressAggregator | None = None
+        self._count_worker: BackgroundWorker | None = None
+        self._startup_worker = BackgroundWorker()
 
         # File picker is a service in Flet 0.80+, registered via page.services
         self._dir_picker = ft.FilePicker()
         page.services.append(self._dir_picker)
 
-        # Clean up old log files on startup
-        cleanup_old_logs()
-
         # Controls
         self._source_path_text = ft.Text(
             config.last_source_dir or "No folder selected",
@@ -59,6 +78,8 @@ class UploadView:
         self._status_text = ft.Text("Ready", size=14, weight=ft.FontWeight.W_600)
         self._current_file_text = ft.Text("", size=12, italic=True)
         self._stats_text = ft.Text("", size=13)
+        self._results = UploadResults()
+        self._results_table = ResultsTable(self._results, page)
 
         self._upload_btn = ft.ElevatedButton(
             "Start Upload",
@@ -80,12 +101,31 @@ class UploadView:
             "View Log",
             icon=ft.Icons.DESCRIPTION,
             on_click=self._view_log,
-            visible=get_latest_log() is not None,
+            visible=False,
         )
 
-        # Update file count if we have a last source dir
-        if config.last_source_dir:
-            self._update_file_count(config.last_source_dir)
+    def start_deferred(self) -> None:
+        """Start the startup work that touches disk or network, once the first frame is shown.
+
+        The file count runs in the background (the source may be a sleeping
+        network share), as do log cleanup and the lookup for the View Log button.
+        """
+        if self.config.last_source_dir:
+            self._update_file_count(self.config.last_source_dir)
+
+        def housekeeping() -> bool:
+            cleanup_old_logs()
+            return get_latest_log() is not None
+
+        def on_complete(has_log: bool) -> None:
+            async def _update():
+                if has_log:
+                    self._view_log_btn.visible = True
+                    self.page.update()
+
+            self.page.run_task(_update)
+
+        self._startup_worker.run(fn=housekeeping, on_complete=on_complete)
 
     def build(self) -> ft.Control:
         """Build and return the upload view layout."""
@@ -135,6 +175,7 @@ class UploadView:
                 self._progress_text,
                 self._current_file_text,
                 self._stats_text,
+                self._results_table.control,
                 # Log link
                 ft.Row(
                     controls=[self._view_log_btn],
@@ -143,6 +184,8 @@ class UploadView:
             ],
             spacing=10,
             expand=True,
+            # The results table may not fit below the controls on small windows
+            scroll=ft.ScrollMode.AUTO,
         )
 
     def refresh_target_display(self) -> None:
@@ -151,6 +194,11 @@ class UploadView:
         if self.config.last_source_dir:
             self._update_file_count(self.config.last_source_dir)
 
+    def refresh_folder_display(self) -> None:
+        """Refresh target folder display and upload button state, keeping the file count."""
+        self._folder_info_text.value = self._folder_display()
+        self._update_upload_button()
+
     def _folder_display(self) -> str:
         name = self.config.folder_name or "Not configured"
         fid = self.config.default_folder_id
@@ -177,22 +225,81 @@ class UploadView:
         self.page.update()
 
     def _update_file_count(self, source_dir: str) -> None:
-        import fnmatch
-
-        source = Path(source_dir)
-        count = 0
-        if source.is_dir():
-            for item in source.iterdir():
-                if not item.is_file():
-                    continue
-                for pattern in self.config.file_patterns:
-                    if fnmatch.fnmatch(item.name, pattern):
-                        count += 1
-                        break
-
-        self._file_count = count
-        self._file_count_text.value = f"{self._file_count} file(s) matching {', '.join(self.config.file_patterns)}"
-        self._upload_btn.disabled = self._file_count == 0 or not self.config.default_folder_id
+        """Count matching files in the background; picking another folder cancels the running count."""
+        if self._count_worker:
+            self._count_worker.cancel()
+        worker = BackgroundWorker()
+        self._count_worker = worker
+        cancel = worker.cancel_event
+        patterns = list(self.config.file_patterns)
+        recursive = self.config.recursive_scan
+        match = compile_patterns(patterns)
+        found = 0
+
+        self._file_count = 0
+        self._upload_btn.disabled = True
+        self._file_count_text.value = "Counting files..."
+
+        def push(state: ProgressState) -> None:
+            async def _update():
+                if not cancel.is_set():
+                    self._file_count_text.value = f"Counting files... {state.current} so far"
+                    self.page.update()
+
+            self.page.run_task(_update)
+
+        progress = ProgressAggregator(push)
+
+        def on_entry(entry: SourceEntry) -> None:
+            nonlocal found
+            if match(entry.path.name):
+                found += 1
+                progress.update(found, 0, "", "scanning")
+
+        def count() -> SnapshotSummary | None:
+            # Cached: rescanned only when the folder changed, reused by the upload
+            try:
+                return snapshots.get(source_dir, recursive, on_entry, cancel).summary(patterns)
+            except ScanCancelled:
+                return None
+
+        def on_complete(summary: SnapshotSummary | None) -> None:
+            progress.close()
+            if summary is None:
+                return
+
+            async def _update():
+                if not cancel.is_set():
+                    self._show_file_count(summary)
+                    self.page.update()
+
+            self.page.run_task(_update)
+
+        def on_error(error: Exception) -> None:
+            progress.close()
+
+            async def _update():
+                if not cancel.is_set():
+                    self._file_count_text.value = f"Could not scan folder: {error}"
+                    self.page.update()
+
+            self.page.run_task(_update)
+
+        worker.run(fn=count, on_complete=on_complete, on_error=on_error)
+
+    def _show_file_count(self, summary: SnapshotSummary) -> None:
+        self._file_count = summary.count
+        text = f"{self._file_count} file(s) matching {', '.join(self.config.file_patterns)}"
+        if summary.count:
+            by_ext = ", ".join(f"{n} {ext.lstrip('.')}" for ext, n in summary.by_extension.items())
+            text += f" — {summary.total_bytes / 2**20:.1f} MB ({by_ext})"
+        self._file_count_text.value = text
+        self._update_upload_button()
+
+    def _update_upload_button(self) -> None:
+        self._upload_btn.disabled = (
+            self._file_count == 0 or not self.config.default_folder_id or self._worker.is_running
+        )
 
     def _start_upload(self, _e: ft.ControlEvent) -> None:
         if not self.config.langdock_api_key:
@@ -216,10 +323,21 @@ class UploadView:
 
         # Create log file for this upload session
         self._current_log = create_upload_log()
-        append_log(self._current_log, f"Source: {source_dir}")
-        append_log(self._current_log, f"Target folder: {self.config.folder_name} ({self.config.default_folder_id})")
-        append_log(self._current_log, f"Patterns: {', '.join(self.config.file_patterns)}")
-        append_log(self._current_log, f"Replace mode: {self.config.replace_existing}")
+        self._log_writer = UploadLogWriter(self._current_log)
+        self._log(f"Source: {source_dir}")
+        self._log(f"Target folder: {self.config.folder_name} ({self.config.default_folder_id})")
+        self._log(f"Patterns: {', '.join(self.config.file_patterns)}")
+        self._log(f"Replace mode: {self.config.replace_existing}")
+        self._log(f"Include subfolders: {self.config.recursive_scan}")
+        self._log(f"Skip unchanged: {self.config.skip_unchanged}")
+        self._log(f"Validation: {self.config.validation_mode}")
+        if self.config.max_part_size_mb or self.config.max_part_sections:
+            self._log(
+                f"Split parts: max {self.config.max_part_size_mb or '-'} MB, "
+                f"max {self.config.max_part_sections or '-'} sections",
+            )
+        if self.config.xlsx_sheet_workers > 1:
+            self._log(f"XLSX sheet workers: {self.config.xlsx_sheet_workers}")
 
         # Prepare UI for upload
         self._progress_bar.visible = True
@@ -232,19 +350,55 @@ class UploadView:
         self._stats_text.value = ""
         self._progress_text.value = ""
         self._current_file_text.value = ""
+        self._results_table.reset()
         self.page.update()
 
+        # Imported on first upload: converters and API client are not needed for the first frame
+        from knowledgeimporter.converters.base import ConversionOptions
+        from knowledgeimporter.services.upload_service import UploadService
+
         self._upload_service = UploadService(api_key=self.config.langdock_api_key)
+        self._tracer = Tracer()
+        tracer = self._tracer
+        profiling, threshold = profiling_settings(self.config.profiling, self.config.profile_threshold_seconds)
+        self._profiler = BatchProfiler.for_log(self._current_log, threshold) if profiling else None
+        profiler = self._profiler
+        if profiler:
+            self._log(f"Profiling: conversions over {threshold:g}s" if threshold else "Profiling: batch")
+        options = ConversionOptions(
+            validation=self.config.validation_mode,
+            max_part_bytes=self.config.max_part_size_mb * 1024 * 1024 or None,
+            max_part_sections=self.config.max_part_sections or None,
+            deterministic=self.config.skip_unchanged,
+            sheet_workers=self.config.xlsx_sheet_workers,
+        )
+        # Always kept: replace mode uses the recorded upload names to find stale parts
+        manifest = UploadManifest()
+        self._session = None
 
         def do_upload():
+            # Opening the history prunes and may VACUUM it: kept off the UI thread
+            self._session = session = self._start_history_session(source_dir)
+            # A still valid snapshot from the file count saves the scan; otherwise stream a fresh scan
+            snapshot = snapshots.fresh(source_dir, self.config.recursive_scan)
             return self._upload_service.upload_batch(
                 source_dir=source_dir,
                 folder_id=self.config.default_folder_id,
                 patterns=self.config.file_patterns,
                 replace=self.config.replace_existing,
                 on_progress=self._on_progress,
+                conversion_options=options,
+                tracer=tracer,
+                manifest=manifest,
+                skip_unchanged=self.config.skip_unchanged,
+                recursive=self.config.recursive_scan,
+                snapshot=snapshot,
+                history=session,
+                profiler=profiler,
+                on_result=self._results.add,
             )
 
+        self._progress = ProgressAggregator(self._push_progress)
         self._worker.run(
             fn=do_upload,
             on_complete=self._on_upload_complete,
@@ -253,25 +407,37 @@ class UploadView:
 
     def _on_progress(self, current: int, total: int, filename: str, status: str) -> None:
         """Called from background thread — delegates UI update to Flet event loop."""
-        # Write to log file (thread-safe file I/O)
+        # Queue for the log writer thread (no file I/O here)
         if self._current_log:
             if status == "converting":
-                append_log(self._current_log, f"[CONV]   {filename}")
+                self._log(f"[CONV]   {filename}")
             elif status == "uploading":
-                append_log(self._current_log, f"[UPLOAD] {filename}")
+                self._log(f"[UPLOAD] {filename}")
             elif status == "success":
-                append_log(self._current_log, f"[OK]     {filename}")
+                self._log(f"[OK]     {filename}{self._timings(filename)}")
             elif status == "error":
-                append_log(self._current_log, f"[FAIL]   {filename}")
+                self._log(f"[FAIL]   {filename}{self._timings(filename)}")
+            elif status == "unchanged":
+                self._log(f"[SAME]   {filename}")
             elif status == "cancelled":
-                append_log(self._current_log, "[CANCELLED]")
+                self._log("[CANCELLED]")
             else:
-                append_log(self._current_log, f"[{status.upper()}] {filename}")
+                self._log(f"[{status.upper()}] {filename}")
+
+        # The UI only shows the latest state, at most 10 times a second
+        if self._progress:
+            self._progress.update(current, total, filename, status)
+
+    def _push_progress(self, state: ProgressState) -> None:
+        """Called by the progress aggregator — delegates UI update to Flet event loop."""
+        current, total, filename, status = state.current, state.total, state.filename, state.status
 
         async def _update():
             if total > 0:
                 self._progress_bar.value = current / total
             self._progress_text.value = f"{current}/{total}"
+            if state.failed:
+                self._progress_text.value += f" ({state.failed} failed)"
 
             if status == "converting":
                 self._current_file_text.value = f"Converting: {filename}"
@@ -292,15 +458,64 @@ class UploadView:
                 self._current_file_text.value = f"{filename} ({status})"
                 self._current_file_text.color = None
 
+            self._results_table.refresh()
             self.page.update()
 
         self.page.run_task(_update)
 
+    def _log(self, message: str) -> None:
+        """Queue a message for the session log (safe from any thread)."""
+        if self._log_writer:
+            self._log_writer.write(message)
+
+    def _timings(self, filename: str) -> str:
+        """Per-stage timings of filename for its log entry, e.g. `` (convert 0.41s, upload 1.20s)``."""
+        timings = self._tracer.breakdown(filename) if self._tracer else {}
+        return f" ({format_breakdown(timings)})" if timings else ""
+
+    def _start_history_session(self, source_dir: str) -> HistorySession | None:
+        """Open the history database on first use and start a session; None if it is unavailable."""
+        try:
+            if self._history is None:
+                self._history = UploadHistory(retention_days=self.config.history_retention_days)
+            return self._history.start_session(source_dir, self.config.default_folder_id, self._current_log)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Upload history unavailable: %s", e)
+            return None
+
+    def _write_trace(self) -> None:
+        """Export the batch timeline next to the log file."""
+        if not (self._current_log and self._tracer):
+            return
+        try:
+            path = self._tracer.write_chrome_trace(trace_path(self._current_log))
+            self._log(f"Trace: {path.name}")
+        except OSError as e:
+            logger.warning("Could not write trace: %s", e)
+        if self._profiler:
+            for path in self._profiler.written:
+                self._log(f"Profile: {path.name}")
+
+    def _export_metrics(self) -> None:
+        """Update the node_exporter textfile, if one is configured."""
+        if not self.config.metrics_textfile:
+            return
+        try:
+            write_textfile(Path(self.config.metrics_textfile).expanduser())
+        except OSError as e:
+            logger.warning("Could not write metrics textfile: %s", e)
+
     def _on_upload_complete(self, result: dict) -> None:
         """Called from background thread — delegates UI update to Flet event loop."""
+        if self._progress:
+            self._progress.close()
         # Finalize log file
-        if self._current_log:
-            finalize_log(self._current_log, result)
+        if self._log_writer:
+            self._write_trace()
+            self._log_writer.finalize(result)
+        if self._session:
+            self._session.finish(result)
+        self._export_metrics()
 
         async def _update():
             total = result.get("total", 0)
@@ -308,12 +523,15 @@ class UploadView:
             failed = result.get("failed", 0)
             skipped = result.get("skipped", 0)
             converted = result.get("converted", 0)
+            unchanged = result.get("unchanged", 0)
 
             self._status_text.value = "Complete"
             self._status_text.color = ft.Colors.GREEN if failed == 0 else ft.Colors.AMBER
             stats = f"Total: {total} | Success: {success} | Failed: {failed} | Skipped: {skipped}"
             if converted > 0:
                 stats += f" | Converted: {converted}"
+            if unchanged > 0:
+                stats += f" | Unchanged: {unchanged}"
             self._stats_text.value = stats
             self._progress_bar.value = 1.0
             self._upload_btn.disabled = False
@@ -321,14 +539,22 @@ class UploadView:
             self._spinner.visible = False
             self._current_file_text.value = ""
             self._view_log_btn.visible = True
+            self._results_table.refresh()
             self.page.update()
 
         self.page.run_task(_update)
 
     def _on_upload_error(self, error: Exception) -> None:
         """Called from background thread — delegates UI update to Flet event loop."""
-        if self._current_log:
-            append_log(self._current_log, f"[ERROR] {error}")
+        if self._progress:
+            self._progress.close()
+        if self._log_writer:
+            self._log(f"[ERROR] {error}")
+            self._write_trace()
+            self._log_writer.close()
+        if self._session:
+            self._session.finish({})
+        self._export_metrics()
 
         async def _update():
             self._status_text.value = f"Error: {error}"
@@ -339,6 +565,7 @@ class UploadView:
             self._progress_bar.visible = False
             self._current_file_text.value = ""
             self._view_log_btn.visible = True
+            self._results_table.refresh()
             self.page.update()
 
         self.page.run_task(_update)
@@ -352,12 +579,14 @@ class UploadView:
         self._spinner.visible = False
 
         if self._current_log:
-            append_log(self._current_log, "[CANCELLED] Upload cancelled by user")
+            self._log("[CANCELLED] Upload cancelled by user")
 
         self.page.update()
 
     def _view_log(self, _e: ft.ControlEvent) -> None:
         """Open the most recent log file in the system editor."""
+        if self._log_writer:
+            self._log_writer.flush()
         log_file = self._current_log or get_latest_log()
         if log_file and log_file.exists():
             open_log_in_editor(log_file)
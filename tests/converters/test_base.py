@@ -1,8 +1,21 @@
 """Tests for BaseConverter ABC and data models."""
 
+import io
+from pathlib import Path
+
 import pytest
 
-from knowledgeimporter.converters.base import BaseConverter, RawDocument, Section, ValidationResult
+from knowledgeimporter.converters.base import (
+    BaseConverter,
+    ConversionOptions,
+    CoverageAccumulator,
+    MarkdownWriter,
+    RawDocument,
+    Section,
+    ValidationResult,
+    _wilson_interval,
+    sections_to_markdown,
+)
 
 
 def test_raw_document_creation():
@@ -35,3 +48,91 @@ def test_conversion_result_structure():
     vr = ValidationResult(status="ok", coverage_score=1.0, issues=[], ai_used=False, corrected_markdown=None)
     assert vr.status == "ok"
     assert vr.coverage_score == 1.0
+
+
+def test_coverage_accumulator_reports_missing_tokens():
+    acc = CoverageAccumulator()
+    acc.add("Artikel 4711", "- **Name:** Artikel\n- **Nr:** 4711")
+    assert acc.result().coverage_score == 1.0
+    acc.add("fehlt 0815", "- **Nr:** 0815")
+    result = acc.result()
+    assert result.coverage_score == 0.75
+    assert result.status == "warning"
+
+
+def test_markdown_writer_matches_sections_to_markdown():
+    sections = [
+        Section(level=2, title="A", kv_pairs=[("k", "v")]),
+        Section(level=2, title="B", kv_pairs=[], free_text="Text"),
+    ]
+    out = io.StringIO()
+    MarkdownWriter(out).write_sections((s, "") for s in sections)
+    assert out.getvalue() == sections_to_markdown(sections)
+
+
+def test_markdown_writer_appends_rendered_parts():
+    sections = [Section(level=2, title=t, kv_pairs=[("k", t)]) for t in "ABC"]
+    out = io.StringIO()
+    writer = MarkdownWriter(out)
+    writer.write_section(sections[0], "A")
+    writer.write_rendered(io.StringIO(""))
+    writer.write_rendered(io.StringIO(sections_to_markdown(sections[1:])))
+    assert out.getvalue() == sections_to_markdown(sections)
+    assert writer.result().coverage_score == 1.0
+
+
+def test_markdown_writer_checks_pre_rendered_markdown():
+    out = io.StringIO()
+    writer = MarkdownWriter(out)
+    writer.write_markdown("## Zeile 2: Artikel\n\n- **Nr:** 4711\n", ["Artikel 4711", "Fehlt 0815"])
+    assert writer.coverage.total == 4
+    assert writer.result().coverage_score == 0.5
+
+
+class _TextConverter(BaseConverter):
+    def extract(self, path: str) -> RawDocument:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+        sections = [Section(level=2, title=f"Zeile {i}", kv_pairs=[("Wert", line)]) for i, line in enumerate(lines, 1)]
+        return RawDocument(path, "txt", "Test", "de", None, sections, {}, "\n".join(lines))
+
+
+def test_stream_without_sections_writes_header_only(tmp_path):
+    src = tmp_path / "t.txt"
+    src.write_text("", encoding="utf-8")
+
+    class Empty(_TextConverter):
+        supports_streaming = True
+
+        def iter_sections(self, path):
+            return iter(())
+
+    out = io.StringIO()
+    Empty().stream(str(src), out)
+    assert out.getvalue().startswith("---\n")
+    assert out.getvalue().endswith("---\n\n# t\n\n")
+
+
+def test_validate_splits_structural_punctuation(tmp_path):
+    src = tmp_path / "t.txt"
+    src.write_text('"Artikel";4711\n{"nr": 42}\n', encoding="utf-8")
+    result = _TextConverter().run(str(src))
+    assert result.validation.coverage_score == 1.0
+    assert result.validation.sample_size is None
+
+
+def test_validate_sampled_reports_interval(tmp_path):
+    src = tmp_path / "t.txt"
+    src.write_text("\n".join(f"Artikel {i:05d}" for i in range(5000)), encoding="utf-8")
+    conv = _TextConverter(ConversionOptions(validation="sampled", validation_sample_rate=0.1))
+    validation = conv.run(str(src)).validation
+    assert validation.coverage_score == 1.0
+    assert 0 < validation.sample_size < 5001
+    low, high = validation.confidence_interval
+    assert low < 1.0 <= high
+
+
+def test_wilson_interval_bounds():
+    low, high = _wilson_interval(50, 100)
+    assert 0.4 < low < 0.5 < high < 0.6
+    assert _wilson_interval(0, 10)[0] == 0.0
+    assert _wilson_interval(10, 10)[1] == 1.0
@@ -48,3 +48,43 @@ def test_csv_empty_file_raises():
     path = write_csv("")
     with pytest.raises(ValueError, match="Keine Datensätze"):
         CsvConverter().extract(path)
+
+
+def test_csv_streaming_matches_in_memory_output(tmp_path):
+    path = write_csv(CSV_SIMPLE)
+    conv = CsvConverter()
+    expected = conv.run(path)
+    out_path = tmp_path / "out.md"
+    result = conv.run_to_file(path, str(out_path), streaming=True)
+    assert result.markdown_content == ""
+    assert result.output_path == str(out_path)
+    streamed = out_path.read_text(encoding="utf-8")
+    # frontmatter carries a timestamp; compare everything after it
+    assert streamed.split("---", 2)[2] == expected.markdown_content.split("---", 2)[2]
+    assert result.validation.status == "ok"
+
+
+def test_csv_streaming_latin1(tmp_path):
+    path = write_csv("Bezeichnung,Wert\nÄpfel-Preis,2.50\n", encoding="latin-1")
+    out_path = tmp_path / "out.md"
+    CsvConverter().run_to_file(path, str(out_path), streaming=True)
+    assert "Äpfel" in out_path.read_text(encoding="utf-8")
+
+
+def test_csv_streaming_empty_file_raises(tmp_path):
+    path = write_csv("Name,Wert\n")
+    out_path = tmp_path / "out.md"
+    with pytest.raises(ValueError, match="Keine Datensätze"):
+        CsvConverter().run_to_file(path, str(out_path), streaming=True)
+    assert out_path.read_text(encoding="utf-8") == ""
+
+
+def test_csv_rows_share_headers_and_pool_repeated_values():
+    path = write_csv("Name,Status\nA, \nB,aktiv\nC,aktiv,extra\nD,aktiv\n")
+    doc = CsvConverter().extract(path)
+    first, second, third, fourth = doc.sections
+    assert first.kv_pairs == [("Name", "A")]  # whitespace-only cell dropped
+    assert first.table is fourth.table
+    assert fourth.values[1] is second.values[1]
+    assert third.kv_pairs[-1] == (None, "['extra']")
+    assert third.title == "Zeile 4: C"
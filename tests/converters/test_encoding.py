@@ -0,0 +1,90 @@
+"""Tests for sampled encoding detection."""
+
+import codecs
+
+import pytest
+
+from knowledgeimporter.converters import encoding
+from knowledgeimporter.converters.base import ConversionOptions
+from knowledgeimporter.converters.csv_converter import CsvConverter
+from knowledgeimporter.converters.encoding import (
+    detect_encoding,
+    detect_sample_encoding,
+    open_text,
+    read_text,
+    redetect_encoding,
+)
+
+
+def test_bom_detection():
+    assert detect_sample_encoding(codecs.BOM_UTF8 + b"a,b") == "utf-8-sig"
+    assert detect_sample_encoding("a,b".encode("utf-16")) == "utf-16"
+    assert detect_sample_encoding("a,b".encode("utf-32")) == "utf-32"
+
+
+def test_bomless_utf16_detection():
+    assert detect_sample_encoding("Name,Wert\nA,1\n".encode("utf-16-le")) == "utf-16-le"
+    assert detect_sample_encoding("Name,Wert\nA,1\n".encode("utf-16-be")) == "utf-16-be"
+
+
+def test_xml_declaration_wins_over_sample():
+    sample = '<?xml version="1.0" encoding="ISO-8859-1"?><a>Ä</a>'.encode("latin-1")
+    assert codecs.lookup(detect_sample_encoding(sample)).name == "iso8859-1"
+
+
+def test_yaml_coding_comment():
+    sample = "# -*- coding: latin-1 -*-\nname: Äpfel\n".encode("latin-1")
+    assert codecs.lookup(detect_sample_encoding(sample)).name == "iso8859-1"
+
+
+def test_utf8_sample():
+    assert detect_sample_encoding("Größe: 12".encode()) == "utf-8"
+
+
+def test_read_text_redetects_after_utf8_head(tmp_path):
+    path = tmp_path / "late.csv"
+    path.write_bytes(b"a" * (encoding.SAMPLE_BYTES + 10) + "\nÄpfel Größe Straße".encode("latin-1"))
+    text = read_text(str(path))
+    assert text.endswith("Äpfel Größe Straße")
+
+
+def test_detect_encoding_is_cached(tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    path.write_bytes("Bezeichnung,Wert\nÄpfel,2\n".encode("cp1252"))
+    first = detect_encoding(str(path))
+    monkeypatch.setattr(encoding, "detect_sample_encoding", lambda sample: "never-called")
+    assert detect_encoding(str(path)) == first
+
+
+def _late_umlaut_csv(tmp_path):
+    path = tmp_path / "late.csv"
+    rows = "".join(f"{i},Meier\n" for i in range(20000))
+    path.write_bytes(("id,name\n" + rows + "99999,Müller\n").encode("cp1252"))
+    assert path.stat().st_size > encoding.SAMPLE_BYTES
+    return path
+
+
+def test_open_text_is_strict_after_sample(tmp_path):
+    path = _late_umlaut_csv(tmp_path)
+    with open_text(str(path)) as f, pytest.raises(UnicodeDecodeError):
+        f.read()
+
+
+def test_redetect_encoding_uses_whole_file(tmp_path):
+    path = _late_umlaut_csv(tmp_path)
+    assert detect_encoding(str(path)) == "utf-8"
+    redetected = redetect_encoding(str(path))
+    assert detect_encoding(str(path)) == redetected
+    with open_text(str(path)) as f:
+        assert f.read().endswith("99999,Müller\n")
+
+
+@pytest.mark.parametrize("engine", ["python", "vectorized"])
+def test_streaming_restarts_on_late_non_utf8_bytes(tmp_path, engine):
+    path = _late_umlaut_csv(tmp_path)
+    out = tmp_path / "late.md"
+    result = CsvConverter(ConversionOptions(tabular_engine=engine)).run_to_file(str(path), str(out))
+    markdown = out.read_text(encoding="utf-8")
+    assert "Müller" in markdown
+    assert "�" not in markdown
+    assert result.validation.coverage_score == 1.0
@@ -0,0 +1,94 @@
+"""Tests for the iterative flattener."""
+
+import inspect
+
+import pytest
+
+from knowledgeimporter.converters import flatten as flatten_module
+from knowledgeimporter.converters.flatten import clear_key_cache, flatten, flatten_into, iter_flatten, peek_flatten
+
+NESTED = {
+    "produkt": {"name": "CMC 70115", "eigenschaften": {"temp": 180, "leer": None}},
+    "tags": ["a", {"b": [1, 2]}],
+    "aktiv": True,
+}
+
+
+def test_flatten_dot_and_index_notation():
+    assert flatten(NESTED) == [
+        ("produkt.name", "CMC 70115"),
+        ("produkt.eigenschaften.temp", "180"),
+        ("produkt.eigenschaften.leer", ""),
+        ("tags[0]", "a"),
+        ("tags[1].b[0]", "1"),
+        ("tags[1].b[1]", "2"),
+        ("aktiv", "True"),
+    ]
+
+
+def test_flatten_scalars_and_prefix():
+    assert flatten(42) == [("", "42")]
+    assert flatten([1, 2], prefix="liste") == [("liste[0]", "1"), ("liste[1]", "2")]
+    assert flatten({}) == []
+
+
+def test_flatten_non_str_keys_do_not_collide():
+    assert flatten({True: "ja"}) == [("True", "ja")]
+    assert flatten({1: "eins"}) == [("1", "eins")]
+    assert flatten({"a": {True: "x"}, "b": {1: "y"}}) == [("a.True", "x"), ("b.1", "y")]
+
+
+def test_flatten_reuses_key_strings_across_records():
+    first = flatten({"preis": {"netto": 1}})
+    second = flatten({"preis": {"netto": 2}})
+    assert first[0][0] is second[0][0]
+
+
+def test_flatten_deep_nesting_without_recursion_limit():
+    data: dict = {"wert": 1}
+    for _ in range(5000):
+        data = {"x": data}
+    pairs = flatten(data)
+    assert len(pairs) == 1
+    assert pairs[0][0].endswith(".x.wert")
+
+
+@pytest.mark.parametrize("max_depth", [1, 2])
+def test_flatten_max_depth_collapses_deeper_containers(max_depth):
+    pairs = dict(flatten(NESTED, max_depth=max_depth))
+    if max_depth == 1:
+        assert pairs["produkt"] == '{"name": "CMC 70115", "eigenschaften": {"temp": 180, "leer": null}}'
+    else:
+        assert pairs["produkt.eigenschaften"] == '{"temp": 180, "leer": null}'
+        assert pairs["tags[1]"] == '{"b": [1, 2]}'
+
+
+def test_key_cache_is_bounded():
+    clear_key_cache()
+    pairs = flatten({"liste": list(range(100_000)), **{f"k{i}": {"x": i} for i in range(20_000)}})
+    assert pairs[99_999] == ("liste[99999]", "99999")
+    assert pairs[-1] == ("k19999.x", "19999")
+    cached = sum(map(len, flatten_module._dict_keys.values())) + sum(map(len, flatten_module._index_keys.values()))
+    assert len(flatten_module._index_keys["liste"]) == flatten_module._INDEX_CACHE_MAX
+    assert cached + len(flatten_module._dict_keys) + len(flatten_module._index_keys) <= flatten_module._KEY_CACHE_MAX
+    clear_key_cache()
+
+
+def test_flatten_into_appends_to_existing_list():
+    out = [("vorher", "1")]
+    assert flatten_into(out, {"a": 1}, prefix="p") is out
+    assert out == [("vorher", "1"), ("p.a", "1")]
+
+
+@pytest.mark.parametrize("max_depth", [None, 1, 2, 3])
+@pytest.mark.parametrize("data", [NESTED, [NESTED, [], {}], "wert", None, {}])
+def test_iter_flatten_matches_flatten(data, max_depth):
+    assert inspect.isgenerator(iter_flatten(data, "p", max_depth))
+    assert list(iter_flatten(data, "p", max_depth)) == flatten(data, "p", max_depth)
+
+
+def test_peek_flatten_returns_first_pair_and_all_pairs():
+    first, pairs = peek_flatten(NESTED)
+    assert first == flatten(NESTED)[0]
+    assert list(pairs) == flatten(NESTED)
+    assert peek_flatten([])[0] is None
@@ -48,3 +48,52 @@ def test_invalid_json_raises():
     f.flush()
     with pytest.raises(ValueError, match="JSON"):
         JsonConverter().extract(f.name)
+
+
+def test_utf16_json_is_decoded(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"name": "Größe"}', encoding="utf-16")
+    doc = JsonConverter().extract(str(path))
+    assert ("name", "Größe") in doc.sections[0].kv_pairs
+
+
+def test_iter_array_yields_items_across_chunk_boundaries(monkeypatch):
+    import io
+
+    from knowledgeimporter.converters import json_converter
+
+    monkeypatch.setattr(json_converter, "_CHUNK_CHARS", 4)
+    text = ' [ {"a": "x,y]"}, 12345, [1, 2] , "s" ] '
+    items = [item for item, _ in json_converter.iter_array(io.StringIO(text))]
+    assert items == [{"a": "x,y]"}, 12345, [1, 2], "s"]
+
+
+def test_iter_array_rejects_invalid_separator():
+    import io
+
+    from knowledgeimporter.converters.json_converter import iter_array
+
+    with pytest.raises(ValueError, match="JSON"):
+        list(iter_array(io.StringIO("[1 2]")))
+
+
+def test_json_streaming_matches_in_memory_output(tmp_path):
+    path = write_json([{"id": i, "name": f"Artikel {i}", "preis": {"netto": i * 1.5}} for i in range(50)])
+    expected = JsonConverter().run(path).markdown_content
+    out_path = tmp_path / "out.md"
+    result = JsonConverter().run_to_file(path, str(out_path), streaming=True)
+    assert out_path.read_text(encoding="utf-8").split("---", 2)[2] == expected.split("---", 2)[2]
+    assert result.markdown_content == ""
+
+
+def test_json_big_integer_falls_back_to_stdlib():
+    path = write_json({"nr": 2**70})
+    doc = JsonConverter().extract(path)
+    assert ("nr", str(2**70)) in doc.sections[0].kv_pairs
+
+
+def test_json_negative_integer_below_int64_falls_back_to_stdlib():
+    path = write_json({"nr": -9999999999999999999, "min": -(2**63) - 1})
+    doc = JsonConverter().extract(path)
+    assert ("nr", "-9999999999999999999") in doc.sections[0].kv_pairs
+    assert ("min", str(-(2**63) - 1)) in doc.sections[0].kv_pairs
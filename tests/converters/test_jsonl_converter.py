@@ -0,0 +1,50 @@
+"""Tests for JsonLinesConverter — JSON Lines to chunking-safe Markdown."""
+
+import io
+
+import pytest
+
+from knowledgeimporter.converters.jsonl_converter import JsonLinesConverter
+
+JSONL = '{"id": 1, "name": "A"}\n\n{"id": 2, "name": "B", "tags": ["x"]}\n'
+
+
+def write_jsonl(tmp_path, content: str, name: str = "data.jsonl") -> str:
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def test_jsonl_one_section_per_line(tmp_path):
+    doc = JsonLinesConverter().extract(write_jsonl(tmp_path, JSONL))
+    assert len(doc.sections) == 2
+    assert doc.sections[1].title == "Eintrag 2: 2"
+    assert ("tags[0]", "x") in doc.sections[1].kv_pairs
+
+
+def test_jsonl_streaming_matches_in_memory_output(tmp_path):
+    path = write_jsonl(tmp_path, JSONL, name="data.ndjson")
+    expected = JsonLinesConverter().run(path).markdown_content
+    out_path = tmp_path / "out.md"
+    JsonLinesConverter().run_to_file(path, str(out_path), streaming=True)
+    assert out_path.read_text(encoding="utf-8").split("---", 2)[2] == expected.split("---", 2)[2]
+
+
+def test_jsonl_invalid_line_reports_line_number(tmp_path):
+    path = write_jsonl(tmp_path, '{"id": 1}\n{kaputt\n')
+    with pytest.raises(ValueError, match="Zeile 2"):
+        JsonLinesConverter().extract(path)
+
+
+def test_jsonl_empty_file_raises(tmp_path):
+    path = write_jsonl(tmp_path, "\n\n")
+    with pytest.raises(ValueError, match="Keine Datensätze"):
+        JsonLinesConverter().extract(path)
+
+
+def test_jsonl_empty_file_streams_nothing(tmp_path):
+    path = write_jsonl(tmp_path, "\n\n")
+    out = io.StringIO()
+    with pytest.raises(ValueError, match="Keine Datensätze"):
+        JsonLinesConverter().stream(path, out)
+    assert out.getvalue() == ""
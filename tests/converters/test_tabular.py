@@ -0,0 +1,25 @@
+"""Tests for the compact tabular row representation."""
+
+from knowledgeimporter.converters.base import Section, section_to_markdown
+from knowledgeimporter.converters.tabular import _POOL_MAX, RowSection, Table
+
+
+def test_row_section_renders_like_section():
+    table = Table(("Name", "Preis", "Bestand"), "Blatt1")
+    row = RowSection(table, 2, ("Artikel A", 4.5, None))
+    expected = Section(level=2, title="Blatt1 – Zeile 2: Artikel A", kv_pairs=[("Name", "Artikel A"), ("Preis", "4.5")])
+    assert section_to_markdown(row) == section_to_markdown(expected)
+
+
+def test_row_section_title_without_table_name():
+    row = RowSection(Table(("A", "B")), 3, (None, 7))
+    assert row.title == "Zeile 3: 7"
+
+
+def test_table_compact_pools_low_cardinality_columns():
+    table = Table(("Id", "Status"))
+    rows = [table.compact((f"id-{i}", "aktiv".upper().lower())) for i in range(_POOL_MAX + 10)]
+    assert rows[0][1] is rows[-1][1]
+    # the id column exceeded the pool limit and is no longer pooled
+    assert table._pools[0] is None
+    assert table.compact(("id-0", "aktiv"))[0] == "id-0"
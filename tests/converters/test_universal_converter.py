@@ -1,9 +1,11 @@
 """Tests for UniversalConverter — format registry and orchestration."""
 
+import os
 import tempfile
 
 import pytest
 
+from knowledgeimporter.converters.base import ConversionOptions, source_fingerprint
 from knowledgeimporter.converters.universal_converter import UniversalConverter, UnsupportedFormatError
 
 
@@ -48,6 +50,46 @@ def test_supported_extensions():
     ext = UniversalConverter().supported_extensions()
     assert ".csv" in ext
     assert ".json" in ext
+    assert ".jsonl" in ext
+    assert ".ndjson" in ext
     assert ".yaml" in ext
     assert ".xml" in ext
     assert ".xlsx" in ext
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".yaml"])
+def test_convert_to_file_streams_by_default(tmp_path, suffix):
+    content = "A,B\n1,2\n3,4\n" if suffix == ".csv" else "- a: 1\n- a: 2\n"
+    path = write_file(content, suffix)
+    out_path = tmp_path / "out.md"
+    result = UniversalConverter().convert_to_file(path, str(out_path))
+    assert result.markdown_content == ""
+    streamed = out_path.read_text(encoding="utf-8")
+    in_memory = UniversalConverter().convert(path).markdown_content
+    assert streamed.split("---", 2)[2] == in_memory.split("---", 2)[2]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".json", ".yaml"])
+def test_deterministic_output_is_byte_identical(tmp_path, suffix):
+    content = {".csv": "A,B\n1,2\n", ".json": '[{"a": 1}, {"a": 2}]', ".yaml": "- a: 1\n"}[suffix]
+    path = write_file(content, suffix)
+    uc = UniversalConverter(ConversionOptions(deterministic=True))
+    uc.convert_to_file(path, str(tmp_path / "a.md"))
+    uc.convert_to_file(path, str(tmp_path / "b.md"), streaming=False)
+    first = (tmp_path / "a.md").read_text(encoding="utf-8")
+    assert first == (tmp_path / "b.md").read_text(encoding="utf-8")
+    assert "konvertiert:" not in first
+    assert f"fingerprint: {uc._converter_for(path).fingerprint(path)}" in first
+
+
+def test_fingerprint_depends_on_content_and_options(tmp_path):
+    path = tmp_path / "a.csv"
+    path.write_text("A,B\n1,2\n", encoding="utf-8")
+    first = source_fingerprint(str(path))
+    assert first.startswith("sha256:")
+    assert source_fingerprint(str(path)) == first
+    assert source_fingerprint(str(path), ConversionOptions(validation="sampled")) == first
+    assert source_fingerprint(str(path), ConversionOptions(max_part_sections=10)) != first
+    path.write_text("A,B\n1,3\n", encoding="utf-8")
+    os.utime(path, ns=(0, 1))
+    assert source_fingerprint(str(path)) != first
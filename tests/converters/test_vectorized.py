@@ -0,0 +1,95 @@
+"""Tests for the vectorized CSV engine — same output as the row-by-row path."""
+
+import io
+import tempfile
+
+import pytest
+
+pytest.importorskip("pandas")
+
+import knowledgeimporter.converters.vectorized as vectorized  # noqa: E402
+from knowledgeimporter.converters.base import ConversionOptions  # noqa: E402
+from knowledgeimporter.converters.csv_converter import CsvConverter  # noqa: E402
+
+CASES = {
+    "simple": "Name,Preis,Bestand\nArtikel A,4.50,100\nArtikel B,9.90,50\n",
+    "blank_lines": "Name,Preis\nA,1\n\nB,2\n",
+    "short_rows": "Name,Preis,Bestand\nA,1\nB\n",
+    "empty_cells": "Name,Preis,Bemerkung\n,1,  \nB,,x\n",
+    "quoted_newline": 'Name,Text\nA,"Zeile eins\nZeile zwei"\n',
+    "whitespace_line": "Name,Preis\nA,1\n   \nB,2\n",
+    "surplus_fields": "Name,Preis\nA,1,extra\n",
+    "duplicate_headers": "Name,Name\nA,B\n",
+    "no_final_newline": "Name,Preis\nA,1",
+    "umlauts": "Straße,Größe\nMüller,ÄÖÜ\n",
+    "crlf": "Name,Preis\r\nA,1\r\n\r\nB,2\r\n",
+    "bare_cr": "Name,Preis\rA,1\rB,2\r",
+    "bare_cr_whitespace_line": "Name,Preis\rA,1\r   \rB,2\r",
+}
+
+
+def write_csv(content: str) -> str:
+    f = tempfile.NamedTemporaryFile(mode="w", suffix=".csv", encoding="utf-8", newline="", delete=False)
+    f.write(content)
+    f.flush()
+    return f.name
+
+
+def convert(path: str, engine: str) -> tuple[str, float]:
+    out = io.StringIO()
+    result = CsvConverter(ConversionOptions(tabular_engine=engine)).stream(path, out)
+    # frontmatter carries a timestamp; compare everything after it
+    return out.getvalue().split("---", 2)[2], result.coverage_score
+
+
+@pytest.fixture(params=["pyarrow", "pandas"])
+def reader(request, monkeypatch):
+    if request.param == "pyarrow":
+        if vectorized.pa_csv is None:
+            pytest.skip("pyarrow not installed")
+    else:
+        monkeypatch.setattr(vectorized, "pa_csv", None)
+    return request.param
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_vectorized_output_matches_row_by_row(name, reader):
+    path = write_csv(CASES[name])
+    assert convert(path, "vectorized") == convert(path, "python")
+
+
+def test_vectorized_renders_across_chunks(reader, monkeypatch):
+    monkeypatch.setattr(vectorized, "CHUNK_ROWS", 3)
+    path = write_csv("Nr,Wert\n" + "".join(f"{i},v{i}\n" for i in range(10)))
+    markdown, _ = convert(path, "vectorized")
+    assert markdown == convert(path, "python")[0]
+    assert "## Zeile 11: 9" in markdown
+
+
+def test_vectorized_rejects_input_it_cannot_reproduce():
+    path = write_csv(CASES["duplicate_headers"])
+    out = io.StringIO()
+    out.write("vorher")
+    with pytest.raises(vectorized.UnsupportedInput):
+        vectorized.stream_csv(path, out, CsvConverter().header_document(path), CsvConverter().new_coverage)
+    assert out.getvalue() == "vorher"
+
+
+def test_vectorized_header_only_raises(reader):
+    path = write_csv("Name,Preis\n")
+    with pytest.raises(ValueError, match="Keine Datensätze"):
+        convert(path, "vectorized")
+
+
+@pytest.mark.parametrize(
+    ("text", "bare"), [("Name\r\nA\r\nB\r\n", False), ("Name\r\nA\rB\r\n", True), ("Na\rme", True)]
+)
+def test_guard_finds_bare_cr_across_reads(text, bare):
+    guard = vectorized._GuardedText(io.StringIO(text))
+    if bare:
+        with pytest.raises(vectorized.UnsupportedInput, match="bare CR"):
+            while guard.read(4):
+                pass
+    else:
+        while guard.read(4):
+            pass
@@ -71,3 +71,48 @@ def test_xlsx_markdown_has_frontmatter():
     result = XlsxConverter().run(path)
     assert result.markdown_content.startswith("---")
     assert "quelle: xlsx" in result.markdown_content
+
+
+def _multi_sheet_xlsx() -> str:
+    wb = openpyxl.Workbook()
+    ws1 = wb.active
+    ws1.title = "Blatt1"
+    ws1.append(["A", "B"])
+    ws1.append([1, 2])
+    ws1.append([None, None])
+    ws1.append(["x", None])
+    wb.create_sheet("Leer")
+    ws3 = wb.create_sheet("Blatt3")
+    ws3.append(["X", "Y"])
+    ws3.append([10, 20])
+    f = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
+    wb.save(f.name)
+    return f.name
+
+
+def test_xlsx_streaming_matches_in_memory_output(tmp_path):
+    from knowledgeimporter.converters.xlsx_converter import XlsxConverter
+
+    path = _multi_sheet_xlsx()
+    conv = XlsxConverter()
+    expected = conv.run(path).markdown_content
+    out_path = tmp_path / "out.md"
+    result = conv.run_to_file(path, str(out_path), streaming=True)
+    streamed = out_path.read_text(encoding="utf-8")
+    assert streamed.split("---", 2)[2] == expected.split("---", 2)[2]
+    assert result.validation.status == "ok"
+
+
+def test_xlsx_streaming_parallel_sheets_keep_order(tmp_path):
+    from knowledgeimporter.converters.base import ConversionOptions
+    from knowledgeimporter.converters.xlsx_converter import XlsxConverter
+
+    path = _multi_sheet_xlsx()
+    sequential = tmp_path / "seq.md"
+    parallel = tmp_path / "par.md"
+    XlsxConverter().run_to_file(path, str(sequential), streaming=True)
+    XlsxConverter(ConversionOptions(sheet_workers=2)).run_to_file(path, str(parallel), streaming=True)
+    assert (
+        parallel.read_text(encoding="utf-8").split("---", 2)[2]
+        == sequential.read_text(encoding="utf-8").split("---", 2)[2]
+    )
@@ -62,3 +62,45 @@ def test_malformed_xml_raises():
     path = write_xml("<root><unclosed>")
     with pytest.raises(ValueError, match="XML"):
         XmlConverter().extract(path)
+
+
+def test_latin1_xml_with_declaration(tmp_path):
+    path = tmp_path / "data.xml"
+    path.write_bytes('<?xml version="1.0" encoding="ISO-8859-1"?><root><name>Größe</name></root>'.encode("latin-1"))
+    doc = XmlConverter().extract(str(path))
+    assert ("name", "Größe") in doc.sections[0].kv_pairs
+
+
+def _stream(path, tmp_path):
+    out_path = tmp_path / "out.md"
+    result = XmlConverter().run_to_file(path, str(out_path), streaming=True)
+    return result, out_path.read_text(encoding="utf-8")
+
+
+def test_streaming_list_matches_in_memory_output(tmp_path):
+    ns_list = """<?xml version="1.0"?>
+<c:katalog xmlns:c="urn:katalog">
+  <c:item nr="1"><c:name>A</c:name><c:preis>4.50</c:preis></c:item>
+  <c:item nr="2"><c:name>B</c:name><c:preis>9.90</c:preis></c:item>
+  <c:item nr="3"><c:name>C</c:name></c:item>
+</c:katalog>"""
+    path = write_xml(ns_list)
+    expected = XmlConverter().run(path).markdown_content
+    result, streamed = _stream(path, tmp_path)
+    assert streamed.split("---", 2)[2] == expected.split("---", 2)[2]
+    assert "## item 3: 3" in streamed
+    assert result.validation.status == "ok"
+
+
+def test_streaming_falls_back_for_non_list_documents(tmp_path):
+    path = write_xml(XML_SIMPLE)
+    expected = XmlConverter().run(path).markdown_content
+    _, streamed = _stream(path, tmp_path)
+    assert streamed.count("quelle: xml") == 1
+    assert streamed.split("---", 2)[2] == expected.split("---", 2)[2]
+
+
+def test_streaming_malformed_xml_raises(tmp_path):
+    path = write_xml("<root><item>A</item><item>B</item>")
+    with pytest.raises(ValueError, match="XML"):
+        _stream(path, tmp_path)
@@ -4,6 +4,7 @@ import tempfile
 
 import pytest
 
+from knowledgeimporter.converters.base import ConversionOptions
 from knowledgeimporter.converters.yaml_converter import YamlConverter
 
 
@@ -55,3 +56,71 @@ def test_invalid_yaml_raises():
     path = write_yaml("key: [unclosed")
     with pytest.raises(ValueError, match="YAML"):
         YamlConverter().extract(path)
+
+
+def test_latin1_yaml(tmp_path):
+    path = tmp_path / "data.yaml"
+    path.write_bytes("name: Äpfel und Größe\n".encode("latin-1"))
+    doc = YamlConverter().extract(str(path))
+    values = [v for _, v in doc.sections[0].kv_pairs]
+    assert "Äpfel und Größe" in values
+
+
+YAML_MULTI = """
+name: Artikel A
+preis: 4.50
+---
+name: Artikel B
+lager:
+  ort: Halle 2
+---
+"""
+
+
+def test_multi_document_yaml_converts_every_document():
+    path = write_yaml(YAML_MULTI)
+    doc = YamlConverter().extract(path)
+    titles = [s.title for s in doc.sections]
+    assert titles == ["Grunddaten", "Dokument 2 – Grunddaten", "Dokument 2 – lager"]
+    assert ("lager.ort", "Halle 2") in doc.sections[2].kv_pairs
+
+
+def test_yaml_streaming_matches_in_memory_output(tmp_path):
+    path = write_yaml(YAML_MULTI)
+    expected = YamlConverter().run(path)
+    out_path = tmp_path / "out.md"
+    result = YamlConverter().run_to_file(path, str(out_path), streaming=True)
+    assert out_path.read_text(encoding="utf-8").split("---", 2)[2] == expected.markdown_content.split("---", 2)[2]
+    assert result.validation.status == expected.validation.status
+
+
+@pytest.mark.parametrize("max_depth", [None, 1])
+def test_yaml_streaming_matches_in_memory_sections(tmp_path, max_depth):
+    content = "leer: []\nname: A\nprodukt:\n  teile: [{nr: 1}]\n---\n- {}\n- {a: {b: 1}}\n---\nnur: []\n"
+    path = write_yaml(content)
+    converter = YamlConverter(ConversionOptions(flatten_max_depth=max_depth))
+    expected = converter.run(path).markdown_content
+    out_path = tmp_path / "out.md"
+    converter.run_to_file(path, str(out_path), streaming=True)
+    assert out_path.read_text(encoding="utf-8").split("---", 2)[2] == expected.split("---", 2)[2]
+
+
+def test_yaml_streaming_validates_against_source_text(tmp_path):
+    # YAML re-renders these values (4.5, True, 0o17 -> 15), so the source tokens go missing
+    items = "".join(f"- nr: {i}\n  preis: {i}.50\n  aktiv: yes\n  code: 0o17\n" for i in range(1, 21))
+    path = write_yaml(items)
+    in_memory = YamlConverter().run(path).validation
+    streamed = YamlConverter().run_to_file(path, str(tmp_path / "out.md")).validation
+    assert in_memory.coverage_score < 0.95
+    assert streamed.status == "warning"
+    assert streamed.coverage_score < 0.95
+
+
+def test_yaml_pure_python_loader_fallback(monkeypatch):
+    import yaml
+
+    from knowledgeimporter.converters import yaml_converter
+
+    monkeypatch.setattr(yaml_converter, "SafeLoader", yaml.SafeLoader)
+    doc = YamlConverter().extract(write_yaml(YAML_SIMPLE))
+    assert ("name", "Artikel A") in doc.sections[0].kv_pairs
@@ -0,0 +1,49 @@
+"""Tests for the deferred loading of secrets at startup."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from knowledgeimporter.app import KnowledgeImporterApp
+from knowledgeimporter.models.config import AppConfig
+
+
+def _app() -> KnowledgeImporterApp:
+    page = MagicMock()
+    page.run_task.side_effect = lambda fn: asyncio.run(fn())
+    app = KnowledgeImporterApp(page)
+    app.config = AppConfig(last_source_dir="/alt")
+    return app
+
+
+def _load_secrets(app: KnowledgeImporterApp) -> None:
+    app._load_secrets()
+    app._secrets_worker._thread.join()
+
+
+def test_change_before_secrets_is_saved_once_loaded():
+    app = _app()
+    app._on_config_changed(app.config.model_copy(update={"last_source_dir": "/neu"}))
+    with (
+        patch("knowledgeimporter.app.load_config", return_value=AppConfig(langdock_api_key="sk-1")),
+        patch("knowledgeimporter.app.save_config") as save,
+    ):
+        _load_secrets(app)
+        app._config_writer.flush()
+    saved = save.call_args
+    assert saved.args[0].last_source_dir == "/neu"
+    assert saved.args[0].langdock_api_key == "sk-1"
+    assert saved.kwargs == {"keep_secrets": False}
+
+
+def test_change_before_failed_secrets_keeps_stored_secrets():
+    app = _app()
+    app._on_config_changed(app.config.model_copy(update={"last_source_dir": "/neu"}))
+    with (
+        patch("knowledgeimporter.app.load_config", side_effect=ValueError("kaputt")),
+        patch("knowledgeimporter.app.save_config") as save,
+    ):
+        _load_secrets(app)
+        app._config_writer.flush()
+    saved = save.call_args
+    assert saved.args[0].last_source_dir == "/neu"
+    assert saved.kwargs == {"keep_secrets": True}
@@ -52,6 +52,17 @@ class TestAppConfig:
         with pytest.raises(ValidationError):
             AppConfig(region="asia")
 
+    def test_validation_mode_invalid(self):
+        assert AppConfig().validation_mode == "full"
+        with pytest.raises(ValidationError):
+            AppConfig(validation_mode="partial")
+
+    def test_xlsx_sheet_workers_at_least_one(self):
+        assert AppConfig().xlsx_sheet_workers == 1
+        assert AppConfig(xlsx_sheet_workers=4).xlsx_sheet_workers == 4
+        with pytest.raises(ValidationError):
+            AppConfig(xlsx_sheet_workers=0)
+
     def test_model_dump_roundtrip(self):
         original = AppConfig(
             langdock_api_key="secret",
@@ -342,3 +342,15 @@ class TestConversionServiceUniversal:
         content = result.read_text(encoding="utf-8")
         assert "Testprodukt" in content
         service.cleanup()
+
+    def test_split_output_uses_part_budget(self, tmp_path):
+        from knowledgeimporter.converters.base import ConversionOptions
+
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("Name,Wert\nA,1\nB,2\nC,3\n", encoding="utf-8")
+        service = ConversionService(ConversionOptions(max_part_sections=2))
+        result = service.convert_file(csv_file)
+        parts = service.split_output(result)
+        assert [p.name for p in parts] == ["test_teil1.md", "test_teil2.md"]
+        assert ConversionService().split_output(result) == [result]
+        service.cleanup()
@@ -0,0 +1,139 @@
+"""Tests for source discovery — pattern matcher, ignore files, streaming scan."""
+
+import fnmatch
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from knowledgeimporter.services.discovery import FileScan, IgnoreRules, collect_files, compile_patterns
+from knowledgeimporter.utils.metrics import QUEUE_DEPTH
+
+
+def make_tree(root: Path, files: list[str]) -> None:
+    for rel in files:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding="utf-8")
+
+
+@pytest.mark.parametrize("name", ["a.md", "A.MD", "notes.txt", "x.csv", "data.json.bak", "[1].md", "a"])
+def test_compiled_matcher_agrees_with_fnmatch(name):
+    patterns = ["*.md", "*.csv", "[!.]*.json*", "a"]
+    expected = any(fnmatch.fnmatch(name, p) for p in patterns)
+    assert compile_patterns(patterns)(name) is expected
+
+
+def test_empty_patterns_match_nothing():
+    assert compile_patterns([])("a.md") is False
+
+
+@pytest.mark.parametrize(
+    ("pattern", "path", "is_dir", "expected"),
+    [
+        ("*.log", "a.log", False, True),
+        ("*.log", "sub/deep/a.log", False, True),
+        ("/top.md", "top.md", False, True),
+        ("/top.md", "sub/top.md", False, None),
+        ("build/", "build", True, True),
+        ("build/", "build", False, None),
+        ("docs/*.md", "docs/a.md", False, True),
+        ("docs/*.md", "docs/sub/a.md", False, None),
+        ("docs/**/*.md", "docs/sub/x/a.md", False, True),
+        ("**/tmp", "a/b/tmp", True, True),
+        ("file[0-9].md", "file3.md", False, True),
+    ],
+)
+def test_ignore_rule_matching(pattern, path, is_dir, expected):
+    assert IgnoreRules(Path("/"), [pattern]).match(path, is_dir) is expected
+
+
+def test_ignore_negation_and_comments():
+    rules = IgnoreRules(Path("/"), ["# comment", "", "*.md", "!keep.md"])
+    assert rules.match("drop.md", False) is True
+    assert rules.match("keep.md", False) is False
+
+
+def test_top_level_only_by_default(tmp_path):
+    make_tree(tmp_path, ["b.md", "a.md", "sub/c.md", "d.txt"])
+    assert [p.name for p in collect_files(tmp_path, ["*.md"])] == ["a.md", "b.md"]
+
+
+def test_recursive_scan_with_ignore_files(tmp_path):
+    make_tree(
+        tmp_path,
+        [
+            "a.md",
+            "draft.md",
+            "archive/old.md",
+            "docs/b.md",
+            "docs/private/secret.md",
+            "docs/sub/c.md",
+            "docs/sub/skip.md",
+        ],
+    )
+    (tmp_path / ".gitignore").write_text("archive/\ndraft.md\n", encoding="utf-8")
+    (tmp_path / "docs" / ".knowledgeignore").write_text("private/\nsub/skip.md\n", encoding="utf-8")
+
+    found = collect_files(tmp_path, ["*.md"], recursive=True)
+    assert [p.relative_to(tmp_path).as_posix() for p in found] == ["a.md", "docs/b.md", "docs/sub/c.md"]
+
+
+def test_flat_scan_ignores_ignore_files(tmp_path):
+    make_tree(tmp_path, ["a.md", "draft.md"])
+    (tmp_path / ".gitignore").write_text("draft.md\n", encoding="utf-8")
+    assert [p.name for p in collect_files(tmp_path, ["*.md"])] == ["a.md", "draft.md"]
+
+
+def test_scan_streams_and_counts(tmp_path):
+    make_tree(tmp_path, [f"d{i}/f{j}.md" for i in range(5) for j in range(3)])
+    scan = FileScan(tmp_path, ["*.md"], recursive=True, workers=3)
+    seen = []
+    for path in scan:
+        seen.append(path)
+        assert scan.found >= len(seen)
+    assert scan.done
+    assert scan.found == len(seen) == 15
+    # Files of one directory come in name order
+    d0 = [p.name for p in seen if p.parent.name == "d0"]
+    assert d0 == ["f0.md", "f1.md", "f2.md"]
+    assert QUEUE_DEPTH.get(queue="directories") == 0
+
+
+def test_close_stops_iteration(tmp_path):
+    make_tree(tmp_path, [f"d{i}/f.md" for i in range(20)])
+    scan = FileScan(tmp_path, ["*.md"], recursive=True, workers=2)
+    it = iter(scan)
+    next(it)
+    scan.close()
+    remaining = list(it)
+    assert len(remaining) < 20
+    assert not scan.done
+
+
+def test_cancel_event_stops_a_waiting_scan(tmp_path, monkeypatch):
+    make_tree(tmp_path, ["a.md", "slow/b.md"])
+    real_scandir = os.scandir
+    cancel = threading.Event()
+
+    def slow_scandir(path):
+        if Path(path).name == "slow":
+            cancel.set()
+            time.sleep(0.5)
+        return real_scandir(path)
+
+    monkeypatch.setattr("knowledgeimporter.services.discovery.os.scandir", slow_scandir)
+    scan = FileScan(tmp_path, ["*.md"], recursive=True, cancel=cancel)
+    start = time.monotonic()
+    names = [p.name for p in scan]
+    assert time.monotonic() - start < 0.4
+    assert names == ["a.md"]
+    assert not scan.done
+
+
+def test_missing_root_yields_nothing(tmp_path):
+    scan = FileScan(tmp_path / "missing", ["*.md"])
+    assert list(scan) == []
+    assert scan.done
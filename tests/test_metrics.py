@@ -0,0 +1,98 @@
+"""Tests for the metrics registry and its exports."""
+
+import urllib.request
+
+import pytest
+
+from knowledgeimporter.utils.metrics import MetricsRegistry, MetricsServer, _Metric, write_textfile
+
+
+@pytest.fixture
+def metrics():
+    registry = MetricsRegistry()
+    files = registry.counter("ki_files", "Files processed", ("stage", "format"))
+    seconds = registry.histogram("ki_seconds", "Time per file", ("format",), buckets=(0.5, 1.0))
+    depth = registry.gauge("ki_queue_depth", "Waiting items", ("queue",))
+    return registry, files, seconds, depth
+
+
+def test_prometheus_text_format(metrics):
+    registry, files, seconds, depth = metrics
+    files.inc(stage="convert", format=".csv")
+    files.inc(2, stage="convert", format=".csv")
+    seconds.observe(0.2, format=".csv")
+    seconds.observe(0.7, format=".csv")
+    seconds.observe(3.0, format=".csv")
+    depth.set(4, queue="files")
+
+    text = registry.render()
+    assert "# TYPE ki_files_total counter" in text
+    assert 'ki_files_total{stage="convert",format=".csv"} 3' in text
+    assert 'ki_seconds_bucket{format=".csv",le="0.5"} 1' in text
+    assert 'ki_seconds_bucket{format=".csv",le="1.0"} 2' in text
+    assert 'ki_seconds_bucket{format=".csv",le="+Inf"} 3' in text
+    assert 'ki_seconds_count{format=".csv"} 3' in text
+    assert 'ki_seconds_sum{format=".csv"} 3.9' in text
+    assert 'ki_queue_depth{queue="files"} 4' in text
+    assert "# EOF" not in text
+
+
+def test_openmetrics_format(metrics):
+    registry, files, _, _ = metrics
+    files.inc(stage="upload", format=".pdf")
+    text = registry.render(openmetrics=True)
+    assert "# TYPE ki_files counter" in text
+    assert 'ki_files_total{stage="upload",format=".pdf"} 1' in text
+    assert text.endswith("# EOF\n")
+
+
+def test_label_values_are_escaped(metrics):
+    registry, files, _, _ = metrics
+    files.inc(stage="convert", format='a"b\\c')
+    assert r'format="a\"b\\c"' in registry.render()
+
+
+def test_wrong_labels_and_negative_increments_rejected(metrics):
+    _, files, _, _ = metrics
+    with pytest.raises(ValueError):
+        files.inc(stage="convert")
+    with pytest.raises(ValueError):
+        files.inc(-1, stage="convert", format=".csv")
+
+
+def test_duplicate_registration_rejected(metrics):
+    registry, *_ = metrics
+    with pytest.raises(ValueError):
+        registry.counter("ki_files", "again")
+
+
+def test_metric_base_requires_samples_and_reset():
+    with pytest.raises(TypeError):
+        _Metric("ki_abstract", "no samples")
+
+
+def test_write_textfile_replaces_atomically(metrics, tmp_path):
+    registry, files, _, _ = metrics
+    files.inc(stage="convert", format=".csv")
+    path = write_textfile(tmp_path / "textfile" / "knowledgeimporter.prom", registry)
+    assert 'ki_files_total{stage="convert",format=".csv"} 1' in path.read_text(encoding="utf-8")
+    assert [p.name for p in path.parent.iterdir()] == ["knowledgeimporter.prom"]
+    # Prometheus text format for the textfile collector: no OpenMetrics terminator
+    assert "# EOF" not in path.read_text(encoding="utf-8")
+
+
+def test_http_endpoint_serves_both_formats(metrics):
+    registry, files, _, _ = metrics
+    files.inc(stage="upload", format=".md")
+    server = MetricsServer(0, metrics=registry)
+    try:
+        url = f"http://127.0.0.1:{server.port}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert "ki_files_total" in response.read().decode()
+        request = urllib.request.Request(url, headers={"Accept": "application/openmetrics-text"})
+        with urllib.request.urlopen(request, timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+            assert response.read().decode().endswith("# EOF\n")
+    finally:
+        server.close()
@@ -0,0 +1,64 @@
+"""Tests for the cProfile/tracemalloc profiling hooks."""
+
+import pstats
+import time
+import tracemalloc
+
+from knowledgeimporter.utils.profiling import BatchProfiler, profile_batch, profile_conversion, profiling_settings
+
+
+def _busy(seconds: float) -> list[bytes]:
+    end = time.perf_counter() + seconds
+    blocks = []
+    while time.perf_counter() < end:
+        blocks.append(bytes(1024))
+    return blocks
+
+
+def test_batch_profile_and_allocation_report(tmp_path):
+    profiler = BatchProfiler.for_log(tmp_path / "upload_20260101_120000.log")
+    with profile_batch(profiler):
+        with profile_conversion("a.csv"):
+            _busy(0.01)
+
+    assert [p.name for p in profiler.written] == ["upload_20260101_120000.prof", "upload_20260101_120000.alloc.txt"]
+    stats = pstats.Stats(str(profiler.written[0]))
+    assert any(func[2] == "_busy" for func in stats.stats)
+    report = profiler.written[1].read_text(encoding="utf-8")
+    assert "Top 25 allocations by line:" in report
+    assert not tracemalloc.is_tracing()
+
+
+def test_threshold_keeps_only_slow_conversions(tmp_path):
+    profiler = BatchProfiler(tmp_path / "upload_x", threshold_seconds=0.05)
+    with profile_batch(profiler):
+        with profile_conversion("fast.csv"):
+            pass
+        with profile_conversion("slow report.xlsx"):
+            _busy(0.06)
+
+    assert sorted(p.name for p in profiler.written) == [
+        "upload_x.slow_report.xlsx.alloc.txt",
+        "upload_x.slow_report.xlsx.prof",
+    ]
+    assert not (tmp_path / "upload_x.prof").exists()
+
+
+def test_no_profiler_is_a_no_op(tmp_path):
+    with profile_batch(None), profile_conversion("a.csv"):
+        pass
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_env_overrides_config(monkeypatch):
+    monkeypatch.delenv("KNOWLEDGEIMPORTER_PROFILE", raising=False)
+    monkeypatch.delenv("KNOWLEDGEIMPORTER_PROFILE_THRESHOLD", raising=False)
+    assert profiling_settings(False, 0.0) == (False, 0.0)
+
+    monkeypatch.setenv("KNOWLEDGEIMPORTER_PROFILE", "1")
+    monkeypatch.setenv("KNOWLEDGEIMPORTER_PROFILE_THRESHOLD", "2.5")
+    assert profiling_settings(False, 0.0) == (True, 2.5)
+
+    monkeypatch.setenv("KNOWLEDGEIMPORTER_PROFILE", "off")
+    monkeypatch.setenv("KNOWLEDGEIMPORTER_PROFILE_THRESHOLD", "fast")
+    assert profiling_settings(True, 1.0) == (False, 1.0)
@@ -0,0 +1,68 @@
+"""Tests for the rate-limited progress aggregator."""
+
+import threading
+import time
+
+from knowledgeimporter.utils.progress import ProgressAggregator
+
+
+def _collector():
+    pushed = []
+    event = threading.Event()
+
+    def push(state):
+        pushed.append(state)
+        event.set()
+
+    return pushed, event, push
+
+
+def test_burst_is_coalesced_into_leading_and_trailing_push():
+    pushed, event, push = _collector()
+    progress = ProgressAggregator(push, interval=0.3)
+    for i in range(1000):
+        progress.update(i, 1000, f"f{i}.md", "error" if i % 100 == 0 else "success")
+    assert len(pushed) == 1
+    assert pushed[0].current == 0
+
+    event.clear()
+    assert event.wait(2)
+    assert len(pushed) == 2
+    last = pushed[-1]
+    assert (last.current, last.filename, last.status) == (999, "f999.md", "success")
+    assert last.events == 1000
+    assert last.failed == 10
+    assert progress.events == 1000
+
+
+def test_rate_is_bounded():
+    pushed, _, push = _collector()
+    progress = ProgressAggregator(push, interval=0.02)
+    end = time.monotonic() + 0.2
+    i = 0
+    while time.monotonic() < end:
+        progress.update(i, 0, "f", "uploading")
+        i += 1
+    progress.flush()
+    # 0.2 s at 50 Hz: about 10 pushes (+ leading and flushed), for many thousand events
+    assert len(pushed) <= 15
+    assert pushed[-1].current == i - 1
+
+
+def test_flush_and_close():
+    pushed, _, push = _collector()
+    progress = ProgressAggregator(push, interval=10)
+    progress.update(1, 3, "a", "success")
+    progress.update(2, 3, "b", "success")
+    progress.flush()
+    assert [s.current for s in pushed] == [1, 2]
+
+    progress.update(3, 3, "c", "success")
+    progress.close()
+    # The state pending at close is still delivered, later events are not
+    assert [s.current for s in pushed] == [1, 2, 3]
+    assert (pushed[-1].filename, pushed[-1].events) == ("c", 3)
+    progress.update(4, 4, "d", "success")
+    progress.flush()
+    progress.close()
+    assert [s.current for s in pushed] == [1, 2, 3]
@@ -0,0 +1,32 @@
+"""Tests for building the config from the settings form."""
+
+from unittest.mock import MagicMock
+
+from knowledgeimporter.models.config import AppConfig
+from knowledgeimporter.views.settings_view import SettingsView
+
+
+def test_save_keeps_settings_without_form_fields():
+    config = AppConfig(
+        last_source_dir="/daten",
+        history_retention_days=30,
+        metrics_textfile="/var/lib/node_exporter/knowledgeimporter.prom",
+        metrics_port=9100,
+        profiling=True,
+        profile_threshold_seconds=2.5,
+    )
+    saved = []
+    view = SettingsView(config=config, page=MagicMock(), on_config_saved=saved.append)
+    view._folder_name_field.value = "Handbuch"
+
+    view._save_settings(MagicMock())
+
+    assert len(saved) == 1
+    result = saved[0]
+    assert result.folder_name == "Handbuch"
+    assert result.last_source_dir == "/daten"
+    assert result.history_retention_days == 30
+    assert result.metrics_textfile == "/var/lib/node_exporter/knowledgeimporter.prom"
+    assert result.metrics_port == 9100
+    assert result.profiling is True
+    assert result.profile_threshold_seconds == 2.5
@@ -0,0 +1,168 @@
+"""Tests for the cached source directory snapshot."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from knowledgeimporter.services.snapshot import ScanCancelled, SnapshotCache, SourceSnapshot
+
+
+def make_settled_tree(root: Path, files: dict[str, str]) -> None:
+    """Create files and date every directory back, so the snapshot counts as settled."""
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    past = time.time() - 60
+    for dirpath, _dirnames, _filenames in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def test_summary_counts_per_extension_and_bytes(tmp_path):
+    make_settled_tree(tmp_path, {"a.csv": "12345", "b.csv": "1", "c.md": "123", "d.png": "x"})
+    summary = SourceSnapshot(tmp_path).summary(["*.csv", "*.md"])
+    assert summary.count == 3
+    assert summary.total_bytes == 9
+    assert summary.by_extension == {".csv": 2, ".md": 1}
+
+
+def test_scan_lists_matches_sorted(tmp_path):
+    make_settled_tree(tmp_path, {"b.md": "", "a.md": "", "sub/c.md": ""})
+    snapshot = SourceSnapshot(tmp_path, recursive=True)
+    scan = snapshot.scan(["*.md"])
+    assert scan.found == 3
+    assert [p.relative_to(tmp_path).as_posix() for p in scan] == ["a.md", "b.md", "sub/c.md"]
+
+
+def test_cache_reuses_snapshot_until_directory_changes(tmp_path):
+    make_settled_tree(tmp_path, {"sub/a.md": ""})
+    cache = SnapshotCache()
+    first = cache.get(tmp_path, recursive=True)
+    assert cache.get(tmp_path, recursive=True) is first
+    assert cache.fresh(tmp_path, recursive=True) is first
+
+    (tmp_path / "sub" / "b.md").write_text("", encoding="utf-8")
+    assert first.is_stale()
+    assert cache.fresh(tmp_path, recursive=True) is None
+    second = cache.get(tmp_path, recursive=True)
+    assert second is not first
+    assert second.summary(["*.md"]).count == 2
+
+
+def test_recently_modified_directory_is_not_trusted(tmp_path):
+    (tmp_path / "a.md").write_text("", encoding="utf-8")
+    assert SourceSnapshot(tmp_path).is_stale()
+
+
+def test_ignore_file_change_invalidates(tmp_path):
+    make_settled_tree(tmp_path, {"a.md": "", "b.md": "", ".gitignore": ""})
+    snapshot = SourceSnapshot(tmp_path, recursive=True)
+    assert snapshot.summary(["*.md"]).count == 2
+    past = time.time() - 30
+    (tmp_path / ".gitignore").write_text("b.md\n", encoding="utf-8")
+    os.utime(tmp_path, (past - 30, past - 30))
+    assert snapshot.is_stale()
+    assert SourceSnapshot(tmp_path, recursive=True).summary(["*.md"]).count == 1
+
+
+def test_invalidate_drops_snapshot(tmp_path):
+    make_settled_tree(tmp_path, {"a.md": ""})
+    cache = SnapshotCache()
+    first = cache.get(tmp_path)
+    cache.invalidate(tmp_path)
+    assert cache.fresh(tmp_path) is None
+    assert cache.get(tmp_path) is not first
+
+
+def test_missing_directory_is_empty_until_created(tmp_path):
+    missing = tmp_path / "missing"
+    snapshot = SourceSnapshot(missing)
+    assert snapshot.entries == []
+    assert not snapshot.is_stale()
+    missing.mkdir()
+    assert snapshot.is_stale()
+
+
+def test_entries_reported_while_scanning(tmp_path):
+    make_settled_tree(tmp_path, {"a.md": "", "sub/b.md": "", "sub/c.csv": ""})
+    seen = []
+    SnapshotCache().get(tmp_path, recursive=True, on_entry=lambda e: seen.append(e.path.name))
+    assert sorted(seen) == ["a.md", "b.md", "c.csv"]
+
+
+def test_cancelled_scan_is_not_cached(tmp_path):
+    make_settled_tree(tmp_path, {f"d{i}/f.md": "" for i in range(20)})
+    cache = SnapshotCache()
+    cancel = threading.Event()
+    with pytest.raises(ScanCancelled):
+        cache.get(tmp_path, recursive=True, on_entry=lambda _e: cancel.set(), cancel=cancel)
+    assert cache.fresh(tmp_path, recursive=True) is None
+    assert len(cache.get(tmp_path, recursive=True).entries) == 20
+
+
+def _blocked_scan(cache, root, release, **kwargs):
+    """Start a scan of root in a thread that blocks on its first entry until release is set."""
+    started = threading.Event()
+    result = {}
+
+    def on_entry(_entry):
+        started.set()
+        release.wait(5)
+
+    def run():
+        try:
+            result["snapshot"] = cache.get(root, recursive=True, on_entry=on_entry, **kwargs)
+        except ScanCancelled as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert started.wait(5)
+    return thread, result
+
+
+def test_scan_runs_outside_the_lock_and_is_shared(tmp_path):
+    make_settled_tree(tmp_path / "a", {"x.md": ""})
+    make_settled_tree(tmp_path / "b", {"y.md": ""})
+    cache = SnapshotCache()
+    release = threading.Event()
+    scanner, result = _blocked_scan(cache, tmp_path / "a", release)
+
+    # Another directory is scanned while the first scan is still running
+    assert cache.get(tmp_path / "b", recursive=True).summary(["*.md"]).count == 1
+    assert cache.fresh(tmp_path / "a", recursive=True) is None
+
+    waiter_result = {}
+    waiter = threading.Thread(target=lambda: waiter_result.setdefault("s", cache.get(tmp_path / "a", recursive=True)))
+    waiter.start()
+    waiter.join(0.2)
+    assert waiter.is_alive()
+    release.set()
+    scanner.join()
+    waiter.join()
+    assert waiter_result["s"] is result["snapshot"]
+
+
+def test_waiting_caller_can_cancel_and_rescans_after_cancelled_scan(tmp_path):
+    make_settled_tree(tmp_path, {"x.md": ""})
+    cache = SnapshotCache()
+    release, cancel_first = threading.Event(), threading.Event()
+    scanner, result = _blocked_scan(cache, tmp_path, release, cancel=cancel_first)
+
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(ScanCancelled):
+        cache.get(tmp_path, recursive=True, cancel=cancel)
+
+    waiter_result = {}
+    waiter = threading.Thread(target=lambda: waiter_result.setdefault("s", cache.get(tmp_path, recursive=True)))
+    waiter.start()
+    cancel_first.set()
+    release.set()
+    scanner.join()
+    waiter.join(5)
+    assert isinstance(result["error"], ScanCancelled)
+    assert waiter_result["s"].summary(["*.md"]).count == 1
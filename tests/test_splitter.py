@@ -0,0 +1,82 @@
+"""Tests for splitting converted Markdown documents into parts."""
+
+import yaml
+
+from knowledgeimporter.converters.base import RawDocument, Section, build_frontmatter, sections_to_markdown
+from knowledgeimporter.services.splitter import part_name, split_markdown
+
+
+def _write_doc(path, count: int) -> None:
+    doc = RawDocument(str(path), "csv", "Artikel", "de", None, [], {}, "")
+    sections = [Section(level=2, title=f"Zeile {i}", kv_pairs=[("Nr", str(i))]) for i in range(2, count + 2)]
+    path.write_text(
+        build_frontmatter(doc) + "\n\n# Artikel\n\n" + sections_to_markdown(sections),
+        encoding="utf-8",
+    )
+
+
+def _frontmatter(text: str) -> dict:
+    return yaml.safe_load(text.split("---", 2)[1])
+
+
+def test_split_by_section_count(tmp_path):
+    src = tmp_path / "Artikel.md"
+    _write_doc(src, 5)
+    out = tmp_path / "parts"
+    out.mkdir()
+    parts = split_markdown(src, out, max_sections=2)
+    assert [p.name for p in parts] == ["Artikel_teil1.md", "Artikel_teil2.md", "Artikel_teil3.md"]
+
+    texts = [p.read_text(encoding="utf-8") for p in parts]
+    meta = _frontmatter(texts[1])
+    assert meta["quelldatei"] == "Artikel.md"
+    assert (meta["teil"], meta["teile"]) == (2, 3)
+    assert "# Artikel (Teil 2/3)" in texts[1]
+    assert texts[1].count("## Zeile") == 2
+    # Every section ends up in exactly one part
+    bodies = "".join(t.split("(Teil", 1)[1].split("\n", 1)[1].lstrip("\n") for t in texts)
+    assert bodies == src.read_text(encoding="utf-8").split("# Artikel\n\n", 1)[1]
+
+
+def test_split_by_bytes_keeps_parts_below_budget(tmp_path):
+    src = tmp_path / "Artikel.md"
+    _write_doc(src, 200)
+    parts = split_markdown(src, tmp_path, max_bytes=2048)
+    assert len(parts) > 1
+    assert all(p.stat().st_size <= 2048 for p in parts)
+
+
+def test_split_returns_source_when_it_fits(tmp_path):
+    src = tmp_path / "Artikel.md"
+    _write_doc(src, 3)
+    assert split_markdown(src, tmp_path, max_bytes=1024 * 1024) == [src]
+    assert split_markdown(src, tmp_path, max_sections=3) == [src]
+    assert split_markdown(src, tmp_path) == [src]
+
+
+def test_split_ignores_headings_in_code_blocks(tmp_path):
+    src = tmp_path / "notes.md"
+    src.write_text("# Notizen\n\n## A\n\n```\n## kein Abschnitt\n```\n\n## B\n\ntext\n", encoding="utf-8")
+    parts = split_markdown(src, tmp_path, max_sections=1)
+    assert len(parts) == 2
+    assert "## kein Abschnitt" in parts[0].read_text(encoding="utf-8")
+
+
+def test_part_names_are_zero_padded():
+    assert part_name("Artikel", 3, 12) == "Artikel_teil03.md"
+    assert part_name("Artikel", 3, 9) == "Artikel_teil3.md"
+
+
+def test_parts_copy_the_frontmatter_verbatim(tmp_path):
+    src = tmp_path / "Artikel.md"
+    _write_doc(src, 3)
+    original = src.read_text(encoding="utf-8").split("---", 2)[1]
+    parts = split_markdown(src, tmp_path, max_sections=2)
+    text = parts[0].read_text(encoding="utf-8")
+    assert text.startswith("---" + original)
+    assert isinstance(_frontmatter(text)["konvertiert"], str)
+
+    # Splitting a part again renumbers it instead of repeating the keys
+    again = split_markdown(parts[0], tmp_path, max_sections=1)
+    meta = _frontmatter(again[1].read_text(encoding="utf-8"))
+    assert (meta["teil"], meta["teile"]) == (2, 2)
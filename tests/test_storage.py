@@ -1,9 +1,32 @@
 """Tests for storage utilities — encryption roundtrip, config load/save."""
 
 import json
+import threading
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from knowledgeimporter.models.config import AppConfig
+from knowledgeimporter.utils.storage import clear_secret_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_secret_cache():
+    clear_secret_cache()
+    yield
+    clear_secret_cache()
+
+
+@contextmanager
+def _config_in(tmp_path):
+    """Point the config storage at a temporary directory."""
+    config_file = tmp_path / "config.json"
+    with (
+        patch("knowledgeimporter.utils.storage.CONFIG_DIR", tmp_path),
+        patch("knowledgeimporter.utils.storage.CONFIG_FILE", config_file),
+    ):
+        yield config_file
 
 
 class TestGetOrCreateMasterKey:
@@ -38,19 +61,7 @@ class TestSaveAndLoadConfig:
     """Test config save/load with encryption."""
 
     @patch("knowledgeimporter.utils.storage.get_or_create_master_key")
-    @patch("knowledgeimporter.utils.storage.CONFIG_FILE")
-    @patch("knowledgeimporter.utils.storage.CONFIG_DIR")
-    def test_save_config_encrypts_api_key(self, mock_dir, mock_file, mock_get_key):
-        mock_get_key.return_value = "dGVzdC1rZXktMTIzNDU2Nzg5MDEyMzQ1Njc4OTAxMjM0NTY3ODkwMTI="  # noqa: E501
-
-        mock_dir.mkdir = MagicMock()
-        written_data = {}
-
-        def capture_write(content, encoding=None):
-            written_data["json"] = content
-
-        mock_file.write_text = capture_write
-
+    def test_save_config_encrypts_api_key(self, mock_get_key, tmp_path):
         # Use real FernetEncryption for roundtrip
         from eq_chatbot_core.security.encryption import FernetEncryption
 
@@ -60,10 +71,12 @@ class TestSaveAndLoadConfig:
         from knowledgeimporter.utils.storage import save_config
 
         config = AppConfig(langdock_api_key="my-secret-api-key", folder_name="Test")
-        save_config(config)
+        with _config_in(tmp_path) as config_file:
+            save_config(config)
 
-        assert "json" in written_data
-        saved = json.loads(written_data["json"])
+        assert config_file.exists()
+        assert not config_file.with_suffix(".tmp").exists()
+        saved = json.loads(config_file.read_text(encoding="utf-8"))
         # API key should NOT be plaintext
         assert saved["langdock_api_key"] != "my-secret-api-key"
         assert saved["langdock_api_key"] != ""
@@ -71,23 +84,14 @@ class TestSaveAndLoadConfig:
         assert saved["folder_name"] == "Test"
 
     @patch("knowledgeimporter.utils.storage.get_or_create_master_key")
-    @patch("knowledgeimporter.utils.storage.CONFIG_FILE")
-    @patch("knowledgeimporter.utils.storage.CONFIG_DIR")
-    def test_save_config_empty_key_not_encrypted(self, mock_dir, mock_file, mock_get_key):
-        mock_dir.mkdir = MagicMock()
-        written_data = {}
-
-        def capture_write(content, encoding=None):
-            written_data["json"] = content
-
-        mock_file.write_text = capture_write
-
+    def test_save_config_empty_key_not_encrypted(self, mock_get_key, tmp_path):
         from knowledgeimporter.utils.storage import save_config
 
         config = AppConfig(langdock_api_key="", folder_name="Test")
-        save_config(config)
+        with _config_in(tmp_path) as config_file:
+            save_config(config)
 
-        saved = json.loads(written_data["json"])
+        saved = json.loads(config_file.read_text(encoding="utf-8"))
         assert saved["langdock_api_key"] == ""
         mock_get_key.assert_not_called()
 
@@ -131,6 +135,27 @@ class TestSaveAndLoadConfig:
         assert config.langdock_api_key == "my-secret-api-key"
         assert config.default_folder_id == "folder-123"
 
+    @patch("knowledgeimporter.utils.storage.get_or_create_master_key")
+    @patch("knowledgeimporter.utils.storage.CONFIG_FILE")
+    def test_load_config_without_decrypt_skips_keyring(self, mock_file, mock_get_key):
+        config_data = {
+            "langdock_api_key": "gAAAA-encrypted",
+            "default_folder_id": "gAAAA-encrypted",
+            "folder_name": "Test",
+            "last_source_dir": "/data/docs",
+        }
+        mock_file.exists.return_value = True
+        mock_file.read_text.return_value = json.dumps(config_data)
+
+        from knowledgeimporter.utils.storage import load_config
+
+        config = load_config(decrypt=False)
+        mock_get_key.assert_not_called()
+        assert config.langdock_api_key == ""
+        assert config.default_folder_id == ""
+        assert config.folder_name == "Test"
+        assert config.last_source_dir == "/data/docs"
+
     @patch("knowledgeimporter.utils.storage.CONFIG_FILE")
     def test_load_config_corrupt_json(self, mock_file):
         mock_file.exists.return_value = True
@@ -206,3 +231,179 @@ class TestValidateFolder:
         from knowledgeimporter.utils.storage import test_api_connection
 
         assert test_api_connection("") is False
+
+    def test_successful_validation_is_cached(self):
+        from knowledgeimporter.utils.storage import clear_validation_cache, validate_folder
+
+        clear_validation_cache()
+        mock_km = MagicMock()
+        mock_km.list_files.return_value = [{"id": "f1", "name": "file1.md"}]
+        with patch(
+            "eq_chatbot_core.providers.langdock_provider.LangDockKnowledgeManager",
+            return_value=mock_km,
+        ):
+            assert validate_folder("cached-key", "cached-folder") == (True, 1)
+            assert validate_folder("cached-key", "cached-folder") == (True, 1)
+            assert mock_km.list_files.call_count == 1
+
+            # Another folder is checked again, and so is any folder after clearing
+            validate_folder("cached-key", "other-folder")
+            clear_validation_cache()
+            validate_folder("cached-key", "cached-folder")
+            assert mock_km.list_files.call_count == 3
+
+    def test_failed_validation_is_not_cached(self):
+        from knowledgeimporter.utils.storage import clear_validation_cache, validate_folder
+
+        clear_validation_cache()
+        mock_km = MagicMock()
+        mock_km.list_files.side_effect = [RuntimeError("timeout"), [{"id": "f1", "name": "file1.md"}]]
+        with patch(
+            "eq_chatbot_core.providers.langdock_provider.LangDockKnowledgeManager",
+            return_value=mock_km,
+        ):
+            assert validate_folder("retry-key", "folder") == (False, 0)
+            assert validate_folder("retry-key", "folder") == (True, 1)
+
+
+class TestSecretCache:
+    """Test the cached master key and reuse of unchanged ciphertexts."""
+
+    @patch("knowledgeimporter.utils.storage.keyring")
+    def test_master_key_read_once(self, mock_keyring):
+        mock_keyring.get_password.return_value = "existing-key"
+
+        from knowledgeimporter.utils.storage import get_or_create_master_key
+
+        assert get_or_create_master_key() == "existing-key"
+        assert get_or_create_master_key() == "existing-key"
+        mock_keyring.get_password.assert_called_once()
+
+        clear_secret_cache()
+        get_or_create_master_key()
+        assert mock_keyring.get_password.call_count == 2
+
+    @patch("knowledgeimporter.utils.storage.get_or_create_master_key")
+    def test_unchanged_secrets_not_reencrypted(self, mock_get_key, tmp_path):
+        from eq_chatbot_core.security.encryption import FernetEncryption
+
+        from knowledgeimporter.utils.storage import load_config, save_config
+
+        mock_get_key.return_value = FernetEncryption.generate_key()
+        config = AppConfig(langdock_api_key="sk-1", default_folder_id="f-1", last_source_dir="/a")
+        with _config_in(tmp_path) as config_file:
+            save_config(config)
+            first = json.loads(config_file.read_text(encoding="utf-8"))
+
+            with patch("knowledgeimporter.utils.storage.FernetEncryption") as mock_fernet:
+                save_config(config.model_copy(update={"last_source_dir": "/b"}))
+                mock_fernet.assert_not_called()
+            second = json.loads(config_file.read_text(encoding="utf-8"))
+            assert second["langdock_api_key"] == first["langdock_api_key"]
+            assert second["last_source_dir"] == "/b"
+
+            save_config(config.model_copy(update={"langdock_api_key": "sk-2"}))
+            third = json.loads(config_file.read_text(encoding="utf-8"))
+            assert third["langdock_api_key"] != first["langdock_api_key"]
+            assert third["default_folder_id"] == first["default_folder_id"]
+
+            # Ciphertexts read at load time are reused too
+            clear_secret_cache()
+            loaded = load_config()
+            with patch("knowledgeimporter.utils.storage.FernetEncryption") as mock_fernet:
+                save_config(loaded)
+                mock_fernet.assert_not_called()
+        assert loaded.langdock_api_key == "sk-2"
+
+    @patch("knowledgeimporter.utils.storage.get_or_create_master_key")
+    def test_secret_cache_access_is_locked(self, mock_get_key, tmp_path):
+        from eq_chatbot_core.security.encryption import FernetEncryption
+
+        from knowledgeimporter.utils import storage
+
+        mock_get_key.return_value = FernetEncryption.generate_key()
+        config = AppConfig(langdock_api_key="sk-1")
+        with _config_in(tmp_path) as config_file:
+            with storage._secret_lock:
+                saver = threading.Thread(target=storage.save_config, args=(config,))
+                saver.start()
+                saver.join(0.2)
+                assert saver.is_alive()
+                assert not config_file.exists()
+            saver.join()
+            assert storage.load_config().langdock_api_key == "sk-1"
+
+    @patch("knowledgeimporter.utils.storage.get_or_create_master_key")
+    def test_identical_save_is_skipped(self, mock_get_key, tmp_path):
+        from knowledgeimporter.utils.storage import save_config
+
+        config = AppConfig(folder_name="Test")
+        with _config_in(tmp_path) as config_file:
+            save_config(config)
+            config_file.unlink()
+            save_config(config)
+            assert not config_file.exists()
+            save_config(config.model_copy(update={"folder_name": "Neu"}))
+            assert json.loads(config_file.read_text(encoding="utf-8"))["folder_name"] == "Neu"
+
+
+class TestConfigWriter:
+    """Test debounced config saves."""
+
+    def test_burst_is_written_once_with_latest_config(self):
+        from knowledgeimporter.utils.storage import ConfigWriter
+
+        saved = []
+        done = threading.Event()
+
+        def save(config):
+            saved.append(config)
+            done.set()
+
+        writer = ConfigWriter(delay=0.05, save=save)
+        config = AppConfig()
+        for i in range(20):
+            config.last_source_dir = f"/quelle/{i}"
+            writer.schedule(config)
+        assert done.wait(2)
+        writer.flush()
+        assert [c.last_source_dir for c in saved] == ["/quelle/19"]
+        # A copy was scheduled, not the live object
+        config.last_source_dir = "/anders"
+        assert saved[0].last_source_dir == "/quelle/19"
+
+    def test_flush_writes_pending_save_and_raises(self):
+        from knowledgeimporter.utils.storage import ConfigWriter
+
+        save = MagicMock(side_effect=OSError("disk full"))
+        writer = ConfigWriter(delay=10, save=save)
+        writer.schedule(AppConfig(folder_name="Test"))
+        with pytest.raises(OSError):
+            writer.flush()
+        save.assert_called_once()
+        writer.flush()
+        save.assert_called_once()
+
+
+class TestKeepSecrets:
+    """Test saving without touching the stored secrets."""
+
+    @patch("knowledgeimporter.utils.storage.get_or_create_master_key")
+    def test_keep_secrets_preserves_stored_ciphertext(self, mock_get_key, tmp_path):
+        from eq_chatbot_core.security.encryption import FernetEncryption
+
+        from knowledgeimporter.utils.storage import save_config
+
+        mock_get_key.return_value = FernetEncryption.generate_key()
+        with _config_in(tmp_path) as config_file:
+            save_config(AppConfig(langdock_api_key="sk-1", default_folder_id="f-1", last_source_dir="/a"))
+            stored = json.loads(config_file.read_text(encoding="utf-8"))
+            mock_get_key.reset_mock()
+
+            save_config(AppConfig(last_source_dir="/b"), keep_secrets=True)
+            saved = json.loads(config_file.read_text(encoding="utf-8"))
+
+        mock_get_key.assert_not_called()
+        assert saved["last_source_dir"] == "/b"
+        assert saved["langdock_api_key"] == stored["langdock_api_key"]
+        assert saved["default_folder_id"] == stored["default_folder_id"]
@@ -0,0 +1,125 @@
+"""Tests for tracing spans and the Chrome trace exporter."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from knowledgeimporter.converters.csv_converter import CsvConverter
+from knowledgeimporter.utils.tracing import Tracer, activate, format_breakdown, span
+
+
+def test_span_without_tracer_is_noop():
+    with span("extract", file="a.csv") as args:
+        args["bytes"] = 3
+    # Nothing to assert on: no active tracer must not fail
+
+
+def test_active_tracer_records_spans_with_args():
+    tracer = Tracer()
+    with activate(tracer):
+        with span("upload", file="a.md") as args:
+            args["bytes"] = 42
+    assert len(tracer.spans) == 1
+    recorded = tracer.spans[0]
+    assert recorded.name == "upload"
+    assert recorded.args == {"file": "a.md", "bytes": 42}
+    assert recorded.duration_ns >= 0
+
+
+def test_span_recorded_when_block_raises():
+    tracer = Tracer()
+    with activate(tracer), pytest.raises(RuntimeError), span("upload", file="a.md"):
+        raise RuntimeError("boom")
+    assert [s.name for s in tracer.spans] == ["upload"]
+
+
+def test_activate_is_scoped():
+    tracer = Tracer()
+    with activate(tracer):
+        pass
+    with span("extract"):
+        pass
+    assert tracer.spans == []
+
+
+def test_breakdown_sums_per_file_and_stage():
+    tracer = Tracer()
+    for name in ("upload_part", "upload_part", "convert"):
+        with tracer.span(name, file="a.csv"):
+            pass
+    with tracer.span("convert", file="b.csv"):
+        pass
+    assert list(tracer.breakdown("a.csv")) == ["upload_part", "convert"]
+    assert tracer.breakdown("c.csv") == {}
+
+
+def test_breakdown_matches_recorded_spans():
+    tracer = Tracer()
+    for i in range(50):
+        with tracer.span("convert", file=f"{i % 5}.csv"):
+            pass
+    with tracer.span("upload") as args:
+        args["file"] = "0.csv"
+    expected = sum(s.duration_ns for s in tracer.spans if s.args["file"] == "0.csv" and s.name == "convert") / 1e9
+    breakdown = tracer.breakdown("0.csv")
+    assert breakdown["convert"] == pytest.approx(expected)
+    assert "upload" in breakdown
+    breakdown["convert"] = -1.0
+    assert tracer.breakdown("0.csv")["convert"] == pytest.approx(expected)
+
+
+def test_breakdown_reports_self_time_of_nested_spans():
+    tracer = Tracer()
+    with tracer.span("convert", file="a.csv"):
+        with tracer.span("extract", file="a.csv"):
+            time.sleep(0.02)
+        with tracer.span("markdown", file="a.csv"):
+            time.sleep(0.01)
+    convert, extract, markdown = sorted(tracer.spans, key=lambda s: s.start_ns)
+    breakdown = tracer.breakdown("a.csv")
+    assert breakdown["extract"] == pytest.approx(extract.duration_ns / 1e9)
+    assert breakdown["convert"] == pytest.approx(
+        (convert.duration_ns - extract.duration_ns - markdown.duration_ns) / 1e9
+    )
+    assert sum(breakdown.values()) == pytest.approx(convert.duration_ns / 1e9)
+    # The trace keeps the full duration of the outer span
+    assert convert.duration_ns >= extract.duration_ns + markdown.duration_ns
+
+
+def test_format_breakdown():
+    assert format_breakdown({"convert": 0.414, "upload": 1.2}) == "convert 0.41s, upload 1.20s"
+
+
+def test_chrome_trace_export(tmp_path):
+    tracer = Tracer()
+    with tracer.span("convert", file="a.csv", bytes_in=10):
+        pass
+
+    def upload():
+        with tracer.span("upload", file="a.csv"):
+            pass
+
+    worker = threading.Thread(target=upload)
+    worker.start()
+    worker.join()
+
+    path = tracer.write_chrome_trace(tmp_path / "upload.trace.json")
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    assert [e["name"] for e in events] == ["convert", "upload"]
+    assert events[0]["ph"] == "X"
+    assert events[0]["args"] == {"file": "a.csv", "bytes_in": 10}
+    assert {"ts", "dur", "pid", "tid"} <= set(events[0])
+    assert events[0]["tid"] != events[1]["tid"]
+
+
+def test_converter_stages_traced(tmp_path):
+    src = tmp_path / "a.csv"
+    src.write_text("Name,Preis\nA,1\n", encoding="utf-8")
+    tracer = Tracer()
+    with activate(tracer):
+        CsvConverter().run_to_file(str(src), str(tmp_path / "a.md"), streaming=False)
+        CsvConverter().run_to_file(str(src), str(tmp_path / "b.md"))
+    assert [s.name for s in tracer.spans] == ["extract", "markdown", "validate", "write", "stream"]
+    assert tracer.spans[-1].args["bytes"] == (tmp_path / "b.md").stat().st_size
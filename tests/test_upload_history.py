@@ -0,0 +1,93 @@
+"""Tests for the SQLite upload history."""
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from knowledgeimporter.models.config import AppConfig
+from knowledgeimporter.utils.upload_history import UploadHistory
+
+
+def _history(tmp_path, retention_days=0):
+    return UploadHistory(tmp_path / "history.sqlite3", retention_days=retention_days)
+
+
+def test_session_and_files_are_recorded(tmp_path):
+    history = _history(tmp_path)
+    session = history.start_session("/src", "folder", tmp_path / "upload_1.log")
+    session.record_file(Path("/src/a.csv"), "success", 1000, 0.5, 1.5)
+    session.record_file(Path("/src/b.pdf"), "error", 10, error="boom")
+    session.finish({"total": 2, "success": 1, "failed": 1})
+
+    [row] = history.recent_sessions()
+    assert row["folder_id"] == "folder"
+    assert row["total"] == 2
+    assert row["failed"] == 1
+    assert row["finished_at"] is not None
+    history.close()
+
+
+def test_slowest_formats_orders_by_throughput(tmp_path):
+    history = _history(tmp_path)
+    session = history.start_session("/src", "folder")
+    session.record_file(Path("a.csv"), "success", 1000, 0.1, 0.1)
+    session.record_file(Path("b.pdf"), "success", 1000, 4.0, 1.0)
+    session.record_file(Path("c.pdf"), "error", 1000, 9.0)
+
+    stats = history.slowest_formats(days=30)
+    assert [s.ext for s in stats] == [".pdf", ".csv"]
+    assert stats[0].files == 1
+    assert stats[0].bytes_per_second == 200.0
+    assert stats[1].bytes_per_second == 5000.0
+    history.close()
+
+
+def test_failing_files_counts_failed_sessions(tmp_path):
+    history = _history(tmp_path)
+    for error in ("first", "second", "third"):
+        session = history.start_session("/src", "folder")
+        session.record_file(Path("/src/bad.xlsx"), "error", error=error)
+    session.record_file(Path("/src/once.csv"), "error", error="once")
+    session.record_file(Path("/src/once.csv"), "error", error="retried")
+    session.record_file(Path("/src/ok.csv"), "success")
+
+    [failing] = history.failing_files(min_failures=2)
+    assert failing.path == str(Path("/src/bad.xlsx"))
+    assert failing.failures == 3
+    assert failing.last_error == "third"
+    history.close()
+
+
+def test_retention_prunes_old_sessions_with_their_files(tmp_path):
+    history = _history(tmp_path)
+    old = time.time() - 400 * 86400
+    with patch("knowledgeimporter.utils.upload_history.time.time", return_value=old):
+        history.start_session("/src", "folder").record_file(Path("old.csv"), "error")
+    history.start_session("/src", "folder").record_file(Path("new.csv"), "error")
+    history.close()
+
+    history = UploadHistory(tmp_path / "history.sqlite3")  # retention from the AppConfig default
+    assert AppConfig().history_retention_days < 400
+    assert len(history.recent_sessions()) == 1
+    assert [f.path for f in history.failing_files(min_failures=1, days=1000)] == ["new.csv"]
+    history.close()
+
+
+def test_compact_vacuums_only_when_much_space_is_free(tmp_path):
+    history = _history(tmp_path)
+    session = history.start_session("/src", "folder")
+    assert not history.compact()
+    for i in range(2000):
+        session.record_file(Path(f"file_{i}.csv"), "error", error="x" * 200)
+    assert history.prune(retention_days=-1) == 1
+    assert history.compact()
+    assert history.compact(force=True)
+    history.close()
+
+
+def test_record_failure_does_not_raise(tmp_path):
+    history = _history(tmp_path)
+    session = history.start_session("/src", "folder")
+    history.close()
+    session.record_file(Path("a.csv"), "success")
+    session.finish({})
@@ -4,11 +4,13 @@ import time
 from unittest.mock import patch
 
 from knowledgeimporter.utils.upload_logger import (
+    UploadLogWriter,
     append_log,
     cleanup_old_logs,
     create_upload_log,
     finalize_log,
     get_latest_log,
+    trace_path,
 )
 
 
@@ -85,6 +87,19 @@ class TestCleanupOldLogs:
             assert deleted == 1
             assert not old_log.exists()
 
+    def test_deletes_old_traces(self, tmp_path):
+        with patch("knowledgeimporter.utils.upload_logger.LOG_DIR", tmp_path):
+            old_trace = trace_path(tmp_path / "upload_20240101_120000.log")
+            old_trace.write_text("{}", encoding="utf-8")
+            old_time = time.time() - (30 * 86400)
+            import os
+
+            os.utime(old_trace, (old_time, old_time))
+
+            assert old_trace.name == "upload_20240101_120000.trace.json"
+            assert cleanup_old_logs(retention_days=7) == 1
+            assert not old_trace.exists()
+
     def test_keeps_recent_logs(self, tmp_path):
         with patch("knowledgeimporter.utils.upload_logger.LOG_DIR", tmp_path):
             recent_log = tmp_path / "upload_20260225_120000.log"
@@ -110,3 +125,76 @@ class TestGetLatestLog:
     def test_returns_none_when_empty(self, tmp_path):
         with patch("knowledgeimporter.utils.upload_logger.LOG_DIR", tmp_path):
             assert get_latest_log() is None
+
+
+class TestUploadLogWriter:
+    def test_preserves_format_and_order_across_threads(self, tmp_path):
+        import re
+        import threading
+
+        log_file = tmp_path / "upload.log"
+        log_file.write_text("# header\n", encoding="utf-8")
+        writer = UploadLogWriter(log_file, flush_interval=0.01)
+
+        def produce(n):
+            for i in range(200):
+                writer.write(f"[OK]     t{n}-{i:03d}.md")
+
+        threads = [threading.Thread(target=produce, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.finalize({"total": 800, "success": 800})
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "# header"
+        entries = [line for line in lines if line.startswith("[")]
+        assert len(entries) == 800
+        assert all(re.fullmatch(r"\[\d\d:\d\d:\d\d\] \[OK\]     t\d-\d{3}\.md", e) for e in entries)
+        # Each producer's lines stay in order
+        t0 = [e[-9:] for e in entries if "] [OK]     t0-" in e]
+        assert t0 == sorted(t0)
+        assert any(line.startswith("# Total: 800") for line in lines)
+
+    def test_flush_makes_messages_visible(self, tmp_path):
+        log_file = tmp_path / "upload.log"
+        writer = UploadLogWriter(log_file, flush_interval=60)
+        writer.write("[CONV]   a.csv")
+        writer.flush()
+        assert "[CONV]   a.csv" in log_file.read_text(encoding="utf-8")
+        writer.close()
+
+    def test_write_after_close_appends_directly(self, tmp_path):
+        log_file = tmp_path / "upload.log"
+        writer = UploadLogWriter(log_file)
+        writer.close()
+        writer.write("[CANCELLED] late")
+        writer.flush()
+        assert "[CANCELLED] late" in log_file.read_text(encoding="utf-8")
+
+    def test_rotates_by_size(self, tmp_path):
+        log_file = tmp_path / "upload_20260101_120000.log"
+        log_file.write_text("# header\n", encoding="utf-8")
+        writer = UploadLogWriter(log_file, max_bytes=200, backups=2)
+        for i in range(30):
+            writer.write(f"[OK]     file{i:02d}.md")
+            writer.flush()
+        writer.close()
+
+        rotated = sorted(p.name for p in tmp_path.iterdir())
+        assert rotated == [log_file.name, log_file.name + ".1", log_file.name + ".2"]
+        assert log_file.stat().st_size <= 200
+        current = log_file.read_text(encoding="utf-8")
+        assert current.startswith("# KnowledgeImporter Upload Log (continued)")
+        assert "file29.md" in current
+
+    def test_cleanup_removes_rotated_logs(self, tmp_path):
+        with patch("knowledgeimporter.utils.upload_logger.LOG_DIR", tmp_path):
+            rotated = tmp_path / "upload_20240101_120000.log.1"
+            rotated.write_text("old", encoding="utf-8")
+            old_time = time.time() - (30 * 86400)
+            import os
+
+            os.utime(rotated, (old_time, old_time))
+            assert cleanup_old_logs(retention_days=7) == 1
@@ -0,0 +1,39 @@
+"""Tests for the upload manifest used to skip unchanged files."""
+
+from knowledgeimporter.utils.upload_manifest import UploadManifest
+
+
+def test_unchanged_requires_same_fingerprint_and_existing_uploads(tmp_path):
+    manifest = UploadManifest(tmp_path / "uploads.json")
+    manifest.record("folder", "a.csv", "sha256:1", ["a_teil1.md", "a_teil2.md"])
+    existing = {"a_teil1.md": "id1", "a_teil2.md": "id2"}
+    assert manifest.unchanged("folder", "a.csv", "sha256:1", existing)
+    assert not manifest.unchanged("folder", "a.csv", "sha256:2", existing)
+    assert not manifest.unchanged("other", "a.csv", "sha256:1", existing)
+    assert not manifest.unchanged("folder", "a.csv", "sha256:1", {"a_teil1.md": "id1"})
+
+
+def test_names_recorded_without_fingerprint_never_unchanged(tmp_path):
+    manifest = UploadManifest(tmp_path / "uploads.json")
+    manifest.record("folder", "a.csv", "", ["a_teil1.md"])
+    assert manifest.names("folder", "a.csv") == ["a_teil1.md"]
+    assert manifest.names("folder", "b.csv") == []
+    assert not manifest.unchanged("folder", "a.csv", "", {"a_teil1.md": "id1"})
+
+
+def test_save_and_reload(tmp_path):
+    path = tmp_path / "uploads.json"
+    manifest = UploadManifest(path)
+    manifest.record("folder", "a.md", "sha256:1", ["a.md"])
+    manifest.save()
+    assert UploadManifest(path).unchanged("folder", "a.md", "sha256:1", {"a.md"})
+
+    manifest.forget("folder", "a.md")
+    manifest.save()
+    assert not UploadManifest(path).unchanged("folder", "a.md", "sha256:1", {"a.md"})
+
+
+def test_corrupt_manifest_starts_empty(tmp_path):
+    path = tmp_path / "uploads.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert not UploadManifest(path).unchanged("folder", "a.md", "sha256:1", {"a.md"})
@@ -0,0 +1,43 @@
+"""Tests for the per-file upload results model."""
+
+from knowledgeimporter.models.upload_results import FileResult, UploadResults
+
+
+def _result(i: int, status: str = "success", error: str | None = None) -> FileResult:
+    return FileResult(f"/src/dir/file_{i}.csv", f"file_{i}.csv", status, size=i, error=error)
+
+
+def test_window_of_all_results():
+    results = UploadResults()
+    for i in range(100):
+        results.add(_result(i))
+    assert len(results) == results.total == 100
+    assert [r.name for r in results.window(95, 10)] == [f"file_{i}.csv" for i in range(95, 100)]
+    assert results.window(200, 10) == []
+
+
+def test_failed_only_and_search():
+    results = UploadResults()
+    for i in range(50):
+        results.add(_result(i, "error" if i % 10 == 0 else "success", "Timeout" if i % 10 == 0 else None))
+    results.set_filter(failed_only=True)
+    assert len(results) == results.failed == 5
+
+    results.set_filter(query=" TIMEOUT ")
+    assert len(results) == 5
+    results.set_filter(failed_only=False, query="file_4")
+    assert [r.name for r in results.window(0, 20)] == ["file_4.csv", *(f"file_{i}.csv" for i in range(40, 50))]
+    results.set_filter(query="/src/dir/")
+    assert len(results) == 50
+
+
+def test_added_results_follow_the_filter():
+    results = UploadResults()
+    results.set_filter(failed_only=True)
+    results.add(_result(1))
+    results.add(_result(2, "error", "boom"))
+    assert [r.name for r in results.window(0, 10)] == ["file_2.csv"]
+    assert results.total == 2
+
+    results.clear()
+    assert len(results) == results.total == results.failed == 0
@@ -287,7 +287,21 @@ class TestUploadBatchWithConversion:
         "eq_chatbot_core.providers.langdock_provider": MagicMock(),
     }
 
-    def _run_batch_with_mocks(self, tmp_path, mock_conv_setup, patterns, replace=False, on_progress=None):
+    def _run_batch_with_mocks(
+        self,
+        tmp_path,
+        mock_conv_setup,
+        patterns,
+        replace=False,
+        on_progress=None,
+        conversion_options=None,
+        tracer=None,
+        manifest=None,
+        history=None,
+        profiler=None,
+        on_result=None,
+        skip_unchanged=True,
+    ):
         """Run upload_batch with mocked KnowledgeManager and ConversionService."""
         mock_km = MagicMock()
         mock_km.list_files.return_value = []
@@ -315,6 +329,13 @@ class TestUploadBatchWithConversion:
                     patterns=patterns,
                     replace=replace,
                     on_progress=on_progress,
+                    conversion_options=conversion_options,
+                    tracer=tracer,
+                    manifest=manifest,
+                    history=history,
+                    profiler=profiler,
+                    on_result=on_result,
+                    skip_unchanged=skip_unchanged,
                 )
 
         return result, mock_km, mock_conv
@@ -404,3 +425,261 @@ class TestUploadBatchWithConversion:
         assert result["success"] == 1
         # Should have deleted the existing .md file
         mock_km.delete_file.assert_called_once_with("folder-123", "existing-id")
+
+    def test_split_parts_uploaded_and_stale_parts_replaced(self, tmp_path):
+        """Split documents upload every part; replace mode removes the parts recorded for the source."""
+        from knowledgeimporter.converters.base import ConversionOptions
+        from knowledgeimporter.utils.upload_manifest import UploadManifest
+
+        manifest = UploadManifest(tmp_path / "uploads.json")
+        manifest.record("folder-123", "big.csv", "", ["big_teil1.md", "big_teil2.md", "big_teil3.md"])
+
+        (tmp_path / "big.csv").write_text("a\n1\n", encoding="utf-8")
+        parts = [tmp_path / f"big_teil{i}.md" for i in (1, 2)]
+        for p in parts:
+            p.write_text("# part", encoding="utf-8")
+
+        def setup(mock_conv, mock_km):
+            mock_conv.needs_conversion.return_value = True
+            mock_conv.convert_file.return_value = tmp_path / "big.md"
+            mock_conv.split_output.return_value = parts
+            mock_km.list_files.return_value = [
+                {"id": "old-1", "name": "big_teil1.md"},
+                {"id": "old-3", "name": "big_teil3.md"},
+                {"id": "other", "name": "bigger.md"},
+            ]
+
+        result, mock_km, mock_conv = self._run_batch_with_mocks(
+            tmp_path,
+            setup,
+            patterns=["*.csv"],
+            replace=True,
+            conversion_options=ConversionOptions(max_part_sections=1),
+            manifest=manifest,
+            skip_unchanged=False,
+        )
+
+        assert result["success"] == 1
+        deleted = {c.args[1] for c in mock_km.delete_file.call_args_list}
+        assert deleted == {"old-1", "old-3"}
+        uploaded = sorted(c.kwargs["filename"] for c in mock_km.upload_file.call_args_list)
+        assert uploaded == ["big_teil1.md", "big_teil2.md"]
+        assert manifest.names("folder-123", "big.csv") == uploaded
+        mock_conv.fingerprint.assert_not_called()
+
+    def test_replace_keeps_part_like_files_of_other_sources(self, tmp_path):
+        """A converted source only replaces its own uploads, not e.g. the upload of Artikel_teil1.csv."""
+        (tmp_path / "Artikel.csv").write_text("a\n1\n", encoding="utf-8")
+        (tmp_path / "Artikel.md").write_text("# Artikel", encoding="utf-8")
+
+        def setup(mock_conv, mock_km):
+            mock_conv.needs_conversion.return_value = True
+            mock_conv.convert_file.return_value = tmp_path / "Artikel.md"
+            mock_km.list_files.return_value = [
+                {"id": "old", "name": "Artikel.md"},
+                {"id": "foreign", "name": "Artikel_teil1.md"},
+            ]
+
+        result, mock_km, _ = self._run_batch_with_mocks(tmp_path, setup, patterns=["*.csv"], replace=True)
+
+        assert result["success"] == 1
+        mock_km.delete_file.assert_called_once_with("folder-123", "old")
+
+    def test_tracer_records_stages_per_file(self, tmp_path):
+        """With a tracer, listing, deleting and uploading are recorded as spans with byte counts."""
+        from knowledgeimporter.utils.tracing import Tracer
+
+        (tmp_path / "doc.md").write_text("# Doc", encoding="utf-8")
+
+        def setup(mock_conv, mock_km):
+            mock_conv.needs_conversion.return_value = False
+            mock_km.list_files.return_value = [{"id": "old", "name": "doc.md"}]
+
+        tracer = Tracer()
+        result, _, _ = self._run_batch_with_mocks(tmp_path, setup, patterns=["*.md"], replace=True, tracer=tracer)
+
+        assert result["success"] == 1
+        assert [s.name for s in tracer.spans] == ["list", "delete", "upload"]
+        upload = tracer.spans[-1]
+        assert upload.args["file"] == "doc.md"
+        assert upload.args["bytes"] == 5
+        assert set(tracer.breakdown("doc.md")) == {"delete", "upload"}
+
+    def test_unchanged_files_skipped_with_manifest(self, tmp_path):
+        """Files whose fingerprint matches their last upload are neither converted nor uploaded."""
+        from knowledgeimporter.utils.upload_manifest import UploadManifest
+
+        (tmp_path / "same.csv").write_text("a\n1\n", encoding="utf-8")
+        (tmp_path / "new.csv").write_text("a\n2\n", encoding="utf-8")
+        converted_md = tmp_path / "new.md"
+        converted_md.write_text("# new", encoding="utf-8")
+        manifest = UploadManifest(tmp_path / "uploads.json")
+        manifest.record("folder-123", "same.csv", "fp-same.csv", ["same.md"])
+
+        def setup(mock_conv, mock_km):
+            mock_conv.needs_conversion.return_value = True
+            mock_conv.fingerprint.side_effect = lambda p: f"fp-{p.name}"
+            mock_conv.convert_file.return_value = converted_md
+            mock_km.list_files.return_value = [{"id": "old", "name": "same.md"}]
+
+        progress = []
+        result, mock_km, mock_conv = self._run_batch_with_mocks(
+            tmp_path,
+            setup,
+            patterns=["*.csv"],
+            on_progress=lambda c, t, f, s: progress.append((f, s)),
+            manifest=manifest,
+        )
+
+        assert result["unchanged"] == 1
+        assert result["success"] == 1
+        assert ("same.csv", "unchanged") in progress
+        mock_conv.convert_file.assert_called_once_with(tmp_path / "new.csv")
+        assert UploadManifest(tmp_path / "uploads.json").unchanged(
+            "folder-123", "new.csv", "fp-new.csv", {"new.md": "id"}
+        )
+
+    def test_outcomes_recorded_in_history(self, tmp_path):
+        """Each file's status, size and stage durations go to the history session."""
+        from knowledgeimporter.utils.upload_history import UploadHistory
+
+        (tmp_path / "good.csv").write_text("a\n1\n", encoding="utf-8")
+        (tmp_path / "bad.csv").write_text("a\n2\n", encoding="utf-8")
+        converted_md = tmp_path / "good.md"
+        converted_md.write_text("# good", encoding="utf-8")
+
+        def convert(path):
+            if path.name == "bad.csv":
+                raise ConversionError(str(path), "kaputt")
+            return converted_md
+
+        def setup(mock_conv, mock_km):
+            mock_conv.needs_conversion.return_value = True
+            mock_conv.convert_file.side_effect = convert
+
+        history = UploadHistory(tmp_path / "history.sqlite3", retention_days=0)
+        session = history.start_session(str(tmp_path), "folder-123")
+        self._run_batch_with_mocks(tmp_path, setup, patterns=["*.csv"], history=session)
+
+        rows = history._conn.execute(
+            "SELECT name, status, bytes, convert_seconds, upload_seconds, error FROM files ORDER BY name"
+        ).fetchall()
+        history.close()
+        (bad, bad_status, bad_bytes, _, bad_upload, bad_error), good = rows
+        assert (bad, bad_status, bad_bytes, bad_upload) == ("bad.csv", "error", 4, None)
+        assert "kaputt" in bad_error
+        assert good[:3] == ("good.csv", "success", 4)
+        assert good[3] is not None and good[4] is not None
+
+    def test_outcomes_counted_in_metrics(self, tmp_path):
+        """Conversions and uploads are counted per format, with their durations, and reported per file."""
+        from knowledgeimporter.utils import metrics
+
+        (tmp_path / "good.csv").write_text("a\n1\n", encoding="utf-8")
+        (tmp_path / "bad.csv").write_text("a\n2\n", encoding="utf-8")
+        converted_md = tmp_path / "good.md"
+        converted_md.write_text("# good", encoding="utf-8")
+
+        def convert(path):
+            if path.name == "bad.csv":
+                raise ConversionError(str(path), "kaputt")
+            return converted_md
+
+        def setup(mock_conv, mock_km):
+            mock_conv.needs_conversion.return_value = True
+            mock_conv.convert_file.side_effect = convert
+
+        metrics.registry.reset()
+        results = []
+        self._run_batch_with_mocks(tmp_path, setup, patterns=["*.csv"], on_result=results.append)
+
+        assert sorted((r.name, r.status, r.size) for r in results) == [
+            ("bad.csv", "error", 4),
+            ("good.csv", "success", 4),
+        ]
+
+        assert metrics.FILES.get(stage="convert", format=".csv", status="success") == 1
+        assert metrics.FILES.get(stage="convert", format=".csv", status="error") == 1
+        assert metrics.FILES.get(stage="upload", format=".csv", status="success") == 1
+        assert metrics.BYTES.get(stage="convert", format=".csv") == 4
+        assert metrics.BYTES.get(stage="upload", format=".csv") == 6
+        assert metrics.CONVERT_SECONDS.count(format=".csv") == 2
+        assert metrics.UPLOAD_SECONDS.count(format=".csv") == 1
+        assert metrics.QUEUE_DEPTH.get(queue="files") == 0
+
+    def test_batch_profile_written(self, tmp_path):
+        """With a profiler, the batch is profiled into files next to the log."""
+        from knowledgeimporter.utils.profiling import BatchProfiler
+
+        (tmp_path / "doc.md").write_text("# Doc", encoding="utf-8")
+        logs = tmp_path / "logs"
+        logs.mkdir()
+
+        def setup(mock_conv, mock_km):
+            mock_conv.needs_conversion.return_value = False
+
+        profiler = BatchProfiler.for_log(logs / "upload_1.log")
+        result, _, _ = self._run_batch_with_mocks(tmp_path, setup, patterns=["*.md"], profiler=profiler)
+
+        assert result["success"] == 1
+        assert sorted(p.name for p in logs.iterdir()) == ["upload_1.alloc.txt", "upload_1.prof"]
+
+
+class TestRecursiveUpload:
+    """Test uploads from a source tree."""
+
+    def test_recursive_batch_rejects_duplicate_names(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a" / "doc.md").write_text("# A")
+        (tmp_path / "b" / "doc.md").write_text("# B")
+        (tmp_path / "b" / "other.md").write_text("# Other")
+
+        mock_km = MagicMock()
+        mock_km.list_files.return_value = []
+        with patch.dict(
+            "sys.modules",
+            {
+                "eq_chatbot_core": MagicMock(),
+                "eq_chatbot_core.providers": MagicMock(),
+                "eq_chatbot_core.providers.langdock_provider": MagicMock(),
+            },
+        ):
+            from knowledgeimporter.services.upload_service import UploadService
+
+            svc = UploadService.__new__(UploadService)
+            svc._km = mock_km
+            svc._cancelled = False
+            result = svc.upload_batch(str(tmp_path), "folder-123", ["*.md"], replace=False, recursive=True)
+
+        assert result["total"] == 3
+        assert result["success"] == 2
+        assert result["failed"] == 1
+        assert result["errors"][0]["error"] == "Duplicate file name in source tree"
+
+    def test_batch_uses_snapshot_listing(self, tmp_path):
+        from knowledgeimporter.services.snapshot import SourceSnapshot
+
+        (tmp_path / "a.md").write_text("# A")
+        snapshot = SourceSnapshot(tmp_path)
+        # Added after the snapshot: not part of this batch
+        (tmp_path / "b.md").write_text("# B")
+
+        mock_km = MagicMock()
+        with patch.dict(
+            "sys.modules",
+            {
+                "eq_chatbot_core": MagicMock(),
+                "eq_chatbot_core.providers": MagicMock(),
+                "eq_chatbot_core.providers.langdock_provider": MagicMock(),
+            },
+        ):
+            from knowledgeimporter.services.upload_service import UploadService
+
+            svc = UploadService.__new__(UploadService)
+            svc._km = mock_km
+            svc._cancelled = False
+            result = svc.upload_batch(str(tmp_path), "folder-123", ["*.md"], replace=False, snapshot=snapshot)
+
+        assert result["total"] == 1
+        mock_km.upload_file.assert_called_once()